@@ -3,14 +3,20 @@ import pandas as pd
 import os
 from datetime import datetime
 import io
+import csv
+from concurrent.futures import ThreadPoolExecutor
 
 # Import custom modules
-from database import DatabaseManager
+from database import DatabaseManager, DuplicateEmailError
 from document_parser import DocumentParser
 from file_storage import FileStorageManager
+from ingest_pipeline import IngestPipeline
+from groq_processor import purge_cached_text
 from nlp_processor import NLPProcessor
 from matching_engine import MatchingEngine
-from utils import validate_email, validate_phone
+from utils import validate_email, validate_phone, compute_content_hash, setup_logging
+
+setup_logging()
 
 # Initialize components
 @st.cache_resource
@@ -23,6 +29,38 @@ def init_components():
     matching_engine = MatchingEngine()
     return db_manager, document_parser, file_storage, nlp_processor, matching_engine
 
+@st.cache_resource
+def get_ingest_pipeline():
+    """Batch ingest pipeline sharing the application components"""
+    return IngestPipeline(db_manager, document_parser, file_storage, nlp_processor, matching_engine)
+
+@st.cache_resource
+def get_executor():
+    """Shared worker pool for resume processing off the script thread"""
+    return ThreadPoolExecutor(max_workers=os.cpu_count())
+
+# Cached candidate reads, cleared after every write
+@st.cache_data(ttl=30)
+def load_candidates(status=None, order_by='created_at', descending=True):
+    """Load candidate summaries filtered and sorted in SQL, reusing the result across reruns"""
+    return db_manager.get_candidates_summary(status=status, order_by=order_by, descending=descending)
+
+@st.cache_data(ttl=30)
+def load_candidates_df():
+    """Build the candidate DataFrame once; filters are applied to the cached frame"""
+    return pd.DataFrame(db_manager.get_candidates_summary())
+
+@st.cache_data(ttl=30)
+def load_status_counts():
+    """Load per-status candidate counts, reusing the result across reruns"""
+    return db_manager.get_status_counts()
+
+def clear_candidate_cache():
+    """Invalidate cached candidate reads after a write"""
+    load_candidates.clear()
+    load_candidates_df.clear()
+    load_status_counts.clear()
+
 # Page configuration
 st.set_page_config(
     page_title="Resume Shortlisting System",
@@ -87,36 +125,56 @@ if page == "Candidate Registration":
                 for error in errors:
                     st.error(error)
             else:
-                # Check if email already exists
-                if db_manager.email_exists(email):
-                    st.error("An application with this email already exists!")
-                else:
-                    try:
-                        # Process document
-                        with st.spinner("Processing your resume..."):
-                            file_content = uploaded_file.read()
-                            filename = uploaded_file.name
+                try:
+                    # Process document
+                    with st.spinner("Processing your resume..."):
+                        file_content = uploaded_file.read()
+                        filename = uploaded_file.name
+                        content_hash = compute_content_hash(file_content)
+                        
+                        # Validate and extract in one pass; the text is extracted only once
+                        parsed = document_parser.parse_all(
+                            file_content, filename, content_hash, include_metadata=False
+                        )
+                        validation = parsed['validation']
+                        if not validation['is_valid']:
+                            st.error(f"Invalid document: {'; '.join(validation['messages'])}")
+                        else:
+                            # Extract text from document
+                            resume_text = parsed['text']
                             
-                            # Validate document
-                            validation = document_parser.validate_document(file_content, filename)
-                            if not validation['is_valid']:
-                                st.error(f"Invalid document: {'; '.join(validation['messages'])}")
+                            if not resume_text.strip():
+                                st.error("Could not extract text from the document. Please ensure it contains readable text.")
                             else:
-                                # Extract text from document
-                                resume_text = document_parser.extract_text_from_file(file_content, filename)
+                                # Sparse PDF text layers are cleaned up with Groq in the background
+                                enhance_future = None
+                                if document_parser.needs_enhancement(resume_text, filename):
+                                    enhance_future = document_parser.enhance_text_async(resume_text)
                                 
-                                if not resume_text.strip():
-                                    st.error("Could not extract text from the document. Please ensure it contains readable text.")
-                                else:
-                                    # Store file in storage system
-                                    file_info = file_storage.store_resume_file(
-                                        file_content, filename, 0  # Temporary candidate_id
+                                # Process with NLP in the background while the file is stored,
+                                # unless it has to wait for the enhanced text
+                                entities_future = None
+                                if enhance_future is None:
+                                    entities_future = get_executor().submit(
+                                        nlp_processor.extract_entities, resume_text
                                     )
-                                    
-                                    # Process with NLP
-                                    education_data, skills_data = nlp_processor.extract_entities(resume_text)
-                                    
-                                    # Store in database
+                                
+                                # Store file in storage system
+                                file_info = file_storage.store_resume_file(
+                                    file_content, filename, 0,  # Temporary candidate_id
+                                    file_hash=content_hash
+                                )
+                                
+                                if entities_future is not None:
+                                    education_data, skills_data = entities_future.result()
+                                else:
+                                    # Entities come from the enhanced text that is stored and vectorized,
+                                    # reusing those parsed by the enhancement request when it returned any
+                                    resume_text, entities = enhance_future.result()
+                                    education_data, skills_data = entities or nlp_processor.extract_entities(resume_text)
+                                
+                                # Store in database; duplicate emails are rejected atomically
+                                try:
                                     candidate_id = db_manager.add_candidate(
                                         full_name=full_name,
                                         email=email,
@@ -126,49 +184,65 @@ if page == "Candidate Registration":
                                         resume_text=resume_text,
                                         education_data=education_data,
                                         skills_data=skills_data,
-                                        file_info=file_info
+                                        file_info=file_info,
+                                        resume_hash=content_hash
                                     )
-                                    
-                                    # Update file with actual candidate_id
-                                    file_info['candidate_id'] = candidate_id
+                                except DuplicateEmailError:
+                                    file_storage.delete_file(file_info['relative_path'])
+                                    raise
                                 
-                                st.success(f"✅ Application submitted successfully! Candidate ID: {candidate_id}")
-                                st.info("Your application is now pending review. You will be contacted if shortlisted.")
+                                clear_candidate_cache()
                                 
-                                # Show extracted information
-                                with st.expander("View Extracted Information"):
-                                    col1, col2 = st.columns(2)
-                                    with col1:
-                                        st.subheader("Education")
-                                        if education_data:
-                                            for edu in education_data:
-                                                st.write(f"• {edu.get('degree', 'N/A')} - {edu.get('institution', 'N/A')}")
-                                        else:
-                                            st.write("No education information detected")
-                                    
-                                    with col2:
-                                        st.subheader("Skills")
-                                        if skills_data:
-                                            for skill in skills_data:
-                                                st.write(f"• {skill.get('skill', 'N/A')}")
-                                        else:
-                                            st.write("No skills detected")
+                                # Store the resume vector once for later matching runs
+                                db_manager.save_candidate_vectors(
+                                    [(candidate_id, matching_engine.build_resume_vector(resume_text))],
+                                    matching_engine.VECTOR_VERSION
+                                )
                                 
-                    except Exception as e:
-                        st.error(f"Error processing application: {str(e)}")
+                                # Update file with actual candidate_id
+                                file_info['candidate_id'] = candidate_id
+                            
+                            st.success(f"✅ Application submitted successfully! Candidate ID: {candidate_id}")
+                            st.info("Your application is now pending review. You will be contacted if shortlisted.")
+                            
+                            # Show extracted information
+                            with st.expander("View Extracted Information"):
+                                col1, col2 = st.columns(2)
+                                with col1:
+                                    st.subheader("Education")
+                                    if education_data:
+                                        for edu in education_data:
+                                            st.write(f"• {edu.get('degree', 'N/A')} - {edu.get('institution', 'N/A')}")
+                                    else:
+                                        st.write("No education information detected")
+                                
+                                with col2:
+                                    st.subheader("Skills")
+                                    if skills_data:
+                                        for skill in skills_data:
+                                            st.write(f"• {skill.get('skill', 'N/A')}")
+                                    else:
+                                        st.write("No skills detected")
+                            
+                except DuplicateEmailError:
+                    st.error("An application with this email already exists!")
+                except Exception as e:
+                    st.error(f"Error processing application: {str(e)}")
 
 elif page == "Admin Panel":
     st.title("🔧 Admin Control Panel")
     
-    tab1, tab2, tab3, tab4 = st.tabs(["Matching & Shortlisting", "Candidate Management", "Export Data", "File Storage"])
+    tab1, tab2, tab3, tab4, tab5 = st.tabs(
+        ["Matching & Shortlisting", "Candidate Management", "Export Data", "File Storage", "Bulk Import"]
+    )
     
     with tab1:
         st.subheader("Automatic Candidate Matching")
         
-        # Threshold configuration
+        # Threshold configuration, read once per render
+        current_threshold = matching_engine.get_threshold()
         col1, col2 = st.columns([2, 1])
         with col1:
-            current_threshold = matching_engine.get_threshold()
             new_threshold = st.slider(
                 "Matching Threshold", 
                 min_value=0.1, 
@@ -177,12 +251,19 @@ elif page == "Admin Panel":
                 step=0.05,
                 help="Lower values = more candidates shortlisted, Higher values = stricter matching"
             )
-            if new_threshold != current_threshold:
-                matching_engine.set_threshold(new_threshold)
-                st.success(f"✅ Threshold updated to {new_threshold:.2f}")
+            # Persist only on an explicit save of a meaningfully different value
+            last_persisted = st.session_state.get('threshold_last_persisted', current_threshold)
+            if abs(new_threshold - last_persisted) >= 0.01:
+                if st.button("Save threshold"):
+                    matching_engine.set_threshold(new_threshold)
+                    st.session_state['threshold_last_persisted'] = new_threshold
+                    current_threshold = new_threshold
+                    st.success(f"✅ Threshold updated to {new_threshold:.2f}")
+                else:
+                    st.caption("Unsaved threshold change; matching uses the saved value.")
         
         with col2:
-            st.metric("Current Threshold", f"{matching_engine.get_threshold():.2f}")
+            st.metric("Current Threshold", f"{current_threshold:.2f}")
         
         # Get job requirements
         job_requirements = db_manager.get_job_requirements()
@@ -203,27 +284,43 @@ elif page == "Admin Panel":
                         else:
                             # Run matching for each candidate
                             results = []
-                            threshold = matching_engine.get_threshold()
+                            # Candidate IDs grouped by their new status
+                            ids_by_status = {'shortlisted': [], 'rejected': []}
+                            threshold = current_threshold
                             
                             st.info(f"🔍 Processing {len(candidates)} candidates with threshold: {threshold:.2f}")
                             
+                            # Prepare the job description once for the whole run
+                            jd_vec = matching_engine.prepare_jd(job_requirements['description'])
+                            
+                            # Reuse stored resume vectors, building any that are missing
+                            vector_version = matching_engine.VECTOR_VERSION
+                            stored_vectors = db_manager.get_candidate_vectors(vector_version, status='pending')
+                            resume_vectors = []
+                            new_vectors = []
                             for candidate in candidates:
-                                similarity_score = matching_engine.calculate_similarity(
-                                    candidate['resume_text'],
-                                    job_requirements['description']
-                                )
+                                vector = stored_vectors.get(candidate['id'])
+                                if vector is None:
+                                    vector = matching_engine.build_resume_vector(candidate['resume_text'])
+                                    new_vectors.append((candidate['id'], vector))
+                                resume_vectors.append(vector)
+                            db_manager.save_candidate_vectors(new_vectors, vector_version)
+                            
+                            # Score and analyze all resumes in a single TF-IDF pass
+                            analyses = matching_engine.batch_match_analysis(
+                                [candidate['resume_text'] for candidate in candidates],
+                                job_requirements['description'],
+                                jd_vec,
+                                resume_vectors
+                            )
+                            
+                            for candidate, analysis in zip(candidates, analyses):
+                                similarity_score = analysis['similarity_score']
                                 
                                 # Determine status based on updated threshold
                                 new_status = 'shortlisted' if similarity_score >= threshold else 'rejected'
                                 
-                                # Update candidate status
-                                db_manager.update_candidate_status(candidate['id'], new_status)
-                                
-                                # Get detailed analysis for better insights
-                                analysis = matching_engine.detailed_match_analysis(
-                                    candidate['resume_text'],
-                                    job_requirements['description']
-                                )
+                                ids_by_status[new_status].append(candidate['id'])
                                 
                                 results.append({
                                     'Candidate': candidate['full_name'],
@@ -234,6 +331,11 @@ elif page == "Admin Panel":
                                     'Common Skills': ', '.join(analysis.get('common_terms', [])[:3])
                                 })
                             
+                            # Persist the status changes, one set-based update per status
+                            for new_status, candidate_ids in ids_by_status.items():
+                                db_manager.update_candidate_statuses(candidate_ids, new_status)
+                            clear_candidate_cache()
+                            
                             st.success(f"✅ Processed {len(results)} candidates")
                             
                             # Display results
@@ -248,35 +350,59 @@ elif page == "Admin Panel":
         st.subheader("Candidate Management")
         
         # Get all candidates
-        all_candidates = db_manager.get_all_candidates()
+        all_candidates_df = load_candidates_df()
         
-        if not all_candidates:
+        if all_candidates_df.empty:
             st.info("No candidates in the system")
         else:
-            # Display candidates table
-            df_candidates = pd.DataFrame(all_candidates)
-            
-            # Status filter
-            status_filter = st.selectbox(
-                "Filter by Status",
-                ["All", "pending", "shortlisted", "rejected"]
-            )
+            # Status filter, applied on submit
+            with st.form("management_filters"):
+                status_filter = st.selectbox(
+                    "Filter by Status",
+                    ["All", "pending", "shortlisted", "rejected"]
+                )
+                st.form_submit_button("Apply")
             
+            # Display candidates table
             if status_filter != "All":
-                df_candidates = df_candidates[df_candidates['status'] == status_filter]
+                df_candidates = all_candidates_df.loc[all_candidates_df['status'].eq(status_filter)]
+            else:
+                df_candidates = all_candidates_df
             
             st.dataframe(df_candidates, use_container_width=True)
             
+            # Re-run entity extraction for pending candidates in one batch
+            if st.button("🔄 Re-extract Entities for Pending Candidates"):
+                with st.spinner("Re-extracting education and skills..."):
+                    try:
+                        # Candidates without resume text have nothing to extract from
+                        pending_candidates = [
+                            candidate for candidate in db_manager.get_candidates_by_status('pending')
+                            if candidate['resume_text'] and candidate['resume_text'].strip()
+                        ]
+                        entities = nlp_processor.extract_entities_batch(
+                            [candidate['resume_text'] for candidate in pending_candidates]
+                        )
+                        
+                        for candidate, (education_data, skills_data) in zip(pending_candidates, entities):
+                            db_manager.replace_candidate_entities(candidate['id'], education_data, skills_data)
+                        
+                        st.success(f"✅ Re-extracted entities for {len(pending_candidates)} candidates")
+                    except Exception as e:
+                        st.error(f"Error re-extracting entities: {str(e)}")
+            
             # Candidate operations
             st.subheader("Candidate Operations")
             
             # Select candidate for operations
-            candidate_options = [f"{c['full_name']} ({c['email']})" for c in all_candidates]
-            selected_candidate = st.selectbox("Select Candidate", candidate_options)
+            candidate_options = {
+                f"{name} ({email})": int(cid)
+                for cid, name, email in zip(all_candidates_df['id'], all_candidates_df['full_name'], all_candidates_df['email'])
+            }
+            selected_candidate = st.selectbox("Select Candidate", list(candidate_options))
             
             if selected_candidate:
-                selected_candidate_data = all_candidates[candidate_options.index(selected_candidate)]
-                candidate_id = selected_candidate_data['id']
+                candidate_id = candidate_options[selected_candidate]
                 
                 col1, col2, col3 = st.columns(3)
                 
@@ -286,6 +412,7 @@ elif page == "Admin Panel":
                     new_status = st.selectbox("New Status", ["pending", "shortlisted", "rejected"])
                     if st.button("Update Status"):
                         db_manager.update_candidate_status(candidate_id, new_status)
+                        clear_candidate_cache()
                         st.success("Status updated successfully!")
                         st.rerun()
                 
@@ -304,16 +431,14 @@ elif page == "Admin Panel":
                                 st.write(f"**Status:** {candidate_details['status']}")
                                 
                                 # Show education
-                                if candidate_details.get('education'):
+                                if candidate_details.get('education_display'):
                                     st.write("**Education:**")
-                                    for edu in candidate_details['education']:
-                                        st.write(f"• {edu.get('degree', 'N/A')} - {edu.get('institution', 'N/A')}")
+                                    st.markdown(candidate_details['education_display'].replace("\n", "  \n"))
                                 
                                 # Show skills
-                                if candidate_details.get('skills'):
+                                if candidate_details.get('skills_display'):
                                     st.write("**Skills:**")
-                                    skills_list = [skill.get('skill', 'N/A') for skill in candidate_details['skills']]
-                                    st.write(", ".join(skills_list))
+                                    st.write(candidate_details['skills_display'])
                                 
                                 # Show files
                                 candidate_files = db_manager.get_candidate_files(candidate_id)
@@ -343,7 +468,13 @@ elif page == "Admin Panel":
                         
                         with col_confirm:
                             if st.button("✅ Confirm Delete", key=f"confirm_delete_{candidate_id}", type="primary"):
+                                # Read the resume text first so its cached Groq responses can be purged
+                                candidate_details = db_manager.get_candidate_details(candidate_id)
                                 if db_manager.delete_candidate(candidate_id):
+                                    # Personal data must not outlive the candidate in the Groq response cache
+                                    if candidate_details:
+                                        purge_cached_text(candidate_details['resume_text'])
+                                    clear_candidate_cache()
                                     st.success("Candidate deleted successfully!")
                                     # Reset session state
                                     if delete_key in st.session_state:
@@ -361,22 +492,28 @@ elif page == "Admin Panel":
     with tab3:
         st.subheader("Export Shortlisted Candidates")
         
-        shortlisted = db_manager.get_candidates_by_status('shortlisted')
+        all_candidates_df = load_candidates_df()
+        if all_candidates_df.empty:
+            df_shortlisted = all_candidates_df
+        else:
+            df_shortlisted = all_candidates_df.loc[all_candidates_df['status'].eq('shortlisted')]
         
-        if not shortlisted:
+        if df_shortlisted.empty:
             st.info("No shortlisted candidates to export")
         else:
-            df_shortlisted = pd.DataFrame(shortlisted)
-            
             # Display preview
-            st.write(f"Found {len(shortlisted)} shortlisted candidates:")
+            st.write(f"Found {len(df_shortlisted)} shortlisted candidates:")
             st.dataframe(df_shortlisted, use_container_width=True)
             
             # Export options
             if st.button("📥 Download as CSV"):
-                csv_buffer = io.StringIO()
-                df_shortlisted.to_csv(csv_buffer, index=False)
-                csv_data = csv_buffer.getvalue()
+                # Write rows straight from the database cursor, skipping the DataFrame;
+                # they are encoded as they are written, so only the bytes are buffered
+                csv_bytes = io.BytesIO()
+                csv_buffer = io.TextIOWrapper(csv_bytes, encoding='utf-8', newline='')
+                db_manager.export_candidates_csv(csv_buffer, status='shortlisted')
+                csv_buffer.flush()
+                csv_data = csv_bytes.getvalue()
                 
                 st.download_button(
                     label="Download CSV",
@@ -399,7 +536,9 @@ elif page == "Admin Panel":
         
         # File listing
         st.subheader("Stored Files")
-        file_type_filter = st.selectbox("Filter by File Type", ["All", "PDF", "DOC", "DOCX", "TXT"])
+        with st.form("file_filters"):
+            file_type_filter = st.selectbox("Filter by File Type", ["All", "PDF", "DOC", "DOCX", "TXT"])
+            st.form_submit_button("Apply")
         
         filter_param = None if file_type_filter == "All" else file_type_filter.lower()
         stored_files = file_storage.list_files(filter_param)
@@ -411,23 +550,24 @@ elif page == "Admin Panel":
             # File operations
             st.subheader("File Operations")
             if stored_files:
-                file_options = [f"{f['filename']} ({f['file_type']})" for f in stored_files]
-                selected_file = st.selectbox("Select File for Operations", file_options)
+                file_options = {f"{f['filename']} ({f['file_type']})": f for f in stored_files}
+                selected_file = st.selectbox("Select File for Operations", list(file_options))
                 
                 if selected_file:
-                    selected_file_data = stored_files[file_options.index(selected_file)]
+                    selected_file_data = file_options[selected_file]
                     
                     col1, col2 = st.columns(2)
                     with col1:
                         if st.button("Download File"):
-                            file_content = file_storage.retrieve_file(selected_file_data['relative_path'])
-                            if file_content:
-                                st.download_button(
-                                    label="Download",
-                                    data=file_content,
-                                    file_name=selected_file_data['filename'],
-                                    mime="application/octet-stream"
-                                )
+                            file_handle = file_storage.open_file(selected_file_data['relative_path'])
+                            if file_handle:
+                                with file_handle:
+                                    st.download_button(
+                                        label="Download",
+                                        data=file_handle,
+                                        file_name=selected_file_data['filename'],
+                                        mime="application/octet-stream"
+                                    )
                             else:
                                 st.error("File not found")
                     
@@ -440,43 +580,101 @@ elif page == "Admin Panel":
                                 st.error("Failed to archive file")
         else:
             st.info("No files stored yet")
+    
+    with tab5:
+        st.subheader("Bulk Import")
+        st.write("Import many applications at once from an applicant list and the resumes it names")
+        st.caption("CSV columns: full_name, email, phone, location, experience_years, filename")
+        
+        applicant_list = st.file_uploader("Applicant list", type=['csv'], key="bulk_applicant_list")
+        resume_files = st.file_uploader(
+            "Resumes",
+            type=['pdf', 'doc', 'docx', 'txt'],
+            accept_multiple_files=True,
+            key="bulk_resume_files"
+        )
+        
+        if st.button("Import Applications", disabled=applicant_list is None or not resume_files):
+            files_by_name = {uploaded.name: uploaded for uploaded in resume_files}
+            applications = []
+            results = []
+            
+            # Validate each row like the registration form before it enters the pipeline
+            for row in csv.DictReader(io.StringIO(applicant_list.getvalue().decode('utf-8-sig'))):
+                row = {key: (value or '').strip() for key, value in row.items() if key}
+                filename = row.get('filename', '')
+                if not row.get('full_name'):
+                    error = "Full name is required"
+                elif not validate_email(row.get('email', '')):
+                    error = "Invalid email address"
+                elif not validate_phone(row.get('phone', '')):
+                    error = "Invalid phone number"
+                elif filename not in files_by_name:
+                    error = "Resume file was not uploaded"
+                else:
+                    error = None
+                
+                if error:
+                    results.append({'filename': filename, 'candidate_id': None, 'error': error})
+                    continue
+                
+                experience = row.get('experience_years', '')
+                applications.append({
+                    'full_name': row['full_name'],
+                    'email': row['email'],
+                    'phone': row['phone'],
+                    'location': row.get('location', ''),
+                    'experience_years': int(experience) if experience.isdigit() else 0,
+                    'filename': filename,
+                    'file_content': files_by_name[filename].getvalue()
+                })
+            
+            if applications:
+                with st.spinner(f"Importing {len(applications)} applications..."):
+                    results.extend(get_ingest_pipeline().ingest_batch(applications))
+                clear_candidate_cache()
+            
+            imported = sum(result['candidate_id'] is not None for result in results)
+            st.success(f"✅ Imported {imported} of {len(results)} applications")
+            st.dataframe(pd.DataFrame([{
+                'File': result['filename'],
+                'Candidate ID': result['candidate_id'],
+                'Error': result['error'] or ''
+            } for result in results]), use_container_width=True)
 
 elif page == "View Candidates":
     st.title("👥 View All Candidates")
     
-    # Get all candidates
-    candidates = db_manager.get_all_candidates()
+    # Get candidate counts per status
+    status_counts = load_status_counts()
+    total_candidates = sum(status_counts.values())
     
-    if not candidates:
+    if not total_candidates:
         st.info("No candidates registered yet")
     else:
         # Statistics
         col1, col2, col3, col4 = st.columns(4)
         
-        total_candidates = len(candidates)
-        pending_count = len([c for c in candidates if c['status'] == 'pending'])
-        shortlisted_count = len([c for c in candidates if c['status'] == 'shortlisted'])
-        rejected_count = len([c for c in candidates if c['status'] == 'rejected'])
-        
         col1.metric("Total Candidates", total_candidates)
-        col2.metric("Pending", pending_count)
-        col3.metric("Shortlisted", shortlisted_count)
-        col4.metric("Rejected", rejected_count)
-        
-        # Filters
-        col1, col2 = st.columns(2)
-        with col1:
-            status_filter = st.selectbox("Filter by Status", ["All", "pending", "shortlisted", "rejected"])
-        with col2:
-            sort_by = st.selectbox("Sort by", ["created_at", "full_name", "experience_years"])
+        col2.metric("Pending", status_counts.get('pending', 0))
+        col3.metric("Shortlisted", status_counts.get('shortlisted', 0))
+        col4.metric("Rejected", status_counts.get('rejected', 0))
         
-        # Apply filters
-        filtered_candidates = candidates
-        if status_filter != "All":
-            filtered_candidates = [c for c in filtered_candidates if c['status'] == status_filter]
+        # Filters, applied together on submit
+        with st.form("view_filters"):
+            col1, col2 = st.columns(2)
+            with col1:
+                status_filter = st.selectbox("Filter by Status", ["All", "pending", "shortlisted", "rejected"])
+            with col2:
+                sort_by = st.selectbox("Sort by", ["created_at", "full_name", "experience_years"])
+            st.form_submit_button("Apply")
         
-        # Sort
-        filtered_candidates.sort(key=lambda x: x.get(sort_by, ''), reverse=(sort_by == 'created_at'))
+        # Apply filters and sorting in the database
+        filtered_candidates = load_candidates(
+            None if status_filter == "All" else status_filter,
+            order_by=sort_by,
+            descending=(sort_by == 'created_at')
+        )
         
         # Display candidates
         for candidate in filtered_candidates:
@@ -494,9 +692,9 @@ elif page == "View Candidates":
                     st.write(f"**Applied:** {candidate['created_at']}")
                 
                 # Show resume excerpt
-                if candidate.get('resume_text'):
+                if candidate.get('resume_excerpt'):
                     st.write("**Resume Excerpt:**")
-                    st.text_area("Resume Preview", candidate['resume_text'][:500] + "...", height=100, key=f"resume_{candidate['id']}")
+                    st.text_area("Resume Preview", candidate['resume_excerpt'] + "...", height=100, key=f"resume_{candidate['id']}")
 
 elif page == "Job Requirements":
     st.title("💼 Job Requirements Setup")
@@ -548,6 +746,7 @@ elif page == "Job Requirements":
                         min_experience=min_experience,
                         min_gpa=min_gpa
                     )
+                    clear_candidate_cache()
                     st.success("✅ Job requirements saved successfully!")
                     st.rerun()
                 except Exception as e:
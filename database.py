@@ -1,35 +1,126 @@
 import sqlite3
 import json
+import csv
+import atexit
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import List, Dict, Optional, Any
+from typing import List, Dict, Optional, Any, Tuple, TextIO
+
+# ALTER TABLE ... DROP COLUMN needs SQLite 3.35; older libraries rebuild the table instead
+_HAS_DROP_COLUMN = sqlite3.sqlite_version_info >= (3, 35)
+
+# Column definitions of the candidates table, shared by its creation and rebuild
+_CANDIDATES_COLUMNS = """
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    full_name TEXT NOT NULL,
+    email TEXT UNIQUE NOT NULL,
+    phone TEXT NOT NULL,
+    location TEXT,
+    experience_years INTEGER DEFAULT 0,
+    resume_hash TEXT,
+    skills_display TEXT,
+    education_display TEXT,
+    status TEXT DEFAULT 'pending',
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+"""
+
+class DuplicateEmailError(Exception):
+    """Raised when a candidate with the same email already exists"""
+    pass
 
 class DatabaseManager:
+    # Columns that candidate listings may be sorted by
+    SORTABLE_COLUMNS = {'created_at', 'full_name', 'email', 'experience_years', 'status'}
+    # Row holding the single job posting
+    JOB_REQUIREMENTS_ID = 1
+    
     def __init__(self, db_path: str = "resume_system.db"):
         """Initialize database manager with SQLite connection"""
         self.db_path = db_path
+        # One persistent connection per thread, tracked by thread ID for cleanup
+        self._local = threading.local()
+        self._connections: Dict[int, sqlite3.Connection] = {}
+        self._connections_lock = threading.Lock()
+        # Per-status candidate counts, recomputed lazily after any write that changes them
+        self._status_counts_cache: Optional[Dict[str, int]] = None
+        # File storage used to clean up deleted candidates' files, created on first use
+        self._storage = None
         self.init_database()
+        atexit.register(self._close_all)
+    
+    def _connect(self) -> sqlite3.Connection:
+        """Open a connection with the per-connection PRAGMAs applied"""
+        # Connections are only used by their own thread but may be closed by another
+        conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        conn.row_factory = sqlite3.Row  # C-level name access; dict(row) for plain dicts
+        conn.execute("PRAGMA foreign_keys=ON")  # Required for ON DELETE CASCADE
+        conn.execute("PRAGMA synchronous=NORMAL")  # Safe with WAL, far fewer fsyncs
+        conn.execute("PRAGMA temp_store=MEMORY")
+        conn.execute("PRAGMA cache_size=-64000")  # ~64MB page cache
+        conn.execute("PRAGMA mmap_size=268435456")  # 256MB memory-mapped I/O
+        return conn
+    
+    def _get_conn(self) -> sqlite3.Connection:
+        """Get the calling thread's connection, opening it on first use"""
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = self._connect()
+            self._local.conn = conn
+            
+            with self._connections_lock:
+                # Close connections left behind by threads that have exited
+                live_threads = {thread.ident for thread in threading.enumerate()}
+                for thread_id in [t for t in self._connections if t not in live_threads]:
+                    self._connections.pop(thread_id).close()
+                self._connections[threading.get_ident()] = conn
+        return conn
+    
+    def _close_all(self):
+        """Optimize the database and close every open connection"""
+        self.optimize()
+        with self._connections_lock:
+            for conn in self._connections.values():
+                conn.close()
+            self._connections.clear()
     
     def init_database(self):
         """Initialize database tables with normalized schema"""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._get_conn()
         cursor = conn.cursor()
         
+        # WAL lets readers and the writer run concurrently; the mode persists in the file
+        cursor.execute("PRAGMA journal_mode=WAL")
+        
         # Candidates table
+        cursor.execute(f"CREATE TABLE IF NOT EXISTS candidates ({_CANDIDATES_COLUMNS})")
+        
+        # Columns added after the initial schema
+        self._add_column_if_missing(cursor, 'candidates', 'resume_hash', 'TEXT')
+        self._add_column_if_missing(cursor, 'candidates', 'skills_display', 'TEXT')
+        self._add_column_if_missing(cursor, 'candidates', 'education_display', 'TEXT')
+        
+        # Resume text lives in its own table so candidate listings scan narrow rows
         cursor.execute("""
-            CREATE TABLE IF NOT EXISTS candidates (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                full_name TEXT NOT NULL,
-                email TEXT UNIQUE NOT NULL,
-                phone TEXT NOT NULL,
-                location TEXT,
-                experience_years INTEGER DEFAULT 0,
+            CREATE TABLE IF NOT EXISTS candidate_texts (
+                candidate_id INTEGER PRIMARY KEY,
                 resume_text TEXT,
-                status TEXT DEFAULT 'pending',
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                FOREIGN KEY (candidate_id) REFERENCES candidates (id) ON DELETE CASCADE
             )
         """)
         
+        # Older databases stored the resume text on the candidates row
+        if 'resume_text' in self._table_columns(cursor, 'candidates'):
+            cursor.execute("""
+                INSERT OR IGNORE INTO candidate_texts (candidate_id, resume_text)
+                SELECT id, resume_text FROM candidates
+            """)
+            if _HAS_DROP_COLUMN:
+                cursor.execute("ALTER TABLE candidates DROP COLUMN resume_text")
+            else:
+                self._rebuild_candidates_without(conn, 'resume_text')
+        
         # Education table
         cursor.execute("""
             CREATE TABLE IF NOT EXISTS education (
@@ -69,6 +160,14 @@ class DatabaseManager:
             )
         """)
         
+        # Older databases kept the latest posting under an autoincrement id
+        cursor.execute("""
+            DELETE FROM job_requirements WHERE id != (
+                SELECT id FROM job_requirements ORDER BY created_at DESC, id DESC LIMIT 1
+            )
+        """)
+        cursor.execute("UPDATE job_requirements SET id = ?", (self.JOB_REQUIREMENTS_ID,))
+        
         # File storage table
         cursor.execute("""
             CREATE TABLE IF NOT EXISTS candidate_files (
@@ -85,49 +184,166 @@ class DatabaseManager:
             )
         """)
         
+        # Stored resume vectors reused across matching runs
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS candidate_vectors (
+                candidate_id INTEGER PRIMARY KEY,
+                model_version TEXT NOT NULL,
+                cleaned_text TEXT,
+                term_counts TEXT NOT NULL,
+                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                FOREIGN KEY (candidate_id) REFERENCES candidates (id) ON DELETE CASCADE
+            )
+        """)
+        
+        # Case-insensitive email uniqueness, enforced on insert
+        try:
+            cursor.execute("CREATE UNIQUE INDEX IF NOT EXISTS ix_candidates_email ON candidates (LOWER(email))")
+        except sqlite3.IntegrityError:
+            print("Warning: existing candidates share an email that differs only by case; "
+                  "case-insensitive email index not created")
+        
+        # Index covering status filtering and newest-first ordering in candidate listings;
+        # it supersedes the earlier status-only index
+        cursor.execute("DROP INDEX IF EXISTS ix_candidates_status")
+        cursor.execute(
+            "CREATE INDEX IF NOT EXISTS ix_candidates_status_created ON candidates (status, created_at DESC)"
+        )
+        
+        # Indexes for per-candidate lookups of related rows
+        cursor.execute("CREATE INDEX IF NOT EXISTS ix_education_candidate_id ON education (candidate_id)")
+        cursor.execute("CREATE INDEX IF NOT EXISTS ix_skills_candidate_id ON skills (candidate_id)")
+        cursor.execute("CREATE INDEX IF NOT EXISTS ix_candidate_files_candidate_id ON candidate_files (candidate_id)")
+        
+        # Index for detecting duplicate resume uploads
+        cursor.execute("CREATE INDEX IF NOT EXISTS ix_candidates_resume_hash ON candidates (resume_hash)")
+        
+        conn.commit()
+    
+    def _table_columns(self, cursor, table: str) -> set:
+        """Get the column names of a table"""
+        cursor.execute(f"PRAGMA table_info({table})")
+        return {row[1] for row in cursor.fetchall()}
+    
+    def _rebuild_candidates_without(self, conn: sqlite3.Connection, column: str):
+        """
+        Drop a column from the candidates table by copying it into a new table
+        
+        Used on SQLite versions without ALTER TABLE ... DROP COLUMN. The table's
+        indexes are dropped with it and recreated by init_database.
+        
+        Args:
+            conn: Connection running the migration
+            column: Name of the column to drop
+        """
+        cursor = conn.cursor()
+        kept = ", ".join(
+            row[1] for row in cursor.execute("PRAGMA table_info(candidates)").fetchall() if row[1] != column
+        )
+        row = cursor.execute("SELECT seq FROM sqlite_sequence WHERE name = 'candidates'").fetchone()
+        next_id_floor = row[0] if row else 0
+        
+        # Foreign keys can only be switched off outside a transaction; with them on,
+        # dropping the old table would cascade to every row that references it
         conn.commit()
-        conn.close()
+        cursor.execute("PRAGMA foreign_keys=OFF")
+        try:
+            cursor.execute("BEGIN")
+            cursor.execute(f"CREATE TABLE candidates_rebuilt ({_CANDIDATES_COLUMNS})")
+            cursor.execute(f"INSERT INTO candidates_rebuilt ({kept}) SELECT {kept} FROM candidates")
+            cursor.execute("DROP TABLE candidates")
+            cursor.execute("ALTER TABLE candidates_rebuilt RENAME TO candidates")
+            # Keep ids of deleted candidates from being reused
+            cursor.execute("UPDATE sqlite_sequence SET seq = MAX(seq, ?) WHERE name = 'candidates'",
+                           (next_id_floor,))
+            conn.commit()
+        except sqlite3.Error:
+            conn.rollback()
+            raise
+        finally:
+            cursor.execute("PRAGMA foreign_keys=ON")
+    
+    def _add_column_if_missing(self, cursor, table: str, column: str, definition: str):
+        """Add a column to a table created by an older version of the schema"""
+        if column not in self._table_columns(cursor, table):
+            cursor.execute(f"ALTER TABLE {table} ADD COLUMN {column} {definition}")
+    
+    def _format_skills_display(self, skills_data: List[Dict]) -> str:
+        """Join skill names into the string shown in candidate details"""
+        return ", ".join(skill.get('skill') for skill in skills_data if skill.get('skill'))
+    
+    def _format_education_display(self, education_data: List[Dict]) -> str:
+        """Join education entries into the lines shown in candidate details"""
+        return "\n".join(
+            f"• {edu.get('degree') or 'N/A'} - {edu.get('institution') or 'N/A'}"
+            for edu in education_data
+        )
+    
+    def optimize(self):
+        """Let SQLite refresh query planner statistics, e.g. at shutdown"""
+        try:
+            self._get_conn().execute("PRAGMA optimize")
+        except sqlite3.Error as e:
+            print(f"Error optimizing database: {e}")
+    
+    def _insert_entities(self, cursor, candidate_id: int, education_data: List[Dict],
+                         skills_data: List[Dict]):
+        """Insert education and skills rows, preparing each statement once"""
+        cursor.executemany("""
+            INSERT INTO education (candidate_id, degree, institution, graduation_year, gpa)
+            VALUES (?, ?, ?, ?, ?)
+        """, [(
+            candidate_id,
+            edu.get('degree'),
+            edu.get('institution'),
+            edu.get('graduation_year'),
+            edu.get('gpa')
+        ) for edu in education_data])
+        
+        cursor.executemany("""
+            INSERT INTO skills (candidate_id, skill, proficiency_level)
+            VALUES (?, ?, ?)
+        """, [(
+            candidate_id,
+            skill.get('skill'),
+            skill.get('proficiency_level', 'Intermediate')
+        ) for skill in skills_data])
     
     def add_candidate(self, full_name: str, email: str, phone: str, 
                      location: str, experience_years: int, resume_text: str,
                      education_data: List[Dict], skills_data: List[Dict], 
-                     file_info: Optional[Dict] = None) -> int:
-        """Add a new candidate with education and skills data"""
-        conn = sqlite3.connect(self.db_path)
+                     file_info: Optional[Dict] = None, resume_hash: Optional[str] = None) -> int:
+        """
+        Add a new candidate with education and skills data
+        
+        Raises:
+            DuplicateEmailError: If a candidate with this email already exists
+        """
+        conn = self._get_conn()
         cursor = conn.cursor()
         
-        try:
-            # Insert candidate
+        with conn:
+            # Insert candidate; the unique email index makes the duplicate check atomic
             cursor.execute("""
-                INSERT INTO candidates (full_name, email, phone, location, experience_years, resume_text)
-                VALUES (?, ?, ?, ?, ?, ?)
-            """, (full_name, email, phone, location, experience_years, resume_text))
+                INSERT INTO candidates (full_name, email, phone, location, experience_years,
+                                        resume_hash, skills_display, education_display)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT DO NOTHING
+            """, (full_name, email, phone, location, experience_years, resume_hash,
+                  self._format_skills_display(skills_data),
+                  self._format_education_display(education_data)))
             
+            # No row changed means the email was taken; lastrowid avoids RETURNING (SQLite 3.35+)
+            if cursor.rowcount == 0:
+                raise DuplicateEmailError(f"An application with email {email} already exists")
             candidate_id = cursor.lastrowid
             
-            # Insert education data
-            for edu in education_data:
-                cursor.execute("""
-                    INSERT INTO education (candidate_id, degree, institution, graduation_year, gpa)
-                    VALUES (?, ?, ?, ?, ?)
-                """, (
-                    candidate_id,
-                    edu.get('degree'),
-                    edu.get('institution'),
-                    edu.get('graduation_year'),
-                    edu.get('gpa')
-                ))
+            cursor.execute("""
+                INSERT INTO candidate_texts (candidate_id, resume_text) VALUES (?, ?)
+            """, (candidate_id, resume_text))
             
-            # Insert skills data
-            for skill in skills_data:
-                cursor.execute("""
-                    INSERT INTO skills (candidate_id, skill, proficiency_level)
-                    VALUES (?, ?, ?)
-                """, (
-                    candidate_id,
-                    skill.get('skill'),
-                    skill.get('proficiency_level', 'Intermediate')
-                ))
+            # Insert education and skills data
+            self._insert_entities(cursor, candidate_id, education_data, skills_data)
             
             # Insert file information if provided
             if file_info:
@@ -144,174 +360,361 @@ class DatabaseManager:
                     file_info.get('file_size'),
                     file_info.get('file_hash')
                 ))
+        
+        self._status_counts_cache = None
+        return candidate_id
+    
+    def replace_candidate_entities(self, candidate_id: int, education_data: List[Dict],
+                                   skills_data: List[Dict]):
+        """Replace the stored education and skills of a candidate"""
+        conn = self._get_conn()
+        cursor = conn.cursor()
+        
+        with conn:
+            cursor.execute("DELETE FROM education WHERE candidate_id = ?", (candidate_id,))
+            cursor.execute("DELETE FROM skills WHERE candidate_id = ?", (candidate_id,))
+            cursor.execute("""
+                UPDATE candidates SET skills_display = ?, education_display = ? WHERE id = ?
+            """, (
+                self._format_skills_display(skills_data),
+                self._format_education_display(education_data),
+                candidate_id
+            ))
             
-            conn.commit()
-            return candidate_id
+            self._insert_entities(cursor, candidate_id, education_data, skills_data)
+    
+    def save_candidate_vectors(self, vectors: List[Tuple[int, Dict]], model_version: str):
+        """
+        Store resume vectors for reuse across matching runs
+        
+        Args:
+            vectors: List of (candidate_id, vector) pairs from MatchingEngine.build_resume_vector
+            model_version: Version of the vectorization the vectors were built with
+        """
+        if not vectors:
+            return
+        
+        conn = self._get_conn()
+        cursor = conn.cursor()
+        
+        with conn:
+            cursor.executemany("""
+                INSERT OR REPLACE INTO candidate_vectors 
+                    (candidate_id, model_version, cleaned_text, term_counts)
+                VALUES (?, ?, ?, ?)
+            """, [(
+                candidate_id,
+                model_version,
+                vector['cleaned_text'],
+                json.dumps(vector['term_counts'])
+            ) for candidate_id, vector in vectors])
+    
+    def get_candidate_vectors(self, model_version: str, status: Optional[str] = None) -> Dict[int, Dict]:
+        """
+        Get stored resume vectors built with the given model version
+        
+        Args:
+            model_version: Only return vectors built with this version
+            status: Only return vectors of candidates with this status (all if None)
             
-        except Exception as e:
-            conn.rollback()
-            raise e
-        finally:
-            conn.close()
+        Returns:
+            Dictionary mapping candidate ID to its stored vector
+        """
+        query = """
+            SELECT v.candidate_id, v.cleaned_text, v.term_counts
+            FROM candidate_vectors v
+            JOIN candidates c ON c.id = v.candidate_id
+            WHERE v.model_version = ?
+        """
+        params: List[Any] = [model_version]
+        
+        if status is not None:
+            query += " AND c.status = ?"
+            params.append(status)
+        
+        conn = self._get_conn()
+        cursor = conn.cursor()
+        
+        cursor.execute(query, params)
+        vectors = {
+            candidate_id: {'cleaned_text': cleaned_text or '', 'term_counts': json.loads(term_counts)}
+            for candidate_id, cleaned_text, term_counts in cursor.fetchall()
+        }
+        
+        return vectors
+    
+    def find_candidates_by_resume_hash(self, resume_hash: str) -> List[int]:
+        """Get IDs of candidates who uploaded a resume with the given content hash"""
+        conn = self._get_conn()
+        cursor = conn.cursor()
+        
+        cursor.execute("SELECT id FROM candidates WHERE resume_hash = ?", (resume_hash,))
+        candidate_ids = [row[0] for row in cursor.fetchall()]
+        
+        return candidate_ids
     
     def email_exists(self, email: str) -> bool:
         """Check if email already exists in database"""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._get_conn()
         cursor = conn.cursor()
         
-        cursor.execute("SELECT COUNT(*) FROM candidates WHERE email = ?", (email,))
-        count = cursor.fetchone()[0]
+        # Probe the case-insensitive unique index and stop at the first match
+        cursor.execute("SELECT 1 FROM candidates WHERE LOWER(email) = ? LIMIT 1", (email.lower(),))
+        return cursor.fetchone() is not None
+    
+    def get_candidates(self, status: Optional[str] = None, order_by: str = 'created_at',
+                       descending: bool = True, limit: Optional[int] = None) -> List[Dict]:
+        """
+        Get candidates with filtering and sorting done in SQL
         
-        conn.close()
-        return count > 0
+        Args:
+            status: Only return candidates with this status (all if None)
+            order_by: Column to sort by, one of SORTABLE_COLUMNS
+            descending: Sort in descending order
+            limit: Maximum number of candidates to return
+            
+        Returns:
+            List of candidate dictionaries
+        """
+        return self._query_candidates("t.resume_text", status, order_by, descending, limit)
     
-    def get_all_candidates(self) -> List[Dict]:
-        """Get all candidates with their basic information"""
-        conn = sqlite3.connect(self.db_path)
+    def get_candidates_summary(self, status: Optional[str] = None, order_by: str = 'created_at',
+                               descending: bool = True, limit: Optional[int] = None,
+                               excerpt_length: int = 500) -> List[Dict]:
+        """
+        Get candidates for list views without loading the full resume text
+        
+        Args:
+            status: Only return candidates with this status (all if None)
+            order_by: Column to sort by, one of SORTABLE_COLUMNS
+            descending: Sort in descending order
+            limit: Maximum number of candidates to return
+            excerpt_length: Number of resume characters returned as resume_excerpt
+            
+        Returns:
+            List of candidate dictionaries with a resume_excerpt instead of resume_text
+        """
+        return self._query_candidates(
+            f"substr(t.resume_text, 1, {int(excerpt_length)}) AS resume_excerpt",
+            status, order_by, descending, limit
+        )
+    
+    def _query_candidates(self, text_column: str, status: Optional[str], order_by: str,
+                          descending: bool, limit: Optional[int]) -> List[Dict]:
+        """Run a filtered, sorted candidate listing query"""
+        if order_by not in self.SORTABLE_COLUMNS:
+            raise ValueError(f"Cannot sort candidates by: {order_by}")
+        
+        query = f"""
+            SELECT c.id, c.full_name, c.email, c.phone, c.location, c.experience_years, 
+                   c.status, c.created_at, {text_column}
+            FROM candidates c
+            LEFT JOIN candidate_texts t ON t.candidate_id = c.id
+        """
+        params: List[Any] = []
+        
+        if status is not None:
+            query += " WHERE c.status = ?"
+            params.append(status)
+        
+        query += f" ORDER BY c.{order_by} {'DESC' if descending else 'ASC'}"
+        
+        if limit is not None:
+            query += " LIMIT ?"
+            params.append(limit)
+        
+        conn = self._get_conn()
         cursor = conn.cursor()
         
-        cursor.execute("""
-            SELECT id, full_name, email, phone, location, experience_years, 
-                   status, created_at, resume_text
-            FROM candidates
-            ORDER BY created_at DESC
-        """)
+        cursor.execute(query, params)
         
-        columns = [desc[0] for desc in cursor.description]
-        candidates = [dict(zip(columns, row)) for row in cursor.fetchall()]
+        candidates = [dict(row) for row in cursor.fetchall()]
         
-        conn.close()
         return candidates
     
-    def get_candidates_by_status(self, status: str) -> List[Dict]:
-        """Get candidates filtered by status"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+    def export_candidates_csv(self, output: TextIO, status: Optional[str] = None,
+                              batch_size: int = 500) -> int:
+        """
+        Write candidates as CSV directly from the database cursor
         
-        cursor.execute("""
-            SELECT id, full_name, email, phone, location, experience_years, 
-                   status, created_at, resume_text
-            FROM candidates
-            WHERE status = ?
-            ORDER BY created_at DESC
-        """, (status,))
+        Rows are fetched and written in batches, so no intermediate list or
+        DataFrame of the whole result is built.
+        
+        Args:
+            output: Text file-like object to write CSV into
+            status: Only export candidates with this status (all if None)
+            batch_size: Number of rows fetched per round-trip
+            
+        Returns:
+            Number of candidate rows written
+        """
+        query = """
+            SELECT c.id, c.full_name, c.email, c.phone, c.location, c.experience_years, 
+                   c.status, c.created_at, t.resume_text
+            FROM candidates c
+            LEFT JOIN candidate_texts t ON t.candidate_id = c.id
+        """
+        params: List[Any] = []
         
-        columns = [desc[0] for desc in cursor.description]
-        candidates = [dict(zip(columns, row)) for row in cursor.fetchall()]
+        if status is not None:
+            query += " WHERE c.status = ?"
+            params.append(status)
         
-        conn.close()
-        return candidates
+        query += " ORDER BY c.created_at DESC"
+        
+        conn = self._get_conn()
+        cursor = conn.cursor()
+        
+        try:
+            cursor.execute(query, params)
+            
+            writer = csv.writer(output)
+            writer.writerow([desc[0] for desc in cursor.description])
+            
+            row_count = 0
+            while True:
+                rows = cursor.fetchmany(batch_size)
+                if not rows:
+                    break
+                writer.writerows(rows)
+                row_count += len(rows)
+            
+            return row_count
+        finally:
+            cursor.close()
+    
+    def get_all_candidates(self) -> List[Dict]:
+        """Get all candidates with their basic information"""
+        return self.get_candidates()
+    
+    def get_candidates_by_status(self, status: str) -> List[Dict]:
+        """Get candidates filtered by status"""
+        return self.get_candidates(status=status)
     
     def update_candidate_status(self, candidate_id: int, new_status: str):
         """Update candidate status"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+        self.update_candidate_statuses([candidate_id], new_status)
+    
+    def update_candidate_statuses(self, candidate_ids: List[int], new_status: str,
+                                  batch_size: int = 500):
+        """
+        Set the same status on many candidates in a single transaction
         
-        cursor.execute("""
-            UPDATE candidates 
-            SET status = ?, updated_at = CURRENT_TIMESTAMP
-            WHERE id = ?
-        """, (new_status, candidate_id))
+        Args:
+            candidate_ids: IDs of candidates to update
+            new_status: Status to set
+            batch_size: Maximum number of IDs bound per UPDATE statement
+        """
+        if not candidate_ids:
+            return
         
-        conn.commit()
-        conn.close()
+        conn = self._get_conn()
+        cursor = conn.cursor()
+        
+        with conn:
+            for start in range(0, len(candidate_ids), batch_size):
+                batch = candidate_ids[start:start + batch_size]
+                placeholders = ",".join("?" * len(batch))
+                cursor.execute(f"""
+                    UPDATE candidates 
+                    SET status = ?, updated_at = CURRENT_TIMESTAMP
+                    WHERE id IN ({placeholders})
+                """, [new_status, *batch])
+        
+        self._status_counts_cache = None
     
     def get_candidate_details(self, candidate_id: int) -> Optional[Dict]:
         """Get detailed candidate information including education and skills"""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._get_conn()
         cursor = conn.cursor()
         
-        # Get candidate info
+        # Candidate row with education and skills aggregated as JSON in one statement
         cursor.execute("""
-            SELECT * FROM candidates WHERE id = ?
+            SELECT c.*, t.resume_text,
+                   (SELECT json_group_array(json_object(
+                               'degree', degree, 'institution', institution,
+                               'graduation_year', graduation_year, 'gpa', gpa))
+                    FROM education WHERE candidate_id = c.id) AS education,
+                   (SELECT json_group_array(json_object(
+                               'skill', skill, 'proficiency_level', proficiency_level))
+                    FROM skills WHERE candidate_id = c.id) AS skills
+            FROM candidates c
+            LEFT JOIN candidate_texts t ON t.candidate_id = c.id
+            WHERE c.id = ?
         """, (candidate_id,))
         
         candidate_row = cursor.fetchone()
         if not candidate_row:
-            conn.close()
             return None
         
-        # Convert to dict
-        candidate_columns = [desc[0] for desc in cursor.description]
-        candidate = dict(zip(candidate_columns, candidate_row))
-        
-        # Get education
-        cursor.execute("""
-            SELECT degree, institution, graduation_year, gpa
-            FROM education WHERE candidate_id = ?
-        """, (candidate_id,))
-        
-        education = [dict(zip(['degree', 'institution', 'graduation_year', 'gpa'], row)) 
-                    for row in cursor.fetchall()]
-        
-        # Get skills
-        cursor.execute("""
-            SELECT skill, proficiency_level
-            FROM skills WHERE candidate_id = ?
-        """, (candidate_id,))
-        
-        skills = [dict(zip(['skill', 'proficiency_level'], row)) 
-                 for row in cursor.fetchall()]
+        candidate = dict(candidate_row)
         
+        education = json.loads(candidate['education'])
+        skills = json.loads(candidate['skills'])
         candidate['education'] = education
         candidate['skills'] = skills
         
-        conn.close()
+        # Rows created before the display columns existed
+        if candidate.get('skills_display') is None:
+            candidate['skills_display'] = self._format_skills_display(skills)
+        if candidate.get('education_display') is None:
+            candidate['education_display'] = self._format_education_display(education)
+        
         return candidate
     
     def save_job_requirements(self, title: str, description: str, 
                             min_experience: int, min_gpa: float):
         """Save or update job requirements"""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._get_conn()
         cursor = conn.cursor()
         
-        # Delete existing requirements (assuming single job posting)
-        cursor.execute("DELETE FROM job_requirements")
-        
-        # Insert new requirements
-        cursor.execute("""
-            INSERT INTO job_requirements (title, description, min_experience, min_gpa)
-            VALUES (?, ?, ?, ?)
-        """, (title, description, min_experience, min_gpa))
-        
-        conn.commit()
-        conn.close()
+        with conn:
+            # Single job posting kept in a fixed row, upserted in one statement
+            cursor.execute("""
+                INSERT INTO job_requirements (id, title, description, min_experience, min_gpa)
+                VALUES (?, ?, ?, ?, ?)
+                ON CONFLICT(id) DO UPDATE SET
+                    title = excluded.title,
+                    description = excluded.description,
+                    min_experience = excluded.min_experience,
+                    min_gpa = excluded.min_gpa,
+                    updated_at = CURRENT_TIMESTAMP
+            """, (self.JOB_REQUIREMENTS_ID, title, description, min_experience, min_gpa))
     
     def get_job_requirements(self) -> Optional[Dict]:
         """Get current job requirements"""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._get_conn()
         cursor = conn.cursor()
         
         cursor.execute("""
             SELECT title, description, min_experience, min_gpa, created_at
             FROM job_requirements
-            ORDER BY created_at DESC
-            LIMIT 1
-        """)
+            WHERE id = ?
+        """, (self.JOB_REQUIREMENTS_ID,))
         
         row = cursor.fetchone()
-        conn.close()
         
         if row:
-            columns = ['title', 'description', 'min_experience', 'min_gpa', 'created_at']
-            return dict(zip(columns, row))
+            return dict(row)
         
         return None
     
+    def get_status_counts(self) -> Dict[str, int]:
+        """Get the number of candidates in each status"""
+        if self._status_counts_cache is None:
+            conn = self._get_conn()
+            cursor = conn.cursor()
+            
+            # Served from the status index without reading candidate rows
+            cursor.execute("SELECT status, COUNT(*) AS count FROM candidates GROUP BY status")
+            self._status_counts_cache = {row['status']: row['count'] for row in cursor.fetchall()}
+        
+        return dict(self._status_counts_cache)
+    
     def get_statistics(self) -> Dict[str, int]:
         """Get system statistics"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        # Total candidates
-        cursor.execute("SELECT COUNT(*) FROM candidates")
-        total_candidates = cursor.fetchone()[0]
-        
-        # Candidates by status
-        cursor.execute("SELECT status, COUNT(*) FROM candidates GROUP BY status")
-        status_counts = dict(cursor.fetchall())
-        
-        conn.close()
+        status_counts = self.get_status_counts()
+        total_candidates = sum(status_counts.values())
         
         return {
             'total_candidates': total_candidates,
@@ -330,41 +733,49 @@ class DatabaseManager:
         Returns:
             True if deleted successfully, False otherwise
         """
-        conn = sqlite3.connect(self.db_path)
+        conn = self._get_conn()
         cursor = conn.cursor()
         
         try:
-            # Get file information before deletion for cleanup
-            cursor.execute("SELECT file_path FROM candidate_files WHERE candidate_id = ?", (candidate_id,))
-            file_paths = [row[0] for row in cursor.fetchall()]
-            
-            # Delete candidate (CASCADE will handle related records)
-            cursor.execute("DELETE FROM candidates WHERE id = ?", (candidate_id,))
-            
-            if cursor.rowcount > 0:
-                conn.commit()
-                conn.close()
-                
-                # Clean up physical files
-                from file_storage import FileStorageManager
-                storage_manager = FileStorageManager()
-                for file_path in file_paths:
-                    storage_manager.delete_file(file_path)
+            with conn:
+                # Get file information before deletion for cleanup
+                cursor.execute("SELECT file_path FROM candidate_files WHERE candidate_id = ?", (candidate_id,))
+                file_paths = [row[0] for row in cursor.fetchall()]
                 
-                return True
-            else:
-                conn.close()
-                return False
+                # Delete candidate (CASCADE will handle related records)
+                cursor.execute("DELETE FROM candidates WHERE id = ?", (candidate_id,))
+                deleted = cursor.rowcount > 0
                 
         except Exception as e:
-            conn.rollback()
-            conn.close()
             print(f"Error deleting candidate: {e}")
             return False
+        
+        if not deleted:
+            return False
+        
+        self._status_counts_cache = None
+        
+        # Clean up physical files after the transaction; unlinks are I/O-bound
+        storage_manager = self._get_storage()
+        if len(file_paths) > 1:
+            with ThreadPoolExecutor(max_workers=min(8, len(file_paths))) as executor:
+                list(executor.map(storage_manager.delete_file, file_paths))
+        else:
+            for file_path in file_paths:
+                storage_manager.delete_file(file_path)
+        
+        return True
+    
+    def _get_storage(self):
+        """Get the file storage manager, creating it on first use"""
+        if self._storage is None:
+            from file_storage import FileStorageManager
+            self._storage = FileStorageManager()
+        return self._storage
     
     def get_candidate_files(self, candidate_id: int) -> List[Dict]:
         """Get all files associated with a candidate"""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._get_conn()
         cursor = conn.cursor()
         
         cursor.execute("""
@@ -374,9 +785,6 @@ class DatabaseManager:
             WHERE candidate_id = ?
         """, (candidate_id,))
         
-        columns = ['original_filename', 'stored_filename', 'file_path', 'file_type', 
-                  'file_size', 'upload_date']
-        files = [dict(zip(columns, row)) for row in cursor.fetchall()]
+        files = [dict(row) for row in cursor.fetchall()]
         
-        conn.close()
         return files
@@ -1,13 +1,34 @@
 import fitz  # PyMuPDF for PDF
 import docx  # python-docx for DOCX
 import re
-from typing import Optional, Dict, Any
+import codecs
+import threading
+from typing import Optional, Dict, Any, List, Tuple
 from pathlib import Path
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from utils import compute_content_hash
+
+# Text cleanup patterns compiled once at import time
+_WS_RE = re.compile(r'\s+')
+_SPECIAL_RE = re.compile(r'[^\w\s\.\,\-\(\)\@\+\/\&\%\$\#\!\?\:\;]')
+
+# Byte translation table keeping printable ASCII and mapping everything else to a space
+_PRINTABLE_TABLE = bytes(b if 32 <= b <= 126 else 0x20 for b in range(256))
 
 class DocumentParser:
     def __init__(self):
         """Initialize document parser supporting multiple formats"""
         self.supported_formats = {'.pdf', '.doc', '.docx', '.txt'}
+        # PDFs whose text layer yields fewer characters benefit from Groq cleanup
+        self.min_text_layer_chars = 200
+        self._enhance_executor: Optional[ThreadPoolExecutor] = None
+        # LRU caches of extraction and validation results keyed by content hash;
+        # the parser is shared across sessions and enhance threads, so access is locked
+        self.cache_size = 256
+        self._text_cache: OrderedDict = OrderedDict()
+        self._validation_cache: OrderedDict = OrderedDict()
+        self._cache_lock = threading.Lock()
         self.groq_processor = None
         try:
             from groq_processor import GroqProcessor
@@ -15,19 +36,33 @@ class DocumentParser:
         except Exception:
             pass
     
-    def extract_text_from_file(self, file_content: bytes, filename: str) -> str:
+    def extract_text_from_file(self, file_content: bytes, filename: str,
+                               content_hash: Optional[str] = None) -> str:
         """
         Extract text from various document formats
         
         Args:
             file_content: File content as bytes
             filename: Original filename to determine format
+            content_hash: Optional hash of file_content; results are cached under it
             
         Returns:
             Extracted text as string
         """
         file_ext = Path(filename).suffix.lower()
         
+        if content_hash is None:
+            return self._extract_by_format(file_content, file_ext)
+        
+        cache_key = (content_hash, file_ext)
+        text = self._cache_get(self._text_cache, cache_key)
+        if text is None:
+            text = self._extract_by_format(file_content, file_ext)
+            self._cache_put(self._text_cache, cache_key, text)
+        return text
+    
+    def _extract_by_format(self, file_content: bytes, file_ext: str) -> str:
+        """Dispatch text extraction on the file extension"""
         if file_ext == '.pdf':
             return self._extract_from_pdf(file_content)
         elif file_ext == '.docx':
@@ -40,30 +75,72 @@ class DocumentParser:
             raise ValueError(f"Unsupported file format: {file_ext}")
     
     def _extract_from_pdf(self, pdf_content: bytes) -> str:
-        """Extract text from PDF using PyMuPDF"""
+        """
+        Extract and clean the embedded text layer of a PDF using PyMuPDF
+        
+        Groq enhancement is not applied here; callers opt in with
+        enhance_text_async so the network call does not block extraction.
+        """
         try:
             pdf_document = fitz.open(stream=pdf_content, filetype="pdf")
-            extracted_text = ""
             
-            for page_num in range(pdf_document.page_count):
-                page = pdf_document[page_num]
-                page_text = page.get_text()
-                extracted_text += self._clean_text(page_text) + "\n"
+            page_texts = [self._clean_text(page.get_text()) for page in pdf_document]
             
             pdf_document.close()
             
-            # Enhance with Groq if available
-            if self.groq_processor and extracted_text.strip():
-                try:
-                    return self.groq_processor.enhance_resume_text(extracted_text)
-                except Exception:
-                    pass
-            
-            return extracted_text.strip()
+            return "\n".join(page_texts).strip()
             
         except Exception as e:
             raise Exception(f"Failed to extract text from PDF: {str(e)}")
     
+    def needs_enhancement(self, text: str, filename: str) -> bool:
+        """
+        Check whether extracted text is sparse enough to be worth Groq cleanup
+        
+        Args:
+            text: Text extracted from the document
+            filename: Original filename to determine format
+            
+        Returns:
+            True for PDFs with a low-signal text layer when Groq is available
+        """
+        return (
+            self.groq_processor is not None
+            and Path(filename).suffix.lower() == '.pdf'
+            and 0 < len(text) < self.min_text_layer_chars
+        )
+    
+    def enhance_text_async(self, text: str) -> Future:
+        """
+        Enhance extracted text with Groq on a background thread
+        
+        Args:
+            text: Extracted text to enhance
+            
+        Returns:
+            Future resolving to (enhanced_text, entities), where entities is the
+            (education_data, skills_data) parsed by the same request or None;
+            the original text and None on failure
+        """
+        if self._enhance_executor is None:
+            self._enhance_executor = ThreadPoolExecutor(max_workers=4)
+        return self._enhance_executor.submit(self._enhance_text, text)
+    
+    def _enhance_text(self, text: str) -> Tuple[str, Optional[Tuple[List[Dict], List[Dict]]]]:
+        """Enhance text with Groq if available, keeping any entities it returned"""
+        if self.groq_processor and text:
+            try:
+                result = self.groq_processor.enhance_resume(text)
+                entities = None
+                # Empty entities fall through to extract_entities, as in NLPProcessor
+                if result.get('education') or result.get('skills'):
+                    entities = (result['education'], result['skills'])
+                return result['cleaned_text'], entities
+            except Exception:
+                pass
+        
+        return text, None
+    
     def _extract_from_docx(self, docx_content: bytes) -> str:
         """Extract text from DOCX using python-docx"""
         try:
@@ -74,20 +151,12 @@ class DocumentParser:
             docx_file = io.BytesIO(docx_content)
             doc = Document(docx_file)
             
-            extracted_text = ""
+            # Extract text from paragraphs, then from table cells
+            parts = [paragraph.text for paragraph in doc.paragraphs]
+            parts.extend(cell.text for table in doc.tables for row in table.rows for cell in row.cells)
             
-            # Extract text from paragraphs
-            for paragraph in doc.paragraphs:
-                extracted_text += paragraph.text + "\n"
-            
-            # Extract text from tables
-            for table in doc.tables:
-                for row in table.rows:
-                    for cell in row.cells:
-                        extracted_text += cell.text + " "
-                    extracted_text += "\n"
-            
-            return self._clean_text(extracted_text)
+            # Separators collapse to single spaces in _clean_text
+            return self._clean_text("\n".join(parts))
             
         except Exception as e:
             raise Exception(f"Failed to extract text from DOCX: {str(e)}")
@@ -105,14 +174,8 @@ class DocumentParser:
                 text = doc_content.decode('utf-8', errors='ignore')
                 return self._clean_text(text)
             except:
-                # Alternative: Extract readable text portions
-                readable_text = ""
-                for byte in doc_content:
-                    if 32 <= byte <= 126:  # Printable ASCII range
-                        readable_text += chr(byte)
-                    else:
-                        readable_text += " "
-                
+                # Alternative: Extract readable text portions (printable ASCII range)
+                readable_text = doc_content.translate(_PRINTABLE_TABLE).decode('latin-1')
                 return self._clean_text(readable_text)
                 
         except Exception as e:
@@ -121,18 +184,18 @@ class DocumentParser:
     def _extract_from_txt(self, txt_content: bytes) -> str:
         """Extract text from TXT files"""
         try:
-            # Try different encodings
-            encodings = ['utf-8', 'utf-16', 'latin-1', 'cp1252']
-            
-            for encoding in encodings:
+            # Byte order marks identify the encoding without trial decoding
+            if txt_content.startswith(codecs.BOM_UTF8):
+                text = txt_content.decode('utf-8-sig', errors='replace')
+            elif txt_content.startswith((codecs.BOM_UTF16_LE, codecs.BOM_UTF16_BE)):
+                text = txt_content.decode('utf-16', errors='replace')
+            else:
+                # One strict UTF-8 attempt, then the common Windows encoding
                 try:
-                    text = txt_content.decode(encoding)
-                    return self._clean_text(text)
+                    text = txt_content.decode('utf-8')
                 except UnicodeDecodeError:
-                    continue
+                    text = txt_content.decode('cp1252', errors='replace')
             
-            # If all encodings fail, use utf-8 with error handling
-            text = txt_content.decode('utf-8', errors='replace')
             return self._clean_text(text)
             
         except Exception as e:
@@ -144,30 +207,63 @@ class DocumentParser:
             return ""
         
         # Remove excessive whitespace and newlines
-        text = re.sub(r'\s+', ' ', text)
+        text = _WS_RE.sub(' ', text)
         
         # Remove special characters that might interfere with processing
-        text = re.sub(r'[^\w\s\.\,\-\(\)\@\+\/\&\%\$\#\!\?\:\;]', '', text)
-        
-        # Normalize line breaks
-        text = re.sub(r'\n+', '\n', text)
+        text = _SPECIAL_RE.sub('', text)
         
         # Remove leading/trailing whitespace
         return text.strip()
     
-    def validate_document(self, file_content: bytes, filename: str) -> Dict[str, Any]:
+    def _cache_get(self, cache: OrderedDict, key):
+        """Return a cached value and mark it as recently used"""
+        with self._cache_lock:
+            if key not in cache:
+                return None
+            cache.move_to_end(key)
+            return cache[key]
+    
+    def _cache_put(self, cache: OrderedDict, key, value):
+        """Store a value, evicting the least recently used entry when full"""
+        with self._cache_lock:
+            cache[key] = value
+            cache.move_to_end(key)
+            if len(cache) > self.cache_size:
+                cache.popitem(last=False)
+    
+    def validate_document(self, file_content: bytes, filename: str,
+                          content_hash: Optional[str] = None) -> Dict[str, Any]:
         """
         Validate document and return validation results
         
         Args:
             file_content: File content as bytes
             filename: Original filename
+            content_hash: Optional hash of file_content; results are cached under it
             
         Returns:
             Dictionary containing validation results
         """
         file_ext = Path(filename).suffix.lower()
         
+        if content_hash is not None:
+            cached = self._cache_get(self._validation_cache, (content_hash, file_ext))
+            if cached is not None:
+                return {**cached, 'messages': list(cached['messages'])}
+        
+        validation_result = self._validate_uncached(file_content, filename, content_hash)
+        
+        if content_hash is not None:
+            self._cache_put(self._validation_cache, (content_hash, file_ext),
+                            {**validation_result, 'messages': list(validation_result['messages'])})
+        
+        return validation_result
+    
+    def _validate_uncached(self, file_content: bytes, filename: str,
+                           content_hash: Optional[str]) -> Dict[str, Any]:
+        """Run document validation checks"""
+        file_ext = Path(filename).suffix.lower()
+        
         validation_result = {
             'is_valid': False,
             'file_format': file_ext,
@@ -194,7 +290,7 @@ class DocumentParser:
         
         # Try to extract text to validate content
         try:
-            extracted_text = self.extract_text_from_file(file_content, filename)
+            extracted_text = self.extract_text_from_file(file_content, filename, content_hash)
             if extracted_text.strip():
                 validation_result['can_extract_text'] = True
                 validation_result['is_valid'] = True
@@ -208,13 +304,48 @@ class DocumentParser:
         
         return validation_result
     
-    def get_document_metadata(self, file_content: bytes, filename: str) -> Dict[str, Any]:
+    def parse_all(self, file_content: bytes, filename: str, content_hash: Optional[str] = None,
+                  include_metadata: bool = True) -> Dict[str, Any]:
+        """
+        Validate a document, extract its text and read its metadata in one pass
+        
+        Text is extracted once and shared by all three results through the
+        content-hash cache.
+        
+        Args:
+            file_content: File content as bytes
+            filename: Original filename
+            content_hash: Optional precomputed hash of file_content
+            include_metadata: Whether to read document metadata
+            
+        Returns:
+            Dictionary with 'text', 'metadata', 'validation' and 'content_hash' entries
+        """
+        if content_hash is None:
+            content_hash = compute_content_hash(file_content)
+        
+        validation = self.validate_document(file_content, filename, content_hash)
+        
+        text = ""
+        if validation['can_extract_text']:
+            text = self.extract_text_from_file(file_content, filename, content_hash)
+        
+        metadata = None
+        if include_metadata:
+            metadata = self.get_document_metadata(file_content, filename, content_hash)
+        
+        return {'text': text, 'metadata': metadata, 'validation': validation,
+                'content_hash': content_hash}
+    
+    def get_document_metadata(self, file_content: bytes, filename: str,
+                              content_hash: Optional[str] = None) -> Dict[str, Any]:
         """
         Extract metadata from document
         
         Args:
             file_content: File content as bytes
             filename: Original filename
+            content_hash: Optional hash of file_content used to reuse extracted text
             
         Returns:
             Dictionary containing document metadata
@@ -232,7 +363,7 @@ class DocumentParser:
         
         try:
             # Extract text to get basic statistics
-            text = self.extract_text_from_file(file_content, filename)
+            text = self.extract_text_from_file(file_content, filename, content_hash)
             metadata['character_count'] = len(text)
             metadata['word_count'] = len(text.split()) if text else 0
             
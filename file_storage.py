@@ -1,11 +1,39 @@
 import os
+import re
+import io
+import logging
+import gzip
 import shutil
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Optional, List, Dict, Any
-import hashlib
+from typing import Optional, List, Dict, Any, BinaryIO, Iterator, Tuple, Union
 from pathlib import Path
 
+from utils import new_content_hasher
+
+# Characters replaced when building stored filenames
+_UNSAFE_FILENAME_TABLE = str.maketrans({char: '_' for char in '<>:"/\\|?*'})
+_MULTIPLE_UNDERSCORES_RE = re.compile(r'_+')
+
+_log = logging.getLogger(__name__)
+
+# Threads that hash large uploads concurrently with writing them
+_HASH_POOL = ThreadPoolExecutor(max_workers=2)
+
 class FileStorageManager:
+    # Span size for vectored writes
+    WRITE_BUFFER_SIZE = 128 * 1024
+    # Size of the reusable per-thread buffer streamed uploads are read into
+    STREAM_CHUNK_SIZE = 256 * 1024
+    # Upper bound on spans handed to a single os.writev call (IOV_MAX)
+    MAX_WRITE_SPANS = 1024
+    # Batch size from which store_resume_files_batch writes in parallel, and its thread cap
+    MIN_PARALLEL_BATCH = 4
+    MAX_WRITE_WORKERS = 8
+    # In-memory uploads from this size are hashed on _HASH_POOL while being written
+    PARALLEL_HASH_MIN_SIZE = 1024 * 1024
+    
     def __init__(self, storage_path: str = "resume_storage"):
         """Initialize file storage manager with local folder structure"""
         self.storage_path = Path(storage_path)
@@ -18,6 +46,21 @@ class FileStorageManager:
             '.docx': 'Word Document (Modern)',
             '.txt': 'Text File'
         }
+        
+        # Destination folders as strings, so storing a file needs no Path arithmetic
+        self._ext_folder_str = {
+            ext: str(self.storage_path / 'resumes' / ext[1:]) for ext in self.supported_formats
+        }
+        self._archive_dir_str = str(self.storage_path / 'archived')
+        
+        # Formats gzip-compressed when archived; DOCX is already a zip container
+        self.compressible_formats = {'.txt', '.doc', '.pdf'}
+        
+        # Per-thread reusable buffer for streamed uploads
+        self._local = threading.local()
+        
+        # Folder listings keyed by folder name, as (directory mtime, entries)
+        self._listing_cache: Dict[str, Tuple[int, List[Tuple[str, str, int, float, float]]]] = {}
     
     def setup_storage_structure(self):
         """Create organized folder structure for file storage"""
@@ -35,64 +78,207 @@ class FileStorageManager:
             folder_path = self.storage_path / folder
             folder_path.mkdir(parents=True, exist_ok=True)
         
-        print(f"✓ File storage structure created at: {self.storage_path}")
+        _log.debug("file storage structure created at %s", self.storage_path)
     
-    def store_resume_file(self, file_content: bytes, original_filename: str, 
-                         candidate_id: int) -> Dict[str, Any]:
+    def store_resume_file(self, file_content: Union[bytes, BinaryIO, Path], original_filename: str, 
+                         candidate_id: int, file_hash: Optional[str] = None) -> Dict[str, Any]:
         """
         Store resume file with organized naming and folder structure
         
         Args:
-            file_content: File content as bytes
+            file_content: File content as bytes, a readable binary file object,
+                or the path of a file to copy in chunks
             original_filename: Original filename from upload
             candidate_id: Database ID of candidate
+            file_hash: Hash already computed over file_content; computed while writing if None
             
         Returns:
             Dictionary with file storage information
         """
         try:
             # Get file extension
-            file_ext = Path(original_filename).suffix.lower()
+            stem, file_ext = os.path.splitext(os.path.basename(original_filename))
+            file_ext = file_ext.lower()
             
             if file_ext not in self.supported_formats:
                 raise ValueError(f"Unsupported file format: {file_ext}")
             
-            # Generate unique filename with candidate ID and timestamp
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            safe_filename = self._sanitize_filename(Path(original_filename).stem)
+            # Generate unique filename with candidate ID and timestamp; the same
+            # clock reading is reused for stored_at
+            now = datetime.now()
+            timestamp = now.strftime("%Y%m%d_%H%M%S")
+            safe_filename = self._sanitize_filename(stem)
             new_filename = f"candidate_{candidate_id}_{timestamp}_{safe_filename}{file_ext}"
             
             # Determine storage folder based on file type
-            storage_folder = self.storage_path / 'resumes' / file_ext[1:]  # Remove dot from extension
-            file_path = storage_folder / new_filename
-            
-            # Store file
-            with open(file_path, 'wb') as f:
-                f.write(file_content)
+            folder = file_ext[1:]  # Remove dot from extension
+            file_path = os.path.join(self._ext_folder_str[file_ext], new_filename)
             
-            # Generate file hash for integrity
-            file_hash = hashlib.md5(file_content).hexdigest()
+            # Store file, hashing each chunk as it is written unless the caller
+            # already hashed the content
+            hasher = new_content_hasher() if file_hash is None else None
+            file_size = self._write_file(file_path, file_content, hasher)
+            self._listing_cache.pop(folder, None)
             
-            # Get file size
-            file_size = len(file_content)
+            if hasher is not None:
+                file_hash = hasher.hexdigest()
             
             storage_info = {
                 'stored_filename': new_filename,
-                'storage_path': str(file_path),
-                'relative_path': str(file_path.relative_to(self.storage_path)),
+                'storage_path': file_path,
+                'relative_path': f"resumes/{folder}/{new_filename}",
                 'original_filename': original_filename,
                 'file_size': file_size,
                 'file_hash': file_hash,
                 'file_type': self.supported_formats[file_ext],
-                'stored_at': datetime.now().isoformat()
+                'stored_at': now.isoformat()
             }
             
-            print(f"✓ File stored: {new_filename} ({file_size} bytes)")
+            _log.debug("stored %s size=%d", new_filename, file_size)
             return storage_info
             
         except Exception as e:
             raise Exception(f"Failed to store file: {str(e)}")
     
+    def store_resume_files_batch(self, files: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Store several resume files at once, writing them in parallel
+        
+        Args:
+            files: List of dictionaries with file_content, original_filename,
+                candidate_id and optionally file_hash
+            
+        Returns:
+            List of storage information dictionaries in input order, or an
+            'error' entry for files that could not be stored
+        """
+        def store(file_entry: Dict[str, Any]) -> Dict[str, Any]:
+            try:
+                return self.store_resume_file(
+                    file_entry['file_content'], file_entry['original_filename'],
+                    file_entry['candidate_id'], file_hash=file_entry.get('file_hash')
+                )
+            except Exception as e:
+                return {'original_filename': file_entry['original_filename'], 'error': str(e)}
+        
+        # Small batches are not worth the thread startup cost
+        if len(files) < self.MIN_PARALLEL_BATCH:
+            return [store(file_entry) for file_entry in files]
+        
+        with ThreadPoolExecutor(max_workers=min(len(files), self.MAX_WRITE_WORKERS)) as executor:
+            return list(executor.map(store, files))
+    
+    def _write_file(self, file_path: str, file_content: Union[bytes, BinaryIO, Path],
+                    hasher: Optional[Any] = None) -> int:
+        """
+        Write content to a new file with raw descriptor writes
+        
+        Args:
+            file_path: Destination path, created or truncated
+            file_content: File content as bytes, a readable binary file object, or a path
+            hasher: Optional hash object updated with everything written
+            
+        Returns:
+            Number of bytes written
+        """
+        flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_CLOEXEC', 0) | getattr(os, 'O_BINARY', 0)
+        fd = os.open(file_path, flags, 0o644)
+        try:
+            if isinstance(file_content, (bytes, bytearray, memoryview)):
+                data = memoryview(file_content)
+                if hasher is not None and len(data) >= self.PARALLEL_HASH_MIN_SIZE:
+                    # Hashing and os.writev both release the GIL, so hash while the write blocks
+                    hash_future = _HASH_POOL.submit(hasher.update, data)
+                    try:
+                        self._write_all(fd, data)
+                    finally:
+                        hash_future.result()
+                else:
+                    if hasher is not None:
+                        hasher.update(data)
+                    self._write_all(fd, data)
+                file_size = len(data)
+            else:
+                file_size = 0
+                for chunk in self._iter_chunks(file_content):
+                    if hasher is not None:
+                        hasher.update(chunk)
+                    self._write_all(fd, chunk)
+                    file_size += len(chunk)
+            
+            # Stored resumes are rarely re-read soon, so keep them out of the page cache
+            if hasattr(os, 'posix_fadvise'):
+                os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+            return file_size
+        finally:
+            os.close(fd)
+    
+    def _iter_chunks(self, source: Union[BinaryIO, Path]) -> Iterator[memoryview]:
+        """
+        Yield the content of a file object or path in chunks of this thread's buffer
+        
+        Each chunk is a view into the reused buffer and is only valid until
+        the next one is requested.
+        
+        Args:
+            source: Readable binary file object or path of a file to copy
+            
+        Yields:
+            Memory views over the bytes read
+        """
+        if isinstance(source, (str, Path)):
+            with open(source, 'rb', buffering=0) as f:
+                yield from self._iter_chunks(f)
+            return
+        
+        buffer = self._get_write_buffer()
+        view = memoryview(buffer)
+        readinto = getattr(source, 'readinto', None)
+        while True:
+            if readinto is not None:
+                count = readinto(buffer)
+            else:
+                data = source.read(len(buffer))
+                count = len(data)
+                buffer[:count] = data
+            if not count:
+                break
+            yield view[:count]
+    
+    def _write_all(self, fd: int, data: memoryview) -> None:
+        """
+        Write a whole buffer to a descriptor, one vectored write per batch of spans
+        
+        Args:
+            fd: Open file descriptor
+            data: Bytes to write
+        """
+        spans = [data[i:i + self.WRITE_BUFFER_SIZE] for i in range(0, len(data), self.WRITE_BUFFER_SIZE)]
+        index = 0
+        while index < len(spans):
+            if hasattr(os, 'writev'):
+                written = os.writev(fd, spans[index:index + self.MAX_WRITE_SPANS])
+            else:
+                written = os.write(fd, spans[index])
+            
+            # Skip fully written spans and trim a partially written one
+            while written:
+                span_size = len(spans[index])
+                if written >= span_size:
+                    written -= span_size
+                    index += 1
+                else:
+                    spans[index] = spans[index][written:]
+                    written = 0
+    
+    def _get_write_buffer(self) -> bytearray:
+        """Return this thread's reusable buffer for streamed uploads"""
+        buffer = getattr(self._local, 'write_buffer', None)
+        if buffer is None:
+            buffer = bytearray(self.STREAM_CHUNK_SIZE)
+            self._local.write_buffer = buffer
+        return buffer
+    
     def retrieve_file(self, file_path: str) -> Optional[bytes]:
         """
         Retrieve file content from storage
@@ -103,14 +289,41 @@ class FileStorageManager:
         Returns:
             File content as bytes or None if not found
         """
+        file_handle = self.open_file(file_path)
+        if file_handle is None:
+            return None
+        
+        try:
+            with file_handle:
+                return file_handle.read()
+        except Exception as e:
+            _log.error("Error retrieving file: %s", e)
+            return None
+    
+    def open_file(self, file_path: str) -> Optional[BinaryIO]:
+        """
+        Open a stored file for reading without loading it up front
+        
+        Gzip-compressed copies (archived files) are decompressed transparently.
+        
+        Args:
+            file_path: Path to stored file
+            
+        Returns:
+            Readable binary file object or None if not found
+        """
         try:
             full_path = self.storage_path / file_path
             if full_path.exists():
-                with open(full_path, 'rb') as f:
-                    return f.read()
+                return open(full_path, 'rb')
+            
+            compressed_path = full_path.with_name(full_path.name + '.gz')
+            if compressed_path.exists():
+                with gzip.open(compressed_path, 'rb') as f:
+                    return io.BytesIO(f.read())
             return None
         except Exception as e:
-            print(f"Error retrieving file: {e}")
+            _log.error("Error retrieving file: %s", e)
             return None
     
     def delete_file(self, file_path: str) -> bool:
@@ -127,11 +340,12 @@ class FileStorageManager:
             full_path = self.storage_path / file_path
             if full_path.exists():
                 full_path.unlink()
-                print(f"✓ File deleted: {file_path}")
+                self._invalidate_listing(file_path)
+                _log.debug("deleted %s", file_path)
                 return True
             return False
         except Exception as e:
-            print(f"Error deleting file: {e}")
+            _log.error("Error deleting file: %s", e)
             return False
     
     def archive_file(self, file_path: str) -> bool:
@@ -147,51 +361,109 @@ class FileStorageManager:
         try:
             source_path = self.storage_path / file_path
             if source_path.exists():
-                archive_path = self.storage_path / 'archived' / source_path.name
-                shutil.move(str(source_path), str(archive_path))
-                print(f"✓ File archived: {file_path}")
+                archive_path = os.path.join(self._archive_dir_str, source_path.name)
+                if source_path.suffix.lower() in self.compressible_formats:
+                    # Compress at rest; open_file decompresses on read
+                    with open(source_path, 'rb') as src, gzip.open(archive_path + '.gz', 'wb') as dst:
+                        shutil.copyfileobj(src, dst)
+                    source_path.unlink()
+                else:
+                    shutil.move(str(source_path), archive_path)
+                self._invalidate_listing(file_path)
+                _log.debug("archived %s", file_path)
                 return True
             return False
         except Exception as e:
-            print(f"Error archiving file: {e}")
+            _log.error("Error archiving file: %s", e)
             return False
     
-    def list_files(self, file_type: Optional[str] = None) -> List[Dict[str, Any]]:
+    def list_files(self, file_type: Optional[str] = None, limit: Optional[int] = None) -> List[Dict[str, Any]]:
         """
         List all stored files with metadata
         
         Args:
             file_type: Filter by file type (pdf, doc, docx, txt)
+            limit: Return only the newest files, up to this many
             
         Returns:
             List of file information dictionaries
         """
-        files = []
         try:
-            resumes_path = self.storage_path / 'resumes'
+            entries = self._scan_folders(file_type)
             
-            folders_to_scan = [file_type] if file_type else ['pdf', 'doc', 'docx', 'txt']
+            # Sort on raw timestamps and only format the entries returned
+            entries.sort(key=lambda entry: entry[1][3], reverse=True)
+            if limit is not None:
+                entries = entries[:limit]
             
-            for folder in folders_to_scan:
-                folder_path = resumes_path / folder
-                if folder_path.exists():
-                    for file_path in folder_path.glob('*'):
-                        if file_path.is_file():
-                            stat = file_path.stat()
-                            files.append({
-                                'filename': file_path.name,
-                                'relative_path': str(file_path.relative_to(self.storage_path)),
-                                'file_type': folder.upper(),
-                                'file_size': stat.st_size,
-                                'created_at': datetime.fromtimestamp(stat.st_ctime).isoformat(),
-                                'modified_at': datetime.fromtimestamp(stat.st_mtime).isoformat()
-                            })
-            
-            return sorted(files, key=lambda x: x['created_at'], reverse=True)
+            return [
+                {
+                    'filename': filename,
+                    'relative_path': relative_path,
+                    'file_type': folder.upper(),
+                    'file_size': file_size,
+                    'created_at': datetime.fromtimestamp(created).isoformat(),
+                    'modified_at': datetime.fromtimestamp(modified).isoformat()
+                }
+                for folder, (filename, relative_path, file_size, created, modified) in entries
+            ]
             
         except Exception as e:
-            print(f"Error listing files: {e}")
+            _log.error("Error listing files: %s", e)
+            return []
+    
+    def _scan_folders(self, file_type: Optional[str] = None) -> List[Tuple[str, Tuple[str, str, int, float, float]]]:
+        """
+        Collect raw directory entries for the requested resume folders
+        
+        Args:
+            file_type: Filter by file type (pdf, doc, docx, txt)
+            
+        Returns:
+            List of (folder, (filename, relative_path, file_size, ctime, mtime)) tuples
+        """
+        resumes_path = self.storage_path / 'resumes'
+        folders_to_scan = [file_type] if file_type else ['pdf', 'doc', 'docx', 'txt']
+        
+        entries = []
+        for folder in folders_to_scan:
+            entries.extend((folder, entry) for entry in self._scan_folder(folder, resumes_path / folder))
+        return entries
+    
+    def _scan_folder(self, folder: str, folder_path: Path) -> List[Tuple[str, str, int, float, float]]:
+        """
+        List one resume folder, reusing the cached listing while the folder is unchanged
+        
+        Args:
+            folder: Folder name (pdf, doc, docx, txt)
+            folder_path: Full path of the folder
+            
+        Returns:
+            List of (filename, relative_path, file_size, ctime, mtime) tuples
+        """
+        try:
+            dir_mtime = os.stat(folder_path).st_mtime_ns
+        except FileNotFoundError:
             return []
+        
+        cached = self._listing_cache.get(folder)
+        if cached is not None and cached[0] == dir_mtime:
+            return cached[1]
+        
+        entries = []
+        with os.scandir(folder_path) as it:
+            for entry in it:
+                if entry.is_file():
+                    stat = entry.stat()
+                    entries.append((entry.name, f"resumes/{folder}/{entry.name}",
+                                    stat.st_size, stat.st_ctime, stat.st_mtime))
+        
+        self._listing_cache[folder] = (dir_mtime, entries)
+        return entries
+    
+    def _invalidate_listing(self, file_path: Union[str, Path]) -> None:
+        """Drop the cached listing of the folder containing file_path"""
+        self._listing_cache.pop(Path(file_path).parent.name, None)
     
     def get_storage_stats(self) -> Dict[str, Any]:
         """
@@ -208,12 +480,11 @@ class FileStorageManager:
         }
         
         try:
-            files = self.list_files()
-            stats['total_files'] = len(files)
+            entries = self._scan_folders()
+            stats['total_files'] = len(entries)
             
-            for file_info in files:
-                file_type = file_info['file_type']
-                file_size = file_info['file_size']
+            for folder, (_, _, file_size, _, _) in entries:
+                file_type = folder.upper()
                 
                 stats['total_size'] += file_size
                 
@@ -229,7 +500,7 @@ class FileStorageManager:
             return stats
             
         except Exception as e:
-            print(f"Error getting storage stats: {e}")
+            _log.error("Error getting storage stats: %s", e)
             return stats
     
     def _sanitize_filename(self, filename: str) -> str:
@@ -242,19 +513,8 @@ class FileStorageManager:
         Returns:
             Sanitized filename
         """
-        # Remove or replace unsafe characters
-        unsafe_chars = '<>:"/\\|?*'
-        sanitized = filename
-        
-        for char in unsafe_chars:
-            sanitized = sanitized.replace(char, '_')
-        
-        # Remove multiple underscores and trim
-        sanitized = '_'.join(sanitized.split('_'))
-        sanitized = sanitized.strip('_')
-        
-        # Limit length
-        return sanitized[:50] if len(sanitized) > 50 else sanitized
+        # Replace unsafe characters, collapse repeated underscores, trim and limit length
+        return _MULTIPLE_UNDERSCORES_RE.sub('_', filename.translate(_UNSAFE_FILENAME_TABLE)).strip('_')[:50]
     
     def validate_file_format(self, filename: str) -> bool:
         """
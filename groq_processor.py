@@ -1,18 +1,329 @@
 import os
 import json
-from groq import Groq
-from typing import Dict, List, Tuple, Optional
+import logging
 import re
+import sqlite3
+import hashlib
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+import httpx
+from groq import Groq
+from typing import Any, Dict, List, Tuple, Optional
+
+# orjson parses LLM responses faster when installed
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+def _json_loads(text: str) -> Any:
+    """Parse JSON with orjson when available, otherwise the standard library"""
+    if orjson is not None:
+        return orjson.loads(text)
+    return json.loads(text)
+
+# Cached responses hold resume contents, so they live beside the stored resumes
+DEFAULT_CACHE_PATH = os.path.join("resume_storage", "groq_cache.db")
+
+def _text_hash(text: str) -> str:
+    """Hash a resume text for looking up the cached responses that contain it"""
+    return hashlib.blake2b(text.encode('utf-8'), digest_size=16).hexdigest()
+
+def _open_cache(cache_path: str) -> sqlite3.Connection:
+    """Open the response cache, creating it or replacing a cache without purge columns"""
+    cache_dir = os.path.dirname(cache_path)
+    if cache_dir:
+        os.makedirs(cache_dir, exist_ok=True)
+    
+    conn = sqlite3.connect(cache_path, check_same_thread=False)
+    columns = {row[1] for row in conn.execute('PRAGMA table_info(responses)')}
+    if columns and 'created_at' not in columns:
+        # Entries from the old layout cannot be purged per resume; drop them
+        conn.execute('DROP TABLE responses')
+    conn.executescript('''
+        CREATE TABLE IF NOT EXISTS responses (
+            key TEXT PRIMARY KEY,
+            value TEXT NOT NULL,
+            text_hash TEXT NOT NULL,
+            cleaned_hash TEXT,
+            created_at REAL NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS idx_responses_text_hash ON responses(text_hash);
+        CREATE INDEX IF NOT EXISTS idx_responses_cleaned_hash ON responses(cleaned_hash);
+        CREATE INDEX IF NOT EXISTS idx_responses_created_at ON responses(created_at);
+    ''')
+    conn.commit()
+    return conn
+
+def purge_cached_text(text: str, cache_path: str = DEFAULT_CACHE_PATH) -> int:
+    """
+    Delete the cached responses for a resume text
+    
+    Matches entries whose request contained the text as well as entries whose
+    cleaned_text is the text, so a stored enhanced resume purges the response
+    it came from.
+    
+    Args:
+        text: Resume text as sent to Groq or as stored after enhancement
+        cache_path: Response cache to purge
+        
+    Returns:
+        Number of cached responses deleted
+    """
+    if not text or not os.path.exists(cache_path):
+        return 0
+    
+    text_hash = _text_hash(text)
+    try:
+        conn = _open_cache(cache_path)
+        try:
+            with conn:
+                cursor = conn.execute(
+                    'DELETE FROM responses WHERE text_hash = ? OR cleaned_hash = ?', (text_hash, text_hash)
+                )
+            return cursor.rowcount
+        finally:
+            conn.close()
+    except sqlite3.Error as e:
+        print(f"Error purging Groq cache: {e}")
+        return 0
+
+def _extract_json_span(text: str) -> Optional[str]:
+    """
+    Find the first balanced JSON object in text with a single linear scan
+    
+    Args:
+        text: Model response that may wrap JSON in other text
+        
+    Returns:
+        Substring from the first '{' to its matching '}' or None if unbalanced
+    """
+    start = text.find('{')
+    if start == -1:
+        return None
+    
+    depth = 0
+    in_string = False
+    escaped = False
+    for i in range(start, len(text)):
+        char = text[i]
+        if in_string:
+            if escaped:
+                escaped = False
+            elif char == '\\':
+                escaped = True
+            elif char == '"':
+                in_string = False
+        elif char == '"':
+            in_string = True
+        elif char == '{':
+            depth += 1
+        elif char == '}':
+            depth -= 1
+            if depth == 0:
+                return text[start:i + 1]
+    return None
+
+_log = logging.getLogger(__name__)
+
+# Connection pool shared by every GroqProcessor in the process
+_http_client: Optional[httpx.Client] = None
+_http_client_lock = threading.Lock()
+
+def _get_http_client() -> httpx.Client:
+    """Return the shared keep-alive HTTP client, using HTTP/2 when h2 is installed"""
+    global _http_client
+    with _http_client_lock:
+        if _http_client is None:
+            try:
+                import h2  # noqa: F401
+                http2 = True
+            except ImportError:
+                http2 = False
+            _http_client = httpx.Client(
+                http2=http2,
+                timeout=30,
+                limits=httpx.Limits(max_keepalive_connections=32, max_connections=64)
+            )
+        return _http_client
+
+# Field defaults applied to each parsed education and skill entry
+_EDUCATION_DEFAULTS = {'degree': None, 'institution': None, 'graduation_year': None, 'gpa': None}
+_SKILL_DEFAULTS = {'proficiency_level': 'Intermediate'}
+
+# Keywords used by the fallback extractor when the LLM is unavailable, scanned case-insensitively
+_FALLBACK_EDUCATION_RE = re.compile(r'degree|bachelor|master|university|college', re.IGNORECASE)
+_FALLBACK_SKILLS = [
+    'python', 'java', 'javascript', 'react', 'node', 'sql', 'html', 'css',
+    'git', 'docker', 'aws', 'azure', 'mongodb', 'postgresql', 'mysql'
+]
+_FALLBACK_SKILLS_RE = re.compile(
+    '(?=(' + '|'.join(re.escape(skill) for skill in sorted(_FALLBACK_SKILLS, key=len, reverse=True)) + '))',
+    re.IGNORECASE
+)
 
 class GroqProcessor:
-    def __init__(self):
-        """Initialize Groq processor with API client"""
+    def __init__(self, cache_path: str = DEFAULT_CACHE_PATH):
+        """Initialize Groq processor with API client and on-disk response cache"""
         self.api_key = os.getenv('GROQ_API_KEY')
         if not self.api_key:
             raise ValueError("GROQ_API_KEY environment variable is required")
         
-        self.client = Groq(api_key=self.api_key)
+        self.client = Groq(api_key=self.api_key, http_client=_get_http_client())
         self.model = "llama3-8b-8192"  # Fast and efficient model
+        
+        # Parsed responses keyed by a hash of the full request, shared across threads;
+        # entries expire after cache_max_age seconds and the oldest beyond cache_max_entries are evicted
+        self.cache_max_entries = 10_000
+        self.cache_max_age = 30 * 24 * 3600
+        self._cache_lock = threading.Lock()
+        self._cache_conn = _open_cache(cache_path)
+        with self._cache_lock:
+            self._evict_expired()
+            self._cache_conn.commit()
+    
+    def _cache_key(self, system_prompt: str, user_prompt: str,
+                   temperature: float, max_tokens: int) -> str:
+        """Hash everything that determines a completion into a cache key"""
+        request = json.dumps([self.model, system_prompt, user_prompt, temperature, max_tokens])
+        return hashlib.blake2b(request.encode('utf-8'), digest_size=16).hexdigest()
+    
+    def _cache_get(self, key: str) -> Optional[Any]:
+        """Return a cached parsed response that has not expired, or None"""
+        try:
+            with self._cache_lock:
+                row = self._cache_conn.execute(
+                    'SELECT value FROM responses WHERE key = ? AND created_at >= ?',
+                    (key, time.time() - self.cache_max_age)
+                ).fetchone()
+            return _json_loads(row[0]) if row else None
+        except Exception as e:
+            print(f"Error reading Groq cache: {e}")
+            return None
+    
+    def _cache_put(self, key: str, raw_text: str, value: Any) -> None:
+        """Store a parsed response for raw_text, evicting expired and excess entries"""
+        cleaned_text = value.get('cleaned_text')
+        try:
+            with self._cache_lock:
+                self._cache_conn.execute(
+                    'INSERT OR REPLACE INTO responses (key, value, text_hash, cleaned_hash, created_at) '
+                    'VALUES (?, ?, ?, ?, ?)',
+                    (key, json.dumps(value), _text_hash(raw_text),
+                     _text_hash(cleaned_text.strip()) if cleaned_text else None, time.time())
+                )
+                self._evict_expired()
+                self._cache_conn.execute(
+                    'DELETE FROM responses WHERE key IN '
+                    '(SELECT key FROM responses ORDER BY created_at DESC LIMIT -1 OFFSET ?)',
+                    (self.cache_max_entries,)
+                )
+                self._cache_conn.commit()
+        except Exception as e:
+            print(f"Error writing Groq cache: {e}")
+    
+    def _evict_expired(self) -> None:
+        """Delete entries older than cache_max_age; the caller holds the cache lock"""
+        self._cache_conn.execute('DELETE FROM responses WHERE created_at < ?',
+                                 (time.time() - self.cache_max_age,))
+    
+    def parse_resume_full(self, raw_text: str, include_cleaned_text: bool = False) -> Dict[str, Any]:
+        """
+        Extract education, skills, contact details and optionally cleaned text in one Groq call
+        
+        Args:
+            raw_text: Raw extracted text from PDF
+            include_cleaned_text: Also ask for a cleaned copy of the text
+            
+        Returns:
+            Dictionary with education, skills and contact keys, plus
+            cleaned_text when requested and returned by the model
+        """
+        prompt = self._create_resume_parsing_prompt(raw_text, include_cleaned_text)
+        system_prompt = "You are an expert resume parser. Extract structured data from resumes and return valid JSON only."
+        max_tokens = 4096 if include_cleaned_text else 2048
+        
+        cache_key = self._cache_key(system_prompt, prompt, 0.1, max_tokens)
+        structured_data = self._cache_get(cache_key)
+        if structured_data is None and not include_cleaned_text:
+            # A cached response that includes cleaned text answers this request too
+            full_prompt = self._create_resume_parsing_prompt(raw_text, True)
+            structured_data = self._cache_get(self._cache_key(system_prompt, full_prompt, 0.1, 4096))
+        if structured_data is not None:
+            return structured_data
+        
+        if include_cleaned_text:
+            _log.info("Enhancing resume text with Groq LLM")
+        
+        # Get response from Groq
+        response = self.client.chat.completions.create(
+            model=self.model,
+            messages=[
+                {
+                    "role": "system",
+                    "content": system_prompt
+                },
+                {
+                    "role": "user",
+                    "content": prompt
+                }
+            ],
+            temperature=0.1,  # Low temperature for consistent output
+            max_tokens=max_tokens
+        )
+        
+        # Parse the response; only cache responses that yielded data
+        response_content = response.choices[0].message.content or ""
+        structured_data = self._parse_llm_response(response_content)
+        if any(structured_data.get(key) for key in ('education', 'skills', 'contact', 'cleaned_text')):
+            self._cache_put(cache_key, raw_text, structured_data)
+        
+        return structured_data
+    
+    def parse_resume_batch(self, raw_texts: List[str], include_cleaned_text: bool = False,
+                           max_workers: int = 8) -> List[Optional[Dict[str, Any]]]:
+        """
+        Run parse_resume_full for many resumes with requests in flight concurrently
+        
+        Args:
+            raw_texts: List of raw extracted resume texts
+            include_cleaned_text: Also ask for cleaned copies of the texts
+            max_workers: Maximum number of concurrent requests
+            
+        Returns:
+            List of parse results in input order, None where a request failed
+        """
+        def parse(raw_text: str) -> Optional[Dict[str, Any]]:
+            try:
+                return self.parse_resume_full(raw_text, include_cleaned_text)
+            except Exception as e:
+                print(f"Error processing with Groq: {e}")
+                return None
+        
+        if not raw_texts:
+            return []
+        
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(raw_texts))) as executor:
+            return list(executor.map(parse, raw_texts))
+    
+    def structure_resumes_bulk(self, raw_texts: List[str]) -> List[Tuple[List[Dict], List[Dict]]]:
+        """
+        Structure many resumes concurrently over the shared connection pool
+        
+        Args:
+            raw_texts: List of raw extracted resume texts
+            
+        Returns:
+            List of (education_data, skills_data) tuples in input order
+        """
+        results = []
+        for raw_text, structured_data in zip(raw_texts, self.parse_resume_batch(raw_texts)):
+            if structured_data is None:
+                results.append(self._fallback_extraction(raw_text))
+            else:
+                results.append((structured_data.get('education', []), structured_data.get('skills', [])))
+        return results
     
     def structure_resume_data(self, raw_text: str) -> Tuple[List[Dict], List[Dict]]:
         """
@@ -25,29 +336,7 @@ class GroqProcessor:
             Tuple of (education_data, skills_data)
         """
         try:
-            # Create a structured prompt for the LLM
-            prompt = self._create_resume_parsing_prompt(raw_text)
-            
-            # Get response from Groq
-            response = self.client.chat.completions.create(
-                model=self.model,
-                messages=[
-                    {
-                        "role": "system",
-                        "content": "You are an expert resume parser. Extract structured data from resumes and return valid JSON only."
-                    },
-                    {
-                        "role": "user",
-                        "content": prompt
-                    }
-                ],
-                temperature=0.1,  # Low temperature for consistent output
-                max_tokens=2048
-            )
-            
-            # Parse the response
-            response_content = response.choices[0].message.content or ""
-            structured_data = self._parse_llm_response(response_content)
+            structured_data = self.parse_resume_full(raw_text)
             
             education_data = structured_data.get('education', [])
             skills_data = structured_data.get('skills', [])
@@ -59,8 +348,13 @@ class GroqProcessor:
             # Fallback to basic extraction if LLM fails
             return self._fallback_extraction(raw_text)
     
-    def _create_resume_parsing_prompt(self, text: str) -> str:
+    def _create_resume_parsing_prompt(self, text: str, include_cleaned_text: bool = False) -> str:
         """Create a structured prompt for resume parsing"""
+        cleaned_text_field = ''',
+    "cleaned_text": "Resume text with formatting artifacts removed"''' if include_cleaned_text else ''
+        cleaned_text_instruction = '''
+8. For cleaned_text: remove formatting artifacts, fix broken words, and standardize terminology, keeping all content''' if include_cleaned_text else ''
+        
         prompt = f"""
 Parse the following resume text and extract structured information. Return ONLY a valid JSON object with the exact structure shown below:
 
@@ -82,7 +376,14 @@ Parse the following resume text and extract structured information. Return ONLY
             "skill": "JavaScript",
             "proficiency_level": "Intermediate"
         }}
-    ]
+    ],
+    "contact": {{
+        "email": "example@email.com",
+        "phone": "+1-234-567-8900",
+        "location": "City, State",
+        "linkedin": "linkedin.com/in/profile",
+        "name": "Full Name"
+    }}{cleaned_text_field}
 }}
 
 Instructions:
@@ -90,9 +391,10 @@ Instructions:
 2. Extract technical and professional skills
 3. For education: include degree type, institution name, graduation year (if mentioned), and GPA (if mentioned)
 4. For skills: categorize proficiency as "Beginner", "Intermediate", "Advanced", or "Expert" based on context
-5. If information is not available, use null for that field
-6. Only include relevant technical skills, programming languages, tools, and professional competencies
-7. Return ONLY the JSON object, no additional text or explanation
+5. For contact: extract email address, phone number, location, LinkedIn profile, and full name
+6. If information is not available, use null for that field
+7. Only include relevant technical skills, programming languages, tools, and professional competencies{cleaned_text_instruction}
+Return ONLY the JSON object, no additional text or explanation
 
 Resume Text:
 {text}
@@ -105,49 +407,58 @@ Resume Text:
             # Clean the response text
             cleaned_text = response_text.strip()
             
-            # Try to find JSON in the response
-            json_match = re.search(r'\{.*\}', cleaned_text, re.DOTALL)
-            if json_match:
-                json_str = json_match.group()
-                parsed_data = json.loads(json_str)
-                
-                # Validate structure
-                if self._validate_structure(parsed_data):
-                    return parsed_data
+            # Responses that are bare JSON parse directly; only scan for an
+            # embedded object when that fails
+            parsed_data = None
+            if cleaned_text.startswith('{'):
+                try:
+                    parsed_data = _json_loads(cleaned_text)
+                except json.JSONDecodeError:
+                    parsed_data = None
+            
+            if parsed_data is None:
+                json_str = _extract_json_span(cleaned_text)
+                if json_str:
+                    parsed_data = _json_loads(json_str)
+            
+            # Validate structure
+            if isinstance(parsed_data, dict) and self._validate_structure(parsed_data):
+                return parsed_data
             
             # If parsing fails, return empty structure
-            return {"education": [], "skills": []}
+            return {"education": [], "skills": [], "contact": {}}
             
         except json.JSONDecodeError as e:
             print(f"JSON parsing error: {e}")
-            return {"education": [], "skills": []}
+            return {"education": [], "skills": [], "contact": {}}
     
     def _validate_structure(self, data: Dict) -> bool:
-        """Validate the structure of parsed data"""
+        """Validate the structure of parsed data, filling in missing optional fields"""
         try:
             # Check if required keys exist
             if 'education' not in data or 'skills' not in data:
                 return False
             
-            # Validate education entries
-            for edu in data['education']:
-                if not isinstance(edu, dict):
-                    return False
-                # Check for required education fields
-                required_edu_fields = ['degree', 'institution', 'graduation_year', 'gpa']
-                for field in required_edu_fields:
-                    if field not in edu:
-                        edu[field] = None
-            
-            # Validate skills entries
-            for skill in data['skills']:
-                if not isinstance(skill, dict):
-                    return False
-                # Check for required skill fields
-                if 'skill' not in skill:
-                    return False
-                if 'proficiency_level' not in skill:
-                    skill['proficiency_level'] = 'Intermediate'
+            education = data['education']
+            skills = data['skills']
+            if not isinstance(education, list) or not isinstance(skills, list):
+                return False
+            
+            # Every entry must be an object, and skills must name the skill
+            if not all(isinstance(edu, dict) for edu in education):
+                return False
+            if not all(isinstance(skill, dict) and 'skill' in skill for skill in skills):
+                return False
+            
+            # Fill missing fields by merging onto the defaults built at import time
+            data['education'] = [{**_EDUCATION_DEFAULTS, **edu} for edu in education]
+            data['skills'] = [{**_SKILL_DEFAULTS, **skill} for skill in skills]
+            
+            # Contact details and cleaned text are optional
+            if not isinstance(data.get('contact'), dict):
+                data['contact'] = {}
+            if 'cleaned_text' in data and not isinstance(data['cleaned_text'], str):
+                del data['cleaned_text']
             
             return True
             
@@ -161,7 +472,7 @@ Resume Text:
         
         try:
             # Basic education extraction
-            if any(keyword in text.lower() for keyword in ['degree', 'bachelor', 'master', 'university', 'college']):
+            if _FALLBACK_EDUCATION_RE.search(text):
                 education_data.append({
                     'degree': 'Degree mentioned in resume',
                     'institution': None,
@@ -169,20 +480,18 @@ Resume Text:
                     'gpa': None
                 })
             
-            # Basic skills extraction
-            common_skills = [
-                'python', 'java', 'javascript', 'react', 'node', 'sql', 'html', 'css',
-                'git', 'docker', 'aws', 'azure', 'mongodb', 'postgresql', 'mysql'
-            ]
+            # Basic skills extraction in one scan; the lookahead reports the
+            # longest keyword starting at each position
+            matched = {match.lower() for match in _FALLBACK_SKILLS_RE.findall(text)}
             
-            text_lower = text.lower()
-            found_skills = []
-            for skill in common_skills:
-                if skill in text_lower:
-                    found_skills.append({
-                        'skill': skill.title(),
-                        'proficiency_level': 'Intermediate'
-                    })
+            # Keywords that are prefixes of a longer match (java in javascript) also count
+            matched.update(skill for skill in _FALLBACK_SKILLS
+                           if any(match.startswith(skill) for match in matched))
+            
+            found_skills = [
+                {'skill': skill.title(), 'proficiency_level': 'Intermediate'}
+                for skill in _FALLBACK_SKILLS if skill in matched
+            ]
             
             skills_data = found_skills
             
@@ -191,6 +500,35 @@ Resume Text:
         
         return education_data, skills_data
     
+    def enhance_resume(self, raw_text: str) -> Dict[str, Any]:
+        """
+        Use Groq to clean resume text, keeping the entities parsed by the same request
+        
+        Args:
+            raw_text: Raw extracted text from PDF
+            
+        Returns:
+            Dictionary with cleaned_text, plus education and skills when the
+            fused request returned them alongside the cleaned text
+        """
+        try:
+            structured_data = self.parse_resume_full(raw_text, include_cleaned_text=True)
+        except Exception as e:
+            print(f"Error enhancing text with Groq: {e}")
+            structured_data = {}
+        
+        enhanced_text = (structured_data.get('cleaned_text') or '').strip()
+        if enhanced_text:
+            # Only a complete reply carries cleaned text, so its entities are usable too
+            return {
+                'cleaned_text': enhanced_text,
+                'education': structured_data['education'],
+                'skills': structured_data['skills']
+            }
+        
+        # A truncated or invalid fused reply loses everything; ask for the text alone
+        return {'cleaned_text': self._clean_text_only(raw_text)}
+    
     def enhance_resume_text(self, raw_text: str) -> str:
         """
         Use Groq to clean and enhance resume text for better vectorization
@@ -201,6 +539,34 @@ Resume Text:
         Returns:
             Cleaned and enhanced text
         """
+        return self.enhance_resume(raw_text)['cleaned_text']
+    
+    def enhance_resume_texts(self, raw_texts: List[str], max_workers: int = 8) -> List[str]:
+        """
+        Run enhance_resume_text for many resumes with requests in flight concurrently
+        
+        Args:
+            raw_texts: List of raw extracted resume texts
+            max_workers: Maximum number of concurrent requests
+            
+        Returns:
+            List of cleaned texts in input order, the raw text where a text
+            was empty or its requests failed
+        """
+        enhanced_texts = list(raw_texts)
+        pending = [i for i, raw_text in enumerate(raw_texts) if raw_text]
+        if not pending:
+            return enhanced_texts
+        
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(pending))) as executor:
+            results = executor.map(lambda i: self.enhance_resume_text(raw_texts[i]), pending)
+            for i, enhanced_text in zip(pending, results):
+                enhanced_texts[i] = enhanced_text
+        
+        return enhanced_texts
+    
+    def _clean_text_only(self, raw_text: str) -> str:
+        """Clean resume text with a plain-text request, returning the raw text on failure"""
         try:
             prompt = f"""
 Clean and enhance the following resume text for semantic analysis. 
@@ -210,13 +576,20 @@ Return only the cleaned text without any additional formatting or explanations.
 Original Text:
 {raw_text}
 """
+            system_prompt = "You are a text cleaning expert. Clean and enhance resume text for better analysis."
             
+            cache_key = self._cache_key(system_prompt, prompt, 0.1, 2048)
+            cached = self._cache_get(cache_key)
+            if cached is not None:
+                return cached['cleaned_text']
+            
+            _log.info("Enhancing resume text with Groq LLM (plain-text cleanup)")
             response = self.client.chat.completions.create(
                 model=self.model,
                 messages=[
                     {
                         "role": "system",
-                        "content": "You are a text cleaning expert. Clean and enhance resume text for better analysis."
+                        "content": system_prompt
                     },
                     {
                         "role": "user",
@@ -227,9 +600,10 @@ Original Text:
                 max_tokens=2048
             )
             
-            enhanced_text = response.choices[0].message.content
+            enhanced_text = (response.choices[0].message.content or "").strip()
             if enhanced_text:
-                return enhanced_text.strip()
+                self._cache_put(cache_key, raw_text, {'cleaned_text': enhanced_text})
+                return enhanced_text
             return raw_text
             
         except Exception as e:
@@ -247,56 +621,8 @@ Original Text:
             Dictionary with contact information
         """
         try:
-            prompt = f"""
-Extract contact information from the following resume text and return ONLY a valid JSON object:
-
-{{
-    "email": "example@email.com",
-    "phone": "+1-234-567-8900",
-    "location": "City, State",
-    "linkedin": "linkedin.com/in/profile",
-    "name": "Full Name"
-}}
-
-Instructions:
-1. Extract email address, phone number, location, LinkedIn profile, and full name
-2. Use null for any information not found
-3. Return ONLY the JSON object, no additional text
-
-Resume Text:
-{raw_text}
-"""
-            
-            response = self.client.chat.completions.create(
-                model=self.model,
-                messages=[
-                    {
-                        "role": "system",
-                        "content": "You are an expert at extracting contact information from resumes. Return valid JSON only."
-                    },
-                    {
-                        "role": "user",
-                        "content": prompt
-                    }
-                ],
-                temperature=0.1,
-                max_tokens=512
-            )
-            
-            # Parse response
-            response_content = response.choices[0].message.content
-            if not response_content:
-                return {}
-            
-            response_text = response_content.strip()
-            json_match = re.search(r'\{.*\}', response_text, re.DOTALL)
-            
-            if json_match:
-                contact_info = json.loads(json_match.group())
-                return contact_info
-            
-            return {}
+            return self.parse_resume_full(raw_text).get('contact', {})
             
         except Exception as e:
             print(f"Error extracting contact info: {e}")
-            return {}
\ No newline at end of file
+            return {}
@@ -0,0 +1,161 @@
+import os
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, ThreadPoolExecutor, wait
+from typing import List, Dict, Any, Optional, Tuple
+
+from database import DatabaseManager, DuplicateEmailError
+from document_parser import DocumentParser
+from file_storage import FileStorageManager
+from nlp_processor import NLPProcessor
+from matching_engine import MatchingEngine
+from utils import compute_content_hash
+
+# Parser owned by each worker process, created on first use
+_worker_parser: Optional[DocumentParser] = None
+
+def _parse_in_worker(file_content: bytes, filename: str, content_hash: str) -> Dict[str, Any]:
+    """Validate and extract a document inside a parser worker process"""
+    global _worker_parser
+    if _worker_parser is None:
+        _worker_parser = DocumentParser()
+    return _worker_parser.parse_all(file_content, filename, content_hash, include_metadata=False)
+
+class IngestPipeline:
+    # Error message wording for failures in each pipeline stage
+    STAGE_ACTIONS = {
+        'parse': "parse document",
+        'process': "process resume",
+        'write': "store candidate"
+    }
+    
+    def __init__(self, db_manager: DatabaseManager, document_parser: DocumentParser,
+                 file_storage: FileStorageManager, nlp_processor: NLPProcessor,
+                 matching_engine: MatchingEngine, max_workers: Optional[int] = None):
+        """
+        Initialize a batch ingestion pipeline for many resumes at once
+        
+        Parsing runs in worker processes, Groq enhancement and entity
+        extraction run on threads, and all storage and database writes are
+        serialized on a single writer thread.
+        """
+        self.db_manager = db_manager
+        self.document_parser = document_parser
+        self.file_storage = file_storage
+        self.nlp_processor = nlp_processor
+        self.matching_engine = matching_engine
+        self.max_workers = max_workers or os.cpu_count()
+    
+    def ingest_batch(self, applications: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Ingest a batch of applications, writing each as soon as it is processed
+        
+        Args:
+            applications: List of dictionaries with the registration fields
+                (full_name, email, phone, location, experience_years) plus
+                file_content and filename
+        
+        Returns:
+            List of result dictionaries in input order, each with the filename
+            and either a candidate_id or an error message
+        """
+        results: List[Dict[str, Any]] = [
+            {'filename': application['filename'], 'candidate_id': None, 'error': None}
+            for application in applications
+        ]
+        
+        content_hashes = [compute_content_hash(a['file_content']) for a in applications]
+        
+        with ProcessPoolExecutor(max_workers=self.max_workers) as parse_pool, \
+                ThreadPoolExecutor(max_workers=self.max_workers) as nlp_pool, \
+                ThreadPoolExecutor(max_workers=1) as writer:
+            
+            # Each future maps to its stage and application index; a finished
+            # stage immediately submits the next one for that application
+            pending: Dict[Future, Tuple[str, int]] = {
+                parse_pool.submit(_parse_in_worker, a['file_content'], a['filename'], h): ('parse', index)
+                for index, (a, h) in enumerate(zip(applications, content_hashes))
+            }
+            
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    stage, index = pending.pop(future)
+                    application = applications[index]
+                    
+                    try:
+                        outcome = future.result()
+                    except DuplicateEmailError:
+                        results[index]['error'] = "An application with this email already exists"
+                        continue
+                    except Exception as e:
+                        results[index]['error'] = f"Failed to {self.STAGE_ACTIONS[stage]}: {str(e)}"
+                        continue
+                    
+                    if stage == 'parse':
+                        error = self._check_parsed(outcome)
+                        if error:
+                            results[index]['error'] = error
+                            continue
+                        next_future = nlp_pool.submit(self._process_text, outcome['text'],
+                                                      application['filename'])
+                        pending[next_future] = ('process', index)
+                    elif stage == 'process':
+                        next_future = writer.submit(self._write_candidate, application,
+                                                    content_hashes[index], outcome)
+                        pending[next_future] = ('write', index)
+                    else:
+                        results[index]['candidate_id'] = outcome
+        
+        return results
+    
+    def _check_parsed(self, parsed: Dict[str, Any]) -> Optional[str]:
+        """Return an error message for documents that cannot be ingested"""
+        validation = parsed['validation']
+        if not validation['is_valid']:
+            return f"Invalid document: {'; '.join(validation['messages'])}"
+        if not parsed['text'].strip():
+            return "Could not extract text from the document"
+        return None
+    
+    def _process_text(self, resume_text: str, filename: str) -> Dict[str, Any]:
+        """Enhance sparse text and extract entities for one resume"""
+        # Entities come from the enhanced text, which is what gets stored and vectorized;
+        # the enhancement request usually parses them already
+        entities = None
+        if self.document_parser.needs_enhancement(resume_text, filename):
+            resume_text, entities = self.document_parser.enhance_text_async(resume_text).result()
+        
+        education_data, skills_data = entities or self.nlp_processor.extract_entities(resume_text)
+        
+        return {'resume_text': resume_text, 'education_data': education_data, 'skills_data': skills_data}
+    
+    def _write_candidate(self, application: Dict[str, Any], content_hash: str,
+                         processed: Dict[str, Any]) -> int:
+        """Store the file and candidate rows for one resume on the writer thread"""
+        file_info = self.file_storage.store_resume_file(
+            application['file_content'], application['filename'], 0,  # Temporary candidate_id
+            file_hash=content_hash
+        )
+        
+        try:
+            candidate_id = self.db_manager.add_candidate(
+                full_name=application['full_name'],
+                email=application['email'],
+                phone=application['phone'],
+                location=application.get('location', ''),
+                experience_years=application.get('experience_years', 0),
+                resume_text=processed['resume_text'],
+                education_data=processed['education_data'],
+                skills_data=processed['skills_data'],
+                file_info=file_info,
+                resume_hash=content_hash
+            )
+        except DuplicateEmailError:
+            self.file_storage.delete_file(file_info['relative_path'])
+            raise
+        
+        self.db_manager.save_candidate_vectors(
+            [(candidate_id, self.matching_engine.build_resume_vector(processed['resume_text']))],
+            self.matching_engine.VECTOR_VERSION
+        )
+        
+        return candidate_id
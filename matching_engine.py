@@ -1,11 +1,47 @@
 import numpy as np
-from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.metrics.pairwise import cosine_similarity
-from typing import List, Dict, Tuple
+from sklearn.feature_extraction import DictVectorizer
+from sklearn.feature_extraction.text import HashingVectorizer, TfidfVectorizer, TfidfTransformer
+from typing import List, Dict, Tuple, Optional
+from collections import Counter
+from operator import itemgetter
+import heapq
 import re
 import string
 
+# Patterns used by _preprocess_text, compiled once at import time
+_PUNCTUATION_RE = re.compile(r'[^\w\s\.\-\+\#]')
+_LANGUAGE_TOKEN_RE = re.compile(r'\b(c\+\+|c\#|\.net|node\.js|react\.js|vue\.js)\b')
+
+# Numba compiles the batch cosine kernel when installed; compilation happens on the
+# first scoring call (and is cached on disk), not when an engine is constructed
+try:
+    from numba import njit, prange
+except ImportError:
+    njit = None
+
+if njit is not None:
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _batch_sparse_cosine(indptr, indices, data, job_dense, out):
+        """Cosine similarity of every CSR row against a dense job vector, rows in parallel"""
+        job_norm = np.sqrt(np.sum(job_dense * job_dense))
+        for i in prange(indptr.shape[0] - 1):
+            dot = 0.0
+            norm = 0.0
+            for k in range(indptr[i], indptr[i + 1]):
+                value = data[k]
+                dot += value * job_dense[indices[k]]
+                norm += value * value
+            if norm == 0.0 or job_norm == 0.0:
+                out[i] = 0.0
+            else:
+                out[i] = dot / np.sqrt(norm * job_norm * job_norm)
+else:
+    _batch_sparse_cosine = None
+
 class MatchingEngine:
+    # Bump when preprocessing or tokenization changes so stored resume vectors are rebuilt
+    VECTOR_VERSION = "counts-v1"
+    
     def __init__(self):
         """Initialize matching engine with TF-IDF vectorizer"""
         self.vectorizer = TfidfVectorizer(
@@ -13,75 +49,120 @@ class MatchingEngine:
             max_features=5000,
             ngram_range=(1, 2),
             lowercase=True,
-            token_pattern=r'\b[a-zA-Z][a-zA-Z0-9]*\b'
+            token_pattern=r'\b[a-zA-Z][a-zA-Z0-9]*\b',
+            dtype=np.float32
         )
+        self.analyzer = self.vectorizer.build_analyzer()
+        
+        # Stateless counterpart for streaming scores, built on first use
+        self._hasher: Optional[HashingVectorizer] = None
         self.job_vector = None
+        
+        # Matcher for the most recent keyword set, as (keywords, matcher)
+        self._keyword_matcher = None
+        
         self.threshold = 0.3  # More practical threshold for real-world matching
     
-    def calculate_similarity(self, resume_text: str, job_description: str) -> float:
+    def prepare_jd(self, job_description: str) -> Dict:
+        """
+        Preprocess a job description once so it can be reused for every candidate
+        
+        The most recently prepared job is kept on the engine, so repeated calls
+        with the same description return the cached result.
+        
+        Args:
+            job_description: Job requirements text
+            
+        Returns:
+            Dictionary with the cleaned job text, its keyword set and compiled
+            keyword matcher, and its term counts
+        """
+        if self.job_vector is not None and self.job_vector['source'] == job_description:
+            return self.job_vector
+        
+        job_clean = self._preprocess_text(job_description)
+        keywords = self._extract_job_keywords(job_clean)
+        self.job_vector = {
+            'source': job_description,
+            'cleaned_text': job_clean,
+            'keywords': keywords,
+            'keyword_matcher': self._compile_keywords(keywords) if keywords else None,
+            'term_counts': Counter(self.analyzer(job_clean))
+        }
+        return self.job_vector
+    
+    def build_resume_vector(self, resume_text: str) -> Dict:
+        """
+        Preprocess and tokenize a resume into a vector that can be stored and reused
+        
+        The term counts do not depend on a fitted vocabulary, so they stay valid
+        across matching runs; IDF weighting is applied per run over the batch.
+        
+        Args:
+            resume_text: Candidate's resume text
+            
+        Returns:
+            Dictionary with the cleaned resume text and its n-gram term counts
+        """
+        resume_clean = self._preprocess_text(resume_text)
+        return {
+            'cleaned_text': resume_clean,
+            'term_counts': dict(Counter(self.analyzer(resume_clean)))
+        }
+    
+    def calculate_similarity(self, resume_text: str, job_description: str,
+                             jd_vec: Optional[Dict] = None) -> float:
         """
         Calculate enhanced similarity between resume and job description
         
         Args:
             resume_text: Candidate's resume text
             job_description: Job requirements text
+            jd_vec: Optional result of prepare_jd for this job description
             
         Returns:
             Similarity score between 0 and 1
         """
         try:
-            # Preprocess texts
-            resume_clean = self._preprocess_text(resume_text)
-            job_clean = self._preprocess_text(job_description)
-            
-            if not resume_clean.strip() or not job_clean.strip():
-                return 0.0
-            
-            # Create TF-IDF vectors
-            corpus = [resume_clean, job_clean]
-            tfidf_matrix = self.vectorizer.fit_transform(corpus)
-            
-            # Calculate cosine similarity
-            similarity_matrix = cosine_similarity(tfidf_matrix[0:1], tfidf_matrix[1:2])
-            base_similarity = similarity_matrix[0][0]
-            
-            # Enhanced scoring with keyword matching
-            keyword_boost = self._calculate_keyword_match(resume_clean, job_clean)
-            
-            # Weighted final score
-            final_score = (base_similarity * 0.7) + (keyword_boost * 0.3)
-            
-            # Ensure score is between 0 and 1
-            return min(max(float(final_score), 0.0), 1.0)
+            # Weight the pair from term counts as a batch of one; empty texts score 0
+            jd_vec = jd_vec or self.prepare_jd(job_description)
+            return self.calculate_similarity_batch([resume_text], job_description, jd_vec)[0]
             
         except Exception as e:
             print(f"Error calculating similarity: {e}")
             return 0.0
     
-    def rank_candidates(self, candidates: List[Dict], job_description: str) -> List[Dict]:
+    def rank_candidates(self, candidates: List[Dict], job_description: str,
+                        top_k: Optional[int] = None) -> List[Dict]:
         """
         Rank multiple candidates based on similarity to job description
         
         Args:
             candidates: List of candidate dictionaries with resume_text
             job_description: Job requirements text
+            top_k: Optional number of best candidates to return
             
         Returns:
-            List of candidates sorted by similarity score (highest first)
+            List of candidates sorted by similarity score (highest first),
+            limited to top_k entries if given
         """
         try:
             if not candidates:
                 return []
             
-            # Calculate similarity for each candidate
-            for candidate in candidates:
-                resume_text = candidate.get('resume_text', '')
-                similarity = self.calculate_similarity(resume_text, job_description)
+            # Score every candidate against the job in one TF-IDF pass
+            resume_texts = [candidate.get('resume_text', '') for candidate in candidates]
+            scores = self.calculate_similarity_batch(resume_texts, job_description)
+            for candidate, similarity in zip(candidates, scores):
                 candidate['similarity_score'] = similarity
                 candidate['match_status'] = 'shortlisted' if similarity >= self.threshold else 'rejected'
             
+            # Only the best top_k are needed, so select them without sorting everything
+            if top_k is not None:
+                return heapq.nlargest(top_k, candidates, key=itemgetter('similarity_score'))
+            
             # Sort by similarity score (descending)
-            ranked_candidates = sorted(candidates, key=lambda x: x.get('similarity_score', 0), reverse=True)
+            ranked_candidates = sorted(candidates, key=itemgetter('similarity_score'), reverse=True)
             
             return ranked_candidates
             
@@ -104,28 +185,248 @@ class MatchingEngine:
             if not resume_texts:
                 return []
             
-            # Preprocess all texts
-            job_clean = self._preprocess_text(job_description)
-            resumes_clean = [self._preprocess_text(text) for text in resume_texts]
+            # One TF-IDF matrix with the job description in row 0
+            _, tfidf_matrix, _ = self._vectorize_batch(resume_texts, self.prepare_jd(job_description))
+            if tfidf_matrix is None:
+                return [0.0] * len(resume_texts)
             
-            # Create corpus with job description first
-            corpus = [job_clean] + resumes_clean
+            # Calculate similarities between job (index 0) and all resumes
+            return self._base_scores(tfidf_matrix).tolist()
             
-            # Fit TF-IDF vectorizer
-            tfidf_matrix = self.vectorizer.fit_transform(corpus)
+        except Exception as e:
+            print(f"Error in batch similarity calculation: {e}")
+            return [0.0] * len(resume_texts)
+    
+    def batch_similarity_streaming(self, resume_texts: List[str], job_description: str) -> List[float]:
+        """
+        Calculate similarity scores for multiple resumes without building a vocabulary
+        
+        Terms are hashed rather than looked up in a fitted vocabulary and there is
+        no IDF weighting, so scores differ slightly from batch_similarity in
+        exchange for a single stateless pass over each document.
+        
+        Args:
+            resume_texts: List of resume text strings
+            job_description: Job requirements text
             
-            # Calculate similarities between job (index 0) and all resumes
-            job_vector = tfidf_matrix[0:1]
-            resume_vectors = tfidf_matrix[1:]
+        Returns:
+            List of similarity scores
+        """
+        try:
+            if not resume_texts:
+                return []
             
-            similarity_scores = cosine_similarity(job_vector, resume_vectors)[0]
+            # Tokens hash into fixed buckets, so there is no vocabulary to fit
+            # and rows come out L2-normalized
+            if self._hasher is None:
+                self._hasher = HashingVectorizer(
+                    stop_words='english',
+                    n_features=2 ** 18,
+                    ngram_range=(1, 2),
+                    lowercase=True,
+                    token_pattern=r'\b[a-zA-Z][a-zA-Z0-9]*\b',
+                    alternate_sign=False,
+                    dtype=np.float32
+                )
+            
+            # Job description in row 0, as in the vocabulary-based batch path
+            job_clean = self.prepare_jd(job_description)['cleaned_text']
+            hashed = self._hasher.transform([job_clean] + [self._preprocess_text(text) for text in resume_texts])
+            
+            # Rows are L2-normalized, so one sparse product against the job row gives every cosine
+            return (hashed @ hashed[0].T).toarray().ravel()[1:].tolist()
             
-            return similarity_scores.tolist()
+        except Exception as e:
+            print(f"Error in streaming similarity calculation: {e}")
+            return [0.0] * len(resume_texts)
+    
+    def calculate_similarity_batch(self, resume_texts: List[str], job_description: str,
+                                   jd_vec: Optional[Dict] = None,
+                                   resume_vectors: Optional[List[Dict]] = None) -> List[float]:
+        """
+        Calculate enhanced similarity for many resumes against one job description
+        in a single TF-IDF pass
+        
+        Args:
+            resume_texts: List of resume text strings
+            job_description: Job requirements text
+            jd_vec: Optional result of prepare_jd for this job description
+            resume_vectors: Optional stored build_resume_vector results, one per resume
+            
+        Returns:
+            List of similarity scores between 0 and 1, in input order
+        """
+        try:
+            if not resume_texts:
+                return []
+            
+            jd_vec = jd_vec or self.prepare_jd(job_description)
+            resumes_clean, tfidf_matrix, _ = self._vectorize_batch(resume_texts, jd_vec, resume_vectors)
+            if tfidf_matrix is None:
+                return [0.0] * len(resume_texts)
+            
+            return self._score_batch(resumes_clean, jd_vec, tfidf_matrix)
             
         except Exception as e:
             print(f"Error in batch similarity calculation: {e}")
             return [0.0] * len(resume_texts)
     
+    def batch_match_analysis(self, resume_texts: List[str], job_description: str,
+                             jd_vec: Optional[Dict] = None,
+                             resume_vectors: Optional[List[Dict]] = None) -> List[Dict]:
+        """
+        Provide detailed match analysis for many resumes, reusing one TF-IDF
+        matrix for both scoring and key-term extraction
+        
+        Args:
+            resume_texts: List of resume text strings
+            job_description: Job requirements text
+            jd_vec: Optional result of prepare_jd for this job description
+            resume_vectors: Optional stored build_resume_vector results, one per resume
+            
+        Returns:
+            List of analysis dictionaries (same keys as detailed_match_analysis)
+        """
+        try:
+            if not resume_texts:
+                return []
+            
+            jd_vec = jd_vec or self.prepare_jd(job_description)
+            if resume_vectors is None:
+                resume_vectors = [self.build_resume_vector(text) for text in resume_texts]
+            resumes_clean, tfidf_matrix, _ = self._vectorize_batch(resume_texts, jd_vec, resume_vectors)
+            if tfidf_matrix is None:
+                return [self._empty_analysis() for _ in resume_texts]
+            
+            scores = self._score_batch(resumes_clean, jd_vec, tfidf_matrix)
+            
+            # Key terms come from each document's own counts; IDF across the batch
+            # would push the terms the job and resumes share out of the top lists
+            job_terms = self._top_count_terms(jd_vec['term_counts'], 15)
+            job_term_set = set(job_terms)
+            
+            return [
+                self._build_analysis(similarity_score, self._top_count_terms(vector['term_counts'], 15),
+                                     job_terms, job_term_set)
+                for vector, similarity_score in zip(resume_vectors, scores)
+            ]
+            
+        except Exception as e:
+            print(f"Error in batch match analysis: {e}")
+            return [self._empty_analysis('error') for _ in resume_texts]
+    
+    def _vectorize_batch(self, resume_texts: List[str], jd_vec: Dict,
+                         resume_vectors: Optional[List[Dict]] = None):
+        """Build one TF-IDF matrix with the prepared job in row 0 and resumes below"""
+        if resume_vectors is None:
+            resume_vectors = [self.build_resume_vector(text) for text in resume_texts]
+        resumes_clean = [vector['cleaned_text'] for vector in resume_vectors]
+        
+        if not jd_vec['cleaned_text'].strip():
+            return resumes_clean, None, None
+        
+        tfidf_matrix, feature_names = self._tfidf_from_counts(
+            [jd_vec['term_counts']] + [vector['term_counts'] for vector in resume_vectors]
+        )
+        return resumes_clean, tfidf_matrix, feature_names
+    
+    def _tfidf_from_counts(self, term_counts: List[Dict]):
+        """
+        Turn per-document term counts into the matrix TfidfVectorizer would fit
+        
+        Returns:
+            Tuple of (tfidf_matrix, feature_names), or (None, None) if no terms
+        """
+        # float32 halves the bytes every scoring pass moves; TfidfTransformer keeps the dtype
+        dict_vectorizer = DictVectorizer(dtype=np.float32)
+        count_matrix = dict_vectorizer.fit_transform(term_counts)
+        feature_names = dict_vectorizer.get_feature_names_out()
+        
+        if count_matrix.shape[1] == 0:
+            return None, None
+        
+        # Keep the most frequent terms, as the vectorizer's max_features does
+        max_features = self.vectorizer.max_features
+        if max_features and count_matrix.shape[1] > max_features:
+            term_totals = np.asarray(count_matrix.sum(axis=0)).ravel()
+            keep = np.sort((-term_totals).argsort()[:max_features])
+            count_matrix = count_matrix[:, keep]
+            feature_names = feature_names[keep]
+        
+        tfidf_matrix = TfidfTransformer().fit_transform(count_matrix)
+        return tfidf_matrix, feature_names
+    
+    def _score_batch(self, resumes_clean: List[str], jd_vec: Dict, tfidf_matrix) -> List[float]:
+        """Combine cosine similarity and keyword boost for every resume row"""
+        base_scores = self._base_scores(tfidf_matrix)
+        
+        scores = []
+        for resume_clean, base_similarity in zip(resumes_clean, base_scores):
+            if not resume_clean.strip():
+                scores.append(0.0)
+                continue
+            keyword_boost = self._calculate_keyword_match(
+                resume_clean, jd_vec['cleaned_text'], jd_vec['keywords'], jd_vec['keyword_matcher']
+            )
+            final_score = (base_similarity * 0.7) + (keyword_boost * 0.3)
+            scores.append(min(max(float(final_score), 0.0), 1.0))
+        
+        return scores
+    
+    def _base_scores(self, tfidf_matrix) -> np.ndarray:
+        """Cosine similarity of every resume row against the job in row 0"""
+        # Resume rows are addressed in place through the CSR arrays; slicing
+        # tfidf_matrix[1:] would copy every row's data and indices
+        job_dense = tfidf_matrix[0].toarray().ravel()
+        resume_count = tfidf_matrix.shape[0] - 1
+        
+        if _batch_sparse_cosine is not None:
+            # One parallel pass over the CSR rows against the densified job vector
+            scores = np.empty(resume_count, dtype=np.float64)
+            _batch_sparse_cosine(tfidf_matrix.indptr[1:], tfidf_matrix.indices, tfidf_matrix.data,
+                                 job_dense, scores)
+            return scores
+        
+        # TF-IDF rows are already L2-normalized, so cosine similarity is one sparse mat-vec
+        return (tfidf_matrix @ job_dense)[1:]
+    
+    def _top_count_terms(self, term_counts: Dict[str, int], top_n: int) -> List[str]:
+        """
+        Return one document's most frequent terms, ties in alphabetical order
+        
+        This is the ranking a TF-IDF fit on the document alone produces, where
+        every term has the same IDF.
+        """
+        return heapq.nsmallest(top_n, term_counts, key=lambda term: (-term_counts[term], term))
+    
+    def _build_analysis(self, similarity_score: float, resume_terms: List[str],
+                        job_terms: List[str], job_term_set: set) -> Dict:
+        """Assemble one analysis result from a score and both texts' key terms"""
+        common_terms = set(resume_terms).intersection(job_term_set)
+        term_overlap = len(common_terms) / len(job_term_set) if job_term_set else 0.0
+        
+        return {
+            'similarity_score': similarity_score,
+            'match_status': 'shortlisted' if similarity_score >= self.threshold else 'rejected',
+            'term_overlap': term_overlap,
+            'common_terms': list(common_terms),
+            'resume_key_terms': resume_terms[:10],
+            'job_key_terms': job_terms[:10],
+            'recommendation': self._get_recommendation(similarity_score, term_overlap)
+        }
+    
+    def _empty_analysis(self, match_status: str = 'rejected') -> Dict:
+        """Analysis result for texts that could not be scored"""
+        return {
+            'similarity_score': 0.0,
+            'match_status': match_status,
+            'term_overlap': 0.0,
+            'common_terms': [],
+            'resume_key_terms': [],
+            'job_key_terms': [],
+            'recommendation': 'Error in analysis' if match_status == 'error' else self._get_recommendation(0.0, 0.0)
+        }
+    
     def _preprocess_text(self, text: str) -> str:
         """
         Preprocess text for better TF-IDF vectorization
@@ -139,70 +440,78 @@ class MatchingEngine:
         if not text:
             return ""
         
-        # Convert to lowercase
+        # Convert to lowercase; whitespace runs need no collapsing since split() below ignores them
         text = text.lower()
         
-        # Remove extra whitespace
-        text = re.sub(r'\s+', ' ', text)
-        
         # Remove special characters but keep important ones
-        text = re.sub(r'[^\w\s\.\-\+\#]', ' ', text)
+        text = _PUNCTUATION_RE.sub(' ', text)
         
         # Handle common programming language patterns
-        text = re.sub(r'\b(c\+\+|c\#|\.net|node\.js|react\.js|vue\.js)\b', 
-                     lambda m: m.group().replace('.', '').replace('+', 'plus').replace('#', 'sharp'), text)
+        text = _LANGUAGE_TOKEN_RE.sub(
+            lambda m: m.group().replace('.', '').replace('+', 'plus').replace('#', 'sharp'), text
+        )
         
         # Remove standalone numbers and very short words
-        words = text.split()
-        filtered_words = []
-        for word in words:
-            if len(word) > 1 and not word.isdigit():
-                filtered_words.append(word)
+        return ' '.join([word for word in text.split() if len(word) > 1 and not word.isdigit()])
+    
+    def _extract_job_keywords(self, job_text: str) -> set:
+        """
+        Collect the keywords of a job description used for keyword matching
         
-        return ' '.join(filtered_words)
+        Args:
+            job_text: Processed job description text
+            
+        Returns:
+            Set of job keywords
+        """
+        # Common technical keywords and skills
+        important_keywords = [
+            'python', 'java', 'javascript', 'react', 'node', 'sql', 'html', 'css',
+            'aws', 'azure', 'docker', 'kubernetes', 'git', 'api', 'rest', 'json',
+            'mongodb', 'postgresql', 'mysql', 'machine learning', 'ai', 'data science',
+            'frontend', 'backend', 'fullstack', 'agile', 'scrum', 'ci/cd', 'devops'
+        ]
+        
+        job_lower = job_text.lower()
+        job_words = set(job_lower.split())
+        
+        # Find important keywords in job description
+        job_keywords = set()
+        for keyword in important_keywords:
+            if keyword in job_lower:
+                job_keywords.add(keyword)
+        
+        # Also add significant words from job description, longest first as a cheap
+        # proxy for specificity so the same job always yields the same keywords
+        job_significant = sorted((word for word in job_words if len(word) > 3), key=lambda word: (-len(word), word))
+        job_keywords.update(job_significant[:20])  # Top 20 significant words
+        
+        return job_keywords
     
-    def _calculate_keyword_match(self, resume_text: str, job_text: str) -> float:
+    def _calculate_keyword_match(self, resume_text: str, job_text: str,
+                                 job_keywords: Optional[set] = None,
+                                 keyword_matcher: Optional[Tuple] = None) -> float:
         """
         Calculate keyword matching score between resume and job description
         
         Args:
             resume_text: Processed resume text
             job_text: Processed job description text
+            job_keywords: Precomputed keywords of the job, extracted if omitted
+            keyword_matcher: Matcher built from job_keywords by _compile_keywords
             
         Returns:
             Keyword match score between 0 and 1
         """
         try:
-            # Common technical keywords and skills
-            important_keywords = [
-                'python', 'java', 'javascript', 'react', 'node', 'sql', 'html', 'css',
-                'aws', 'azure', 'docker', 'kubernetes', 'git', 'api', 'rest', 'json',
-                'mongodb', 'postgresql', 'mysql', 'machine learning', 'ai', 'data science',
-                'frontend', 'backend', 'fullstack', 'agile', 'scrum', 'ci/cd', 'devops'
-            ]
-            
-            # Extract words from both texts
-            resume_words = set(resume_text.lower().split())
-            job_words = set(job_text.lower().split())
-            
-            # Find important keywords in job description
-            job_keywords = set()
-            for keyword in important_keywords:
-                if keyword in job_text.lower():
-                    job_keywords.add(keyword)
-            
-            # Also add significant words from job description
-            job_significant = {word for word in job_words if len(word) > 3}
-            job_keywords.update(list(job_significant)[:20])  # Top 20 significant words
+            if job_keywords is None:
+                job_keywords = self._extract_job_keywords(job_text)
             
             if not job_keywords:
                 return 0.5  # Neutral score if no keywords found
             
-            # Count matches in resume
-            matches = 0
-            for keyword in job_keywords:
-                if keyword in resume_text.lower():
-                    matches += 1
+            # Count matches in resume with one scan for all keywords
+            matches = len(self._find_keywords(resume_text.lower(), job_keywords, keyword_matcher))
             
             # Calculate match percentage
             match_score = matches / len(job_keywords)
@@ -212,6 +521,48 @@ class MatchingEngine:
             print(f"Error in keyword matching: {e}")
             return 0.0
     
+    def _compile_keywords(self, keywords: set) -> Tuple[re.Pattern, Dict[str, frozenset]]:
+        """
+        Build a matcher for a keyword set: one pattern reporting the longest keyword
+        at each position, and for each keyword the keywords it contains as a prefix
+        """
+        alternation = '|'.join(re.escape(keyword) for keyword in sorted(keywords, key=len, reverse=True))
+        
+        # A match also proves every keyword that is a prefix of it; resolving that
+        # here leaves each resume with one lookup per distinct match
+        prefixes = {
+            keyword: frozenset(prefix for prefix in keywords if keyword.startswith(prefix))
+            for keyword in keywords
+        }
+        return re.compile('(?=(' + alternation + '))'), prefixes
+    
+    def _find_keywords(self, text_lower: str, keywords: set,
+                       keyword_matcher: Optional[Tuple] = None) -> set:
+        """
+        Return the keywords that occur as substrings of text_lower, in one regex scan
+        
+        Args:
+            text_lower: Lowercased text to search
+            keywords: Keywords to look for
+            keyword_matcher: Matcher built from keywords, built and cached if omitted
+            
+        Returns:
+            Set of keywords found in the text
+        """
+        if keyword_matcher is None:
+            keyword_set = frozenset(keywords)
+            if self._keyword_matcher is None or self._keyword_matcher[0] != keyword_set:
+                self._keyword_matcher = (keyword_set, self._compile_keywords(keyword_set))
+            keyword_matcher = self._keyword_matcher[1]
+        
+        keyword_re, prefixes = keyword_matcher
+        matched = set(keyword_re.findall(text_lower))
+        if not matched:
+            return set()
+        
+        # Keywords that are prefixes of a longer match at the same position also occur
+        return set().union(*(prefixes[match] for match in matched))
+    
     def extract_key_terms(self, text: str, top_n: int = 20) -> List[Tuple[str, float]]:
         """
         Extract key terms from text using TF-IDF scores
@@ -224,69 +575,36 @@ class MatchingEngine:
             List of (term, score) tuples
         """
         try:
-            cleaned_text = self._preprocess_text(text)
-            
-            # Fit vectorizer on the text
-            tfidf_matrix = self.vectorizer.fit_transform([cleaned_text])
-            
-            # Get feature names and scores
-            feature_names = self.vectorizer.get_feature_names_out()
-            scores = tfidf_matrix.toarray()[0]
-            
-            # Create term-score pairs
-            term_scores = list(zip(feature_names, scores))
-            
-            # Sort by score and return top terms
-            term_scores.sort(key=lambda x: x[1], reverse=True)
+            term_counts = Counter(self.analyzer(self._preprocess_text(text)))
+            if not term_counts:
+                return []
             
-            return term_scores[:top_n]
+            # With IDF fit on this text alone every term has the same IDF, so the
+            # TF-IDF row is the counts scaled to unit length and ranks as they do
+            norm = float(np.sqrt(sum(count * count for count in term_counts.values())))
+            return [(term, term_counts[term] / norm) for term in self._top_count_terms(term_counts, top_n)]
             
         except Exception as e:
             print(f"Error extracting key terms: {e}")
             return []
     
-    def detailed_match_analysis(self, resume_text: str, job_description: str) -> Dict:
+    def detailed_match_analysis(self, resume_text: str, job_description: str,
+                                jd_vec: Optional[Dict] = None) -> Dict:
         """
         Provide detailed analysis of match between resume and job description
         
         Args:
             resume_text: Candidate's resume text
             job_description: Job requirements text
+            jd_vec: Optional result of prepare_jd for this job description
             
         Returns:
             Dictionary with detailed match analysis
         """
         try:
-            # Calculate overall similarity
-            similarity_score = self.calculate_similarity(resume_text, job_description)
-            
-            # Extract key terms from both texts
-            resume_terms = self.extract_key_terms(resume_text, 15)
-            job_terms = self.extract_key_terms(job_description, 15)
-            
-            # Find common terms
-            resume_term_set = set([term for term, score in resume_terms])
-            job_term_set = set([term for term, score in job_terms])
-            common_terms = resume_term_set.intersection(job_term_set)
-            
-            # Calculate term overlap percentage
-            if job_term_set:
-                term_overlap = len(common_terms) / len(job_term_set)
-            else:
-                term_overlap = 0.0
-            
-            # Determine match status
-            match_status = 'shortlisted' if similarity_score >= self.threshold else 'rejected'
-            
-            return {
-                'similarity_score': similarity_score,
-                'match_status': match_status,
-                'term_overlap': term_overlap,
-                'common_terms': list(common_terms),
-                'resume_key_terms': [term for term, score in resume_terms[:10]],
-                'job_key_terms': [term for term, score in job_terms[:10]],
-                'recommendation': self._get_recommendation(similarity_score, term_overlap)
-            }
+            jd_vec = jd_vec or self.prepare_jd(job_description)
+            # One matrix over the job and this resume serves the score and both key-term lists
+            return self.batch_match_analysis([resume_text], job_description, jd_vec)[0]
             
         except Exception as e:
             print(f"Error in detailed match analysis: {e}")
@@ -1,15 +1,43 @@
 import spacy
 import re
+import numpy as np
 from typing import List, Dict, Tuple, Optional
 import string
 from groq_processor import GroqProcessor
 
+# Patterns compiled once at import time
+_WHITESPACE_RE = re.compile(r'\s+')
+_EDUCATION_HEADER_RES = [
+    re.compile(pattern) for pattern in
+    [r'education', r'academic background', r'qualifications', r'educational background']
+]
+_NEXT_SECTION_RES = [
+    re.compile(pattern) for pattern in
+    [r'experience', r'work history', r'employment', r'skills', r'projects', r'achievements']
+]
+_INSTITUTION_RES = [
+    re.compile(pattern, re.IGNORECASE) for pattern in
+    [r'\b\w+\s+university\b', r'\b\w+\s+college\b', r'\b\w+\s+institute\b', r'\b\w+\s+school\b']
+]
+_YEAR_RE = re.compile(r'\b(19[8-9]\d|20[0-3]\d)\b')
+_GPA_RES = [
+    re.compile(pattern) for pattern in
+    [r'gpa[\s:]*(\d+\.?\d*)', r'grade point average[\s:]*(\d+\.?\d*)', r'cgpa[\s:]*(\d+\.?\d*)']
+]
+_ADDITIONAL_SKILL_RES = [
+    re.compile(r'\b[A-Z]{2,8}\b'),  # Acronyms (e.g., API, REST, JSON)
+    re.compile(r'\b\w+\.\w+\b'),    # Dotted technologies (e.g., React.js, Node.js)
+]
+
 class NLPProcessor:
     def __init__(self):
         """Initialize NLP processor with spaCy model and Groq LLM"""
         try:
-            # Try to load the English model
-            self.nlp = spacy.load("en_core_web_sm")
+            # Try to load the English model; only NER is used, so skip the other pipes
+            self.nlp = spacy.load(
+                "en_core_web_sm",
+                disable=["tagger", "parser", "attribute_ruler", "lemmatizer"]
+            )
         except OSError:
             # If model is not available, create a minimal processor
             print("Warning: spaCy English model not found. Using basic text processing.")
@@ -40,6 +68,19 @@ class NLPProcessor:
             'tools': ['git', 'jira', 'confluence', 'slack', 'figma', 'photoshop', 'excel'],
             'frameworks': ['spring', 'hibernate', 'laravel', 'rails', 'asp.net', 'xamarin']
         }
+        
+        # Fold the degree patterns into one alternation scanned once per text; each
+        # pattern gets a named group so matches can be regrouped in pattern order
+        self._degree_re = re.compile(
+            '|'.join(f'(?P<degree{i}>{pattern})' for i, pattern in enumerate(self.degree_patterns)),
+            re.IGNORECASE
+        )
+        # All skills in one whole-word alternation, longest first; the lookahead lets
+        # findall report overlapping matches in a single scan
+        all_skills = {skill for skills in self.skill_keywords.values() for skill in skills}
+        self._skills_re = re.compile(
+            r'(?=\b(' + '|'.join(re.escape(skill) for skill in sorted(all_skills, key=len, reverse=True)) + r')\b)'
+        )
     
     def extract_entities(self, text: str) -> Tuple[List[Dict], List[Dict]]:
         """
@@ -51,45 +92,86 @@ class NLPProcessor:
         Returns:
             Tuple of (education_data, skills_data)
         """
-        # Try using Groq LLM for better structured extraction
-        if self.groq_processor:
-            try:
-                print("🤖 Using Groq LLM for enhanced resume parsing...")
-                education_data, skills_data = self.groq_processor.structure_resume_data(text)
-                
-                # Validate the results
-                if education_data or skills_data:
-                    print(f"✓ Groq extracted {len(education_data)} education entries and {len(skills_data)} skills")
-                    return education_data, skills_data
-                else:
-                    print("⚠️ Groq extraction returned empty results, falling back to basic parsing")
-            except Exception as e:
-                print(f"⚠️ Groq processing failed: {e}, using fallback extraction")
-        
-        # Fallback to basic extraction if Groq is not available or fails
-        print("📝 Using basic pattern-based extraction...")
-        education_data = self._extract_education(text)
-        skills_data = self._extract_skills(text)
-        
-        return education_data, skills_data
+        # A batch of one shares the Groq-then-fallback path with bulk extraction
+        return self.extract_entities_batch([text])[0]
+    
+    def extract_entities_batch(self, texts: List[str], batch_size: int = 64,
+                               n_process: int = 1) -> List[Tuple[List[Dict], List[Dict]]]:
+        """
+        Extract education and skills entities from many resumes at once
+        
+        Groq requests for the batch are in flight concurrently, and resumes
+        that fall back to pattern-based extraction are run through spaCy
+        together with nlp.pipe instead of one document at a time.
+        
+        Args:
+            texts: List of resume text contents
+            batch_size: Number of documents spaCy processes per batch
+            n_process: Number of spaCy worker processes
+            
+        Returns:
+            List of (education_data, skills_data) tuples, in input order
+        """
+        results: List[Optional[Tuple[List[Dict], List[Dict]]]] = [None] * len(texts)
+        
+        # Blank resumes have nothing to send to Groq
+        groq_indices = [i for i, text in enumerate(texts) if text.strip()] if self.groq_processor else []
+        for i, groq_result in zip(groq_indices, self._extract_with_groq([texts[i] for i in groq_indices])):
+            results[i] = groq_result
+        fallback_indices = [i for i, result in enumerate(results) if result is None]
+        
+        if fallback_indices:
+            print(f"📝 Using basic pattern-based extraction for {len(fallback_indices)} resume(s)...")
+            fallback_texts = [texts[i] for i in fallback_indices]
+            
+            if self.nlp:
+                docs = self.nlp.pipe(fallback_texts, batch_size=batch_size, n_process=n_process)
+            else:
+                docs = [None] * len(fallback_texts)
+            
+            for i, text, doc in zip(fallback_indices, fallback_texts, docs):
+                results[i] = (self._extract_education(text), self._extract_skills(text, doc))
+        
+        return results
+    
+    def _extract_with_groq(self, texts: List[str]) -> List[Optional[Tuple[List[Dict], List[Dict]]]]:
+        """Extract entities with Groq LLM concurrently, None where a result is empty"""
+        if not texts:
+            return []
+        
+        try:
+            print(f"🤖 Using Groq LLM for enhanced resume parsing of {len(texts)} resume(s)...")
+            structured = self.groq_processor.structure_resumes_bulk(texts)
+        except Exception as e:
+            print(f"⚠️ Groq processing failed: {e}, using fallback extraction")
+            return [None] * len(texts)
+        
+        # Validate the results
+        results = [(education_data, skills_data) if education_data or skills_data else None
+                   for education_data, skills_data in structured]
+        empty = results.count(None)
+        if empty:
+            print(f"⚠️ Groq extraction returned empty results for {empty} resume(s), falling back to basic parsing")
+        return results
     
     def _extract_education(self, text: str) -> List[Dict]:
         """Extract education information from text"""
         education_entries = []
         
         try:
-            # Convert to lowercase for pattern matching
+            # Convert to lowercase once for all pattern matching helpers
             text_lower = text.lower()
             
             # Find education section
-            education_section = self._find_education_section(text)
-            if education_section:
-                text_to_process = education_section
+            section_span = self._find_education_section(text_lower)
+            if section_span:
+                start_pos, end_pos = section_span
+                text_to_process, lower_to_process = text[start_pos:end_pos], text_lower[start_pos:end_pos]
             else:
-                text_to_process = text
+                text_to_process, lower_to_process = text, text_lower
             
             # Extract degrees
-            degrees = self._extract_degrees(text_to_process)
+            degrees = self._extract_degrees(text_to_process, lower_to_process)
             
             # Extract institutions
             institutions = self._extract_institutions(text_to_process)
@@ -98,7 +180,7 @@ class NLPProcessor:
             years = self._extract_graduation_years(text_to_process)
             
             # Extract GPA if mentioned
-            gpa = self._extract_gpa(text_to_process)
+            gpa = self._extract_gpa(lower_to_process)
             
             # Combine information
             max_entries = max(len(degrees), len(institutions), 1)
@@ -117,7 +199,7 @@ class NLPProcessor:
             
             # If no structured data found, try to extract any educational keywords
             if not education_entries:
-                fallback_education = self._extract_education_fallback(text)
+                fallback_education = self._extract_education_fallback(text_lower)
                 if fallback_education:
                     education_entries.extend(fallback_education)
                     
@@ -126,8 +208,8 @@ class NLPProcessor:
         
         return education_entries
     
-    def _extract_skills(self, text: str) -> List[Dict]:
-        """Extract skills from text"""
+    def _extract_skills(self, text: str, doc=None) -> List[Dict]:
+        """Extract skills from text, reusing an already processed spaCy doc if given"""
         skills_data = []
         
         try:
@@ -140,11 +222,8 @@ class NLPProcessor:
             # Find all skill matches
             found_skills = set()
             
-            for category, skills in self.skill_keywords.items():
-                for skill in skills:
-                    # Check for exact word matches
-                    if re.search(r'\b' + re.escape(skill) + r'\b', text_clean):
-                        found_skills.add(skill.title())
+            # Check for exact word matches
+            found_skills.update(skill.title() for skill in self._skills_re.findall(text_clean))
             
             # Additional pattern-based skill extraction
             additional_skills = self._extract_additional_skills(text)
@@ -159,7 +238,7 @@ class NLPProcessor:
             
             # If using spaCy, try to extract using NER
             if self.nlp:
-                spacy_skills = self._extract_skills_with_spacy(text)
+                spacy_skills = self._extract_skills_with_spacy(text, doc)
                 for skill in spacy_skills:
                     if skill not in found_skills:
                         skills_data.append({
@@ -172,51 +251,36 @@ class NLPProcessor:
         
         return skills_data
     
-    def _find_education_section(self, text: str) -> Optional[str]:
-        """Find and extract education section from text"""
-        text_lower = text.lower()
-        
+    def _find_education_section(self, text_lower: str) -> Optional[Tuple[int, int]]:
+        """Find the (start, end) span of the education section in lowercased text"""
         # Look for education section headers
-        education_patterns = [
-            r'education',
-            r'academic background',
-            r'qualifications',
-            r'educational background'
-        ]
-        
-        for pattern in education_patterns:
-            match = re.search(pattern, text_lower)
+        for header_re in _EDUCATION_HEADER_RES:
+            match = header_re.search(text_lower)
             if match:
                 start_pos = match.start()
                 
                 # Find the end of the section (next major section)
-                next_section_patterns = [
-                    r'experience',
-                    r'work history',
-                    r'employment',
-                    r'skills',
-                    r'projects',
-                    r'achievements'
-                ]
-                
-                end_pos = len(text)
-                for next_pattern in next_section_patterns:
-                    next_match = re.search(next_pattern, text_lower[start_pos + 100:])
+                end_pos = len(text_lower)
+                for next_section_re in _NEXT_SECTION_RES:
+                    next_match = next_section_re.search(text_lower, start_pos + 100)
                     if next_match:
-                        end_pos = start_pos + 100 + next_match.start()
+                        end_pos = next_match.start()
                         break
                 
-                return text[start_pos:end_pos]
+                return start_pos, end_pos
         
         return None
     
-    def _extract_degrees(self, text: str) -> List[str]:
-        """Extract degree information"""
+    def _extract_degrees(self, text: str, text_lower: str) -> List[str]:
+        """Extract degree information, matching on the lowercased text"""
         degrees = []
-        text_lower = text.lower()
         
-        for pattern in self.degree_patterns:
-            matches = re.finditer(pattern, text_lower, re.IGNORECASE)
+        # Whole-word degree names never overlap, so one scan finds every pattern's matches
+        matches_by_pattern = [[] for _ in self.degree_patterns]
+        for match in self._degree_re.finditer(text_lower):
+            matches_by_pattern[int(match.lastgroup[len('degree'):])].append(match)
+        
+        for matches in matches_by_pattern:
             for match in matches:
                 # Extract some context around the match
                 start = max(0, match.start() - 20)
@@ -224,7 +288,7 @@ class NLPProcessor:
                 context = text[start:end].strip()
                 
                 # Clean up and add to degrees
-                degree = re.sub(r'\s+', ' ', context)
+                degree = _WHITESPACE_RE.sub(' ', context)
                 if degree not in degrees:
                     degrees.append(degree)
         
@@ -235,15 +299,8 @@ class NLPProcessor:
         institutions = []
         
         # Common university/college keywords
-        institution_patterns = [
-            r'\b\w+\s+university\b',
-            r'\b\w+\s+college\b',
-            r'\b\w+\s+institute\b',
-            r'\b\w+\s+school\b'
-        ]
-        
-        for pattern in institution_patterns:
-            matches = re.finditer(pattern, text, re.IGNORECASE)
+        for institution_re in _INSTITUTION_RES:
+            matches = institution_re.finditer(text)
             for match in matches:
                 institution = match.group().strip()
                 if institution not in institutions:
@@ -253,44 +310,21 @@ class NLPProcessor:
     
     def _extract_graduation_years(self, text: str) -> List[int]:
         """Extract graduation years"""
-        years = []
-        
-        # Look for 4-digit years between 1980 and current year + 5
-        year_pattern = r'\b(19[8-9]\d|20[0-3]\d)\b'
-        matches = re.finditer(year_pattern, text)
-        
-        for match in matches:
-            year = int(match.group())
-            if 1980 <= year <= 2030:  # Reasonable range for graduation years
-                years.append(year)
+        # Look for 4-digit years between 1980 and current year + 5, converting all matches at once
+        years = np.array(_YEAR_RE.findall(text), dtype=np.int32)
+        years = years[(years >= 1980) & (years <= 2030)]  # Reasonable range for graduation years
         
-        return sorted(set(years))  # Remove duplicates and sort
+        return np.unique(years).tolist()  # Remove duplicates and sort
     
-    def _extract_gpa(self, text: str) -> List[float]:
-        """Extract GPA information"""
-        gpas = []
-        
-        # Look for GPA patterns
-        gpa_patterns = [
-            r'gpa[\s:]*(\d+\.?\d*)',
-            r'grade point average[\s:]*(\d+\.?\d*)',
-            r'cgpa[\s:]*(\d+\.?\d*)'
-        ]
+    def _extract_gpa(self, text_lower: str) -> List[float]:
+        """Extract GPA information from lowercased text"""
+        # Look for GPA patterns; every captured group is a plain decimal, so all parse at once
+        gpas = np.array([value for gpa_re in _GPA_RES for value in gpa_re.findall(text_lower)], dtype=np.float64)
         
-        for pattern in gpa_patterns:
-            matches = re.finditer(pattern, text.lower())
-            for match in matches:
-                try:
-                    gpa = float(match.group(1))
-                    if 0.0 <= gpa <= 4.0:  # Reasonable GPA range
-                        gpas.append(gpa)
-                except ValueError:
-                    continue
-        
-        return gpas
+        return gpas[(gpas >= 0.0) & (gpas <= 4.0)].tolist()  # Reasonable GPA range
     
-    def _extract_education_fallback(self, text: str) -> List[Dict]:
-        """Fallback method to extract any educational keywords"""
+    def _extract_education_fallback(self, text_lower: str) -> List[Dict]:
+        """Fallback method to extract any educational keywords from lowercased text"""
         education_entries = []
         
         # Common educational terms
@@ -298,7 +332,7 @@ class NLPProcessor:
         
         found_terms = []
         for keyword in edu_keywords:
-            if keyword.lower() in text.lower():
+            if keyword in text_lower:
                 found_terms.append(keyword)
         
         if found_terms:
@@ -316,13 +350,8 @@ class NLPProcessor:
         skills = set()
         
         # Look for skill-like patterns
-        skill_patterns = [
-            r'\b[A-Z]{2,8}\b',  # Acronyms (e.g., API, REST, JSON)
-            r'\b\w+\.\w+\b',    # Dotted technologies (e.g., React.js, Node.js)
-        ]
-        
-        for pattern in skill_patterns:
-            matches = re.finditer(pattern, text)
+        for skill_re in _ADDITIONAL_SKILL_RES:
+            matches = skill_re.finditer(text)
             for match in matches:
                 potential_skill = match.group()
                 # Filter out common non-skill acronyms
@@ -331,7 +360,7 @@ class NLPProcessor:
         
         return skills
     
-    def _extract_skills_with_spacy(self, text: str) -> List[str]:
+    def _extract_skills_with_spacy(self, text: str, doc=None) -> List[str]:
         """Extract skills using spaCy NER if available"""
         if not self.nlp:
             return []
@@ -339,7 +368,8 @@ class NLPProcessor:
         skills = []
         
         try:
-            doc = self.nlp(text)
+            if doc is None:
+                doc = self.nlp(text)
             
             # Extract entities that might be skills
             for ent in doc.ents:
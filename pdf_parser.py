@@ -1,62 +1,333 @@
 import fitz  # PyMuPDF
 import re
-from typing import Optional, Dict, Any
+import contextlib
+import logging
+import threading
+from collections import OrderedDict
+from operator import itemgetter
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from pathlib import Path
+from typing import Optional, Dict, Any, List, Union
 import io
+import numpy as np
+
+from utils import compute_content_hash
+
+_log = logging.getLogger(__name__)
+
+# Groq enhancement is optional; resolve the class once instead of in every parser
+try:
+    from groq_processor import GroqProcessor
+except Exception as e:
+    GroqProcessor = None
+    print(f"Note: PDF parser using basic extraction only: {e}")
+
+# Patterns compiled once at import time
+_WHITESPACE_RE = re.compile(r'\s+')
+_SPECIAL_CHARS_RE = re.compile(r'[^\w\s\.\,\-\(\)\@\+\/\&\%\$\#\!\?\:\;]')
+# ASCII bytes _SPECIAL_CHARS_RE would remove, deleted with bytes.translate for ASCII-only text
+_SPECIAL_CHARS_BYTES = bytes(
+    b for b in range(128)
+    if not (chr(b).isalnum() or chr(b).isspace() or chr(b) in "_.,-()@+/&%$#!?:;")
+)
+# Per-byte classes for the compiled cleaner: deleted, kept, or whitespace
+_CHAR_DELETE, _CHAR_KEEP, _CHAR_SPACE = 0, 1, 2
+_CHAR_CLASSES = np.array(
+    [_CHAR_SPACE if chr(b).isspace() else _CHAR_DELETE if b in _SPECIAL_CHARS_BYTES else _CHAR_KEEP
+     for b in range(128)],
+    dtype=np.uint8
+)
+# Section keywords as one alternation with a named group per section; the lookahead
+# lets matches overlap so no section's first occurrence is consumed by another's
+_SECTION_RE = re.compile(
+    r'(?=(?P<experience>experience|work history|employment|professional experience)'
+    r'|(?P<education>education|academic|qualifications|degrees)'
+    r'|(?P<skills>skills|technical skills|competencies|expertise)'
+    r'|(?P<summary>summary|objective|profile|about))',
+    re.IGNORECASE
+)
+# Metadata keys reported by extract_metadata and the PyMuPDF keys they are read from
+_METADATA_FIELDS = (
+    ('title', 'title'),
+    ('author', 'author'),
+    ('subject', 'subject'),
+    ('creator', 'creator'),
+    ('producer', 'producer'),
+    ('creation_date', 'creationDate'),
+    ('modification_date', 'modDate')
+)
+# Result template copied by extract_sections
+_EMPTY_SECTIONS = dict.fromkeys(('contact', 'summary', 'experience', 'education', 'skills', 'other'), '')
+
+# Numba compiles the single-pass cleaner for large ASCII texts when installed;
+# without it the kernel stays plain Python and _clean_text keeps the regex path
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+def _clean_ascii_kernel(data, out, char_classes):
+    """Collapse whitespace runs to one space and drop special bytes, returning the output length"""
+    length = 0
+    in_space = False
+    for i in range(data.shape[0]):
+        char_class = char_classes[data[i]]
+        if char_class == _CHAR_KEEP:
+            out[length] = data[i]
+            length += 1
+            in_space = False
+        elif char_class == _CHAR_SPACE:
+            if not in_space:
+                out[length] = 0x20
+                length += 1
+                in_space = True
+        else:
+            # Whitespace on either side of a dropped byte belongs to separate runs
+            in_space = False
+    return length
+
+if njit is not None:
+    _clean_ascii_kernel = njit(cache=True, boundscheck=False)(_clean_ascii_kernel)
+
+def _clean_ascii(text: str) -> str:
+    """Clean an ASCII-only text with _clean_ascii_kernel, as _clean_text would"""
+    data = np.frombuffer(text.encode('ascii'), dtype=np.uint8)
+    out = np.empty_like(data)
+    length = _clean_ascii_kernel(data, out, _CHAR_CLASSES)
+    return out[:length].tobytes().decode('ascii').strip()
+
+def _extract_page_range(pdf_content: bytes, start: int, stop: int) -> List[str]:
+    """Extract the raw text of pages [start, stop) inside a worker process"""
+    # PyMuPDF documents must not be shared across threads, so each worker opens its own
+    with contextlib.closing(fitz.open(stream=pdf_content, filetype="pdf")) as pdf_document:
+        return [pdf_document[page_num].get_text("text") for page_num in range(start, stop)]
 
 class PDFParser:
+    # Pages needed before extract_text spreads a document over worker processes
+    PARALLEL_MIN_PAGES = 4
+    # Texts at least this long, mostly ASCII and with this many recognized sections
+    # are already well structured and skip Groq enhancement
+    STRUCTURED_MIN_WORDS = 200
+    STRUCTURED_MIN_ASCII_RATIO = 0.95
+    STRUCTURED_MIN_SECTIONS = 2
+    # Leading characters sampled for the ASCII ratio
+    ASCII_SAMPLE_CHARS = 2000
+    # ASCII texts at least this long are cleaned by the compiled kernel when Numba is installed
+    COMPILED_CLEAN_MIN_CHARS = 16 * 1024
+    
     def __init__(self):
         """Initialize PDF parser using PyMuPDF with Groq enhancement"""
+        # LRU cache of finished extract_text results keyed by content hash; get_parser
+        # shares one parser across threads, so access is locked
+        self.cache_size = 256
+        self._text_cache: OrderedDict = OrderedDict()
+        self._text_cache_lock = threading.Lock()
         self.groq_processor = None
-        try:
-            from groq_processor import GroqProcessor
-            self.groq_processor = GroqProcessor()
-            print("✓ PDF parser enhanced with Groq LLM for better text processing")
-        except Exception as e:
-            print(f"Note: PDF parser using basic extraction only: {e}")
-            pass
+        if GroqProcessor is not None:
+            try:
+                self.groq_processor = GroqProcessor()
+                print("✓ PDF parser enhanced with Groq LLM for better text processing")
+            except Exception as e:
+                print(f"Note: PDF parser using basic extraction only: {e}")
     
-    def extract_text(self, pdf_content: bytes) -> str:
+    def extract_text(self, pdf_content: bytes, workers: Optional[int] = None) -> str:
         """
         Extract text content from PDF bytes using PyMuPDF
         
         Args:
             pdf_content: PDF file content as bytes
+            workers: Optional number of worker processes that extract page ranges
+                concurrently for documents of at least PARALLEL_MIN_PAGES pages
             
         Returns:
             Extracted text as string
         """
+        # Re-processed PDFs skip parsing, cleaning and Groq entirely
+        content_hash = compute_content_hash(pdf_content)
+        with self._text_cache_lock:
+            if content_hash in self._text_cache:
+                self._text_cache.move_to_end(content_hash)
+                return self._text_cache[content_hash]
+        
         try:
-            # Create a PyMuPDF document from bytes
-            pdf_document = fitz.open(stream=pdf_content, filetype="pdf")
+            with self._open(pdf_content) as pdf_document:
+                page_count = pdf_document.page_count
+                if workers and workers > 1 and page_count >= self.PARALLEL_MIN_PAGES:
+                    page_texts = None
+                else:
+                    page_texts = [page.get_text("text") for page in pdf_document]
             
-            extracted_text = ""
+            if page_texts is None:
+                page_texts = self._extract_pages_parallel(pdf_content, page_count, workers)
             
-            # Iterate through all pages
-            for page_num in range(pdf_document.page_count):
-                page = pdf_document[page_num]
-                
-                # Extract text from the page
-                page_text = page.get_text()
-                
-                # Clean and normalize the text
-                page_text = self._clean_text(page_text)
-                extracted_text += page_text + "\n"
+            text = self._finish_text(page_texts)
             
-            pdf_document.close()
+        except Exception as e:
+            raise Exception(f"Failed to extract text from PDF: {str(e)}")
+        
+        with self._text_cache_lock:
+            self._text_cache[content_hash] = text
+            if len(self._text_cache) > self.cache_size:
+                self._text_cache.popitem(last=False)
+        return text
+    
+    def parse_all(self, pdf_content: bytes) -> Dict[str, Any]:
+        """
+        Validate a PDF, extract its text and read its metadata from one open document
+        
+        Args:
+            pdf_content: PDF file content as bytes
             
-            # Enhance text with Groq if available
-            if self.groq_processor and extracted_text.strip():
-                try:
-                    enhanced_text = self.groq_processor.enhance_resume_text(extracted_text)
-                    print("✓ Resume text enhanced with Groq LLM for better semantic analysis")
-                    return enhanced_text
-                except Exception as e:
-                    print(f"Note: Using basic text extraction: {e}")
+        Returns:
+            Dictionary with 'text', 'metadata' and 'validation' entries, each as
+            returned by extract_text, extract_metadata and validate_pdf
+        """
+        try:
+            with self._open(pdf_content) as pdf_document:
+                validation = self._validate_document(pdf_document)
+                metadata = self._document_metadata(pdf_document)
+                page_texts = [page.get_text("text") for page in pdf_document] if validation['is_valid'] else None
             
-            return extracted_text.strip()
+            text = self._finish_text(page_texts) if page_texts is not None else ""
+            return {'text': text, 'metadata': metadata, 'validation': validation}
             
         except Exception as e:
-            raise Exception(f"Failed to extract text from PDF: {str(e)}")
+            return {
+                'text': "",
+                'metadata': {'error': f"Failed to extract metadata: {str(e)}"},
+                'validation': {
+                    'is_valid': False,
+                    'messages': [f"PDF validation failed: {str(e)}"],
+                    'page_count': 0
+                }
+            }
+    
+    def _open(self, pdf_content: bytes):
+        """Open PDF bytes as a PyMuPDF document that closes when the with-block exits"""
+        return contextlib.closing(fitz.open(stream=pdf_content, filetype="pdf"))
+    
+    def _extract_pages_parallel(self, pdf_content: bytes, page_count: int, workers: int) -> List[str]:
+        """Extract raw page texts in contiguous page ranges across worker processes, in page order"""
+        workers = min(workers, page_count)
+        bounds = [page_count * i // workers for i in range(workers + 1)]
+        
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            ranges = executor.map(_extract_page_range, [pdf_content] * workers, bounds[:-1], bounds[1:])
+            return [page_text for page_range in ranges for page_text in page_range]
+    
+    def extract_texts(self, pdf_contents: List[bytes]) -> List[Optional[str]]:
+        """
+        Extract text from many PDFs, enhancing them with Groq in one concurrent batch
+        
+        Args:
+            pdf_contents: List of PDF file contents as bytes
+            
+        Returns:
+            List of extracted texts in input order, None where a PDF could not be read
+        """
+        texts: List[Optional[str]] = []
+        for pdf_content in pdf_contents:
+            try:
+                with self._open(pdf_content) as pdf_document:
+                    texts.append(self._join_pages([page.get_text("text") for page in pdf_document]).strip())
+            except Exception as e:
+                _log.error("Failed to extract text from PDF: %s", e)
+                texts.append(None)
+        
+        # Enhance the texts that need it with Groq, sharing one batch of requests
+        enhance_indices = [i for i, text in enumerate(texts) if text and self.needs_enhancement(text)]
+        if enhance_indices:
+            try:
+                enhanced_texts = self.groq_processor.enhance_resume_texts([texts[i] for i in enhance_indices])
+                for i, enhanced_text in zip(enhance_indices, enhanced_texts):
+                    texts[i] = enhanced_text
+            except Exception as e:
+                _log.warning("Using basic text extraction: %s", e)
+        
+        return texts
+    
+    def extract_texts_from_paths(self, paths: List[Union[str, Path]],
+                                 max_workers: int = 8) -> List[Optional[str]]:
+        """
+        Read many PDFs from disk concurrently and extract their texts as one batch
+        
+        Args:
+            paths: List of PDF file paths
+            max_workers: Maximum number of files read at the same time
+            
+        Returns:
+            List of extracted texts in input order, None where a file could not
+            be read or parsed
+        """
+        def read(path: Union[str, Path]) -> Optional[bytes]:
+            try:
+                return Path(path).read_bytes()
+            except OSError as e:
+                _log.error("Failed to read PDF %s: %s", path, e)
+                return None
+        
+        if not paths:
+            return []
+        
+        # Reads release the GIL, so many files are in flight at once
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(paths))) as executor:
+            contents = list(executor.map(read, paths))
+        
+        texts: List[Optional[str]] = [None] * len(paths)
+        readable = [i for i, content in enumerate(contents) if content is not None]
+        for i, text in zip(readable, self.extract_texts([contents[i] for i in readable])):
+            texts[i] = text
+        
+        return texts
+    
+    def _join_pages(self, page_texts: List[str]) -> str:
+        """Clean every page's plain text, joining once instead of growing a string"""
+        return "\n".join([self._clean_text(page_text) for page_text in page_texts])
+    
+    def _finish_text(self, page_texts: List[str]) -> str:
+        """Clean, join and optionally enhance the raw texts of a document's pages"""
+        extracted_text = self._join_pages(page_texts)
+        
+        # Enhance text with Groq if available and the text is not already well structured
+        if extracted_text.strip() and self.needs_enhancement(extracted_text):
+            try:
+                return self.groq_processor.enhance_resume_text(extracted_text)
+            except Exception as e:
+                print(f"Note: Using basic text extraction: {e}")
+        
+        return extracted_text.strip()
+    
+    def needs_enhancement(self, text: str) -> bool:
+        """
+        Check whether extracted text is worth a Groq enhancement request
+        
+        Long, mostly ASCII texts with recognizable resume sections are already
+        structured well enough, so the network round-trip is skipped for them.
+        
+        Args:
+            text: Cleaned extracted text
+            
+        Returns:
+            True when Groq is available and the text does not look structured
+        """
+        if self.groq_processor is None:
+            return False
+        
+        # _clean_text leaves single spaces between words and newlines between pages
+        word_count = text.count(' ') + text.count('\n') + 1
+        if word_count < self.STRUCTURED_MIN_WORDS:
+            return True
+        
+        sample = text[:self.ASCII_SAMPLE_CHARS]
+        if len(sample.encode('ascii', errors='ignore')) / len(sample) < self.STRUCTURED_MIN_ASCII_RATIO:
+            return True
+        
+        sections = set()
+        for match in _SECTION_RE.finditer(text):
+            sections.add(match.lastgroup)
+            if len(sections) >= self.STRUCTURED_MIN_SECTIONS:
+                return False
+        return True
     
     def _clean_text(self, text: str) -> str:
         """
@@ -71,14 +342,19 @@ class PDFParser:
         if not text:
             return ""
         
-        # Remove excessive whitespace and newlines
-        text = re.sub(r'\s+', ' ', text)
+        if njit is not None and len(text) >= self.COMPILED_CLEAN_MIN_CHARS and text.isascii():
+            return _clean_ascii(text)
         
-        # Remove special characters that might interfere with processing
-        text = re.sub(r'[^\w\s\.\,\-\(\)\@\+\/\&\%\$\#\!\?\:\;]', '', text)
+        # Remove excessive whitespace and newlines; no line breaks survive this,
+        # so there is nothing left to normalize afterwards
+        text = _WHITESPACE_RE.sub(' ', text)
         
-        # Normalize line breaks
-        text = re.sub(r'\n+', '\n', text)
+        # Remove special characters that might interfere with processing; plain
+        # ASCII text takes the byte-level translate instead of the regex engine
+        if text.isascii():
+            text = text.encode('ascii').translate(None, _SPECIAL_CHARS_BYTES).decode('ascii')
+        else:
+            text = _SPECIAL_CHARS_RE.sub('', text)
         
         # Remove leading/trailing whitespace
         text = text.strip()
@@ -96,26 +372,19 @@ class PDFParser:
             Dictionary containing PDF metadata
         """
         try:
-            pdf_document = fitz.open(stream=pdf_content, filetype="pdf")
-            
-            metadata = {
-                'page_count': pdf_document.page_count,
-                'title': pdf_document.metadata.get('title', ''),
-                'author': pdf_document.metadata.get('author', ''),
-                'subject': pdf_document.metadata.get('subject', ''),
-                'creator': pdf_document.metadata.get('creator', ''),
-                'producer': pdf_document.metadata.get('producer', ''),
-                'creation_date': pdf_document.metadata.get('creationDate', ''),
-                'modification_date': pdf_document.metadata.get('modDate', '')
-            }
-            
-            pdf_document.close()
-            
-            return metadata
+            with self._open(pdf_content) as pdf_document:
+                return self._document_metadata(pdf_document)
             
         except Exception as e:
             return {'error': f"Failed to extract metadata: {str(e)}"}
     
+    def _document_metadata(self, pdf_document) -> Dict[str, Any]:
+        """Read the metadata of an open document"""
+        document_metadata = pdf_document.metadata or {}
+        metadata = {'page_count': pdf_document.page_count}
+        metadata.update({key: document_metadata.get(source, '') for key, source in _METADATA_FIELDS})
+        return metadata
+    
     def validate_pdf(self, pdf_content: bytes) -> Dict[str, Any]:
         """
         Validate PDF file and return validation results
@@ -127,36 +396,8 @@ class PDFParser:
             Dictionary containing validation results
         """
         try:
-            pdf_document = fitz.open(stream=pdf_content, filetype="pdf")
-            
-            # Basic validation
-            is_valid = True
-            messages = []
-            
-            # Check if PDF can be opened
-            if pdf_document.page_count == 0:
-                is_valid = False
-                messages.append("PDF has no pages")
-            
-            # Check if text can be extracted
-            try:
-                first_page = pdf_document[0]
-                first_page_text = first_page.get_text()
-                
-                if not first_page_text.strip():
-                    messages.append("Warning: No text found on first page - might be image-based PDF")
-                
-            except Exception:
-                is_valid = False
-                messages.append("Cannot extract text from PDF")
-            
-            pdf_document.close()
-            
-            return {
-                'is_valid': is_valid,
-                'messages': messages,
-                'page_count': pdf_document.page_count if is_valid else 0
-            }
+            with self._open(pdf_content) as pdf_document:
+                return self._validate_document(pdf_document)
             
         except Exception as e:
             return {
@@ -165,6 +406,35 @@ class PDFParser:
                 'page_count': 0
             }
     
+    def _validate_document(self, pdf_document) -> Dict[str, Any]:
+        """Validate an open document, reading the page count before it is closed"""
+        # Basic validation
+        is_valid = True
+        messages = []
+        
+        # Check if PDF can be opened
+        if pdf_document.page_count == 0:
+            is_valid = False
+            messages.append("PDF has no pages")
+        
+        # Check if text can be extracted
+        try:
+            first_page = pdf_document[0]
+            first_page_text = first_page.get_text()
+            
+            if not first_page_text.strip():
+                messages.append("Warning: No text found on first page - might be image-based PDF")
+            
+        except Exception:
+            is_valid = False
+            messages.append("Cannot extract text from PDF")
+        
+        return {
+            'is_valid': is_valid,
+            'messages': messages,
+            'page_count': pdf_document.page_count if is_valid else 0
+        }
+    
     def extract_sections(self, text: str) -> Dict[str, str]:
         """
         Attempt to identify and extract common resume sections
@@ -175,36 +445,20 @@ class PDFParser:
         Returns:
             Dictionary with identified sections
         """
-        sections = {
-            'contact': '',
-            'summary': '',
-            'experience': '',
-            'education': '',
-            'skills': '',
-            'other': ''
-        }
+        sections = _EMPTY_SECTIONS.copy()
+        if not text:
+            return sections
         
         try:
-            # Convert to lowercase for pattern matching
-            text_lower = text.lower()
-            
-            # Define section keywords
-            section_patterns = {
-                'experience': r'(experience|work history|employment|professional experience)',
-                'education': r'(education|academic|qualifications|degrees)',
-                'skills': r'(skills|technical skills|competencies|expertise)',
-                'summary': r'(summary|objective|profile|about)'
-            }
-            
-            # Find section positions
+            # Find the first position of each section in one case-insensitive scan
             section_positions = {}
-            for section_name, pattern in section_patterns.items():
-                match = re.search(pattern, text_lower)
-                if match:
-                    section_positions[section_name] = match.start()
+            for match in _SECTION_RE.finditer(text):
+                section_positions.setdefault(match.lastgroup, match.start())
+                if len(section_positions) == _SECTION_RE.groups:
+                    break
             
             # Sort sections by position
-            sorted_sections = sorted(section_positions.items(), key=lambda x: x[1])
+            sorted_sections = sorted(section_positions.items(), key=itemgetter(1))
             
             # Extract content between sections
             for i, (section_name, start_pos) in enumerate(sorted_sections):
@@ -222,3 +476,15 @@ class PDFParser:
             # If section extraction fails, return original text in 'other'
             sections['other'] = text
             return sections
+
+# Parser shared by callers that do not need their own instance, created on first use
+_default_parser: Optional[PDFParser] = None
+_default_parser_lock = threading.Lock()
+
+def get_parser() -> PDFParser:
+    """Return the shared PDF parser, constructing it and its Groq processor only once"""
+    global _default_parser
+    with _default_parser_lock:
+        if _default_parser is None:
+            _default_parser = PDFParser()
+        return _default_parser
@@ -0,0 +1,152 @@
+import atexit
+import sqlite3
+import tempfile
+import unittest
+import sys
+from pathlib import Path
+from unittest import mock
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import database
+
+# Tables as the first release of the app created them, before any migrations
+BASELINE_SCHEMA = """
+    CREATE TABLE candidates (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        full_name TEXT NOT NULL,
+        email TEXT UNIQUE NOT NULL,
+        phone TEXT NOT NULL,
+        location TEXT,
+        experience_years INTEGER DEFAULT 0,
+        resume_text TEXT,
+        status TEXT DEFAULT 'pending',
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    );
+    CREATE TABLE education (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        candidate_id INTEGER,
+        degree TEXT,
+        institution TEXT,
+        graduation_year INTEGER,
+        gpa REAL,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        FOREIGN KEY (candidate_id) REFERENCES candidates (id) ON DELETE CASCADE
+    );
+    CREATE TABLE skills (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        candidate_id INTEGER,
+        skill TEXT NOT NULL,
+        proficiency_level TEXT,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        FOREIGN KEY (candidate_id) REFERENCES candidates (id) ON DELETE CASCADE
+    );
+    CREATE TABLE job_requirements (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        title TEXT NOT NULL,
+        description TEXT NOT NULL,
+        min_experience INTEGER DEFAULT 0,
+        min_gpa REAL DEFAULT 0.0,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    );
+    CREATE TABLE candidate_files (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        candidate_id INTEGER,
+        original_filename TEXT NOT NULL,
+        stored_filename TEXT NOT NULL,
+        file_path TEXT NOT NULL,
+        file_type TEXT NOT NULL,
+        file_size INTEGER,
+        file_hash TEXT,
+        upload_date TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        FOREIGN KEY (candidate_id) REFERENCES candidates (id) ON DELETE CASCADE
+    );
+"""
+
+class BaselineMigrationTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.db_path = str(Path(self.tmp_dir.name) / "baseline.db")
+        
+        conn = sqlite3.connect(self.db_path)
+        conn.executescript(BASELINE_SCHEMA)
+        conn.executemany(
+            "INSERT INTO candidates (full_name, email, phone, experience_years, resume_text, status) "
+            "VALUES (?, ?, ?, ?, ?, ?)",
+            [("Ada Lovelace", "ada@example.com", "555-0100", 7, "Ada's resume", "shortlisted"),
+             ("Alan Turing", "alan@example.com", "555-0101", 3, "Alan's resume", "pending"),
+             ("Grace Hopper", "grace@example.com", "555-0102", 12, "Grace's resume", "rejected")]
+        )
+        # The highest id was deleted, so a rebuilt table must not hand it out again
+        conn.execute("DELETE FROM candidates WHERE id = 3")
+        conn.execute("INSERT INTO education (candidate_id, degree, institution) VALUES (1, 'BSc', 'London')")
+        conn.execute("INSERT INTO skills (candidate_id, skill) VALUES (2, 'Cryptanalysis')")
+        conn.execute(
+            "INSERT INTO candidate_files (candidate_id, original_filename, stored_filename, file_path, file_type) "
+            "VALUES (1, 'ada.pdf', 'stored.pdf', 'files/stored.pdf', 'pdf')"
+        )
+        conn.execute("INSERT INTO job_requirements (title, description) VALUES ('Engineer', 'Build things')")
+        conn.commit()
+        conn.close()
+    
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+    
+    def _open(self) -> database.DatabaseManager:
+        db = database.DatabaseManager(self.db_path)
+        atexit.unregister(db._close_all)
+        self.addCleanup(db._close_all)
+        return db
+    
+    def _check_migrated(self, db: database.DatabaseManager):
+        conn = db._get_conn()
+        columns = db._table_columns(conn.cursor(), 'candidates')
+        self.assertNotIn('resume_text', columns)
+        self.assertTrue({'resume_hash', 'skills_display', 'education_display'} <= columns)
+        
+        self.assertEqual(
+            [tuple(row) for row in conn.execute("SELECT candidate_id, resume_text FROM candidate_texts ORDER BY 1")],
+            [(1, "Ada's resume"), (2, "Alan's resume")]
+        )
+        self.assertEqual(
+            [tuple(row) for row in conn.execute("SELECT id, email, status FROM candidates ORDER BY id")],
+            [(1, "ada@example.com", "shortlisted"), (2, "alan@example.com", "pending")]
+        )
+        
+        # Rows referencing candidates survive the migration
+        self.assertEqual(conn.execute("SELECT COUNT(*) FROM education").fetchone()[0], 1)
+        self.assertEqual(conn.execute("SELECT COUNT(*) FROM skills").fetchone()[0], 1)
+        self.assertEqual(conn.execute("SELECT COUNT(*) FROM candidate_files").fetchone()[0], 1)
+        self.assertEqual(conn.execute("PRAGMA foreign_key_check").fetchall(), [])
+        self.assertEqual(conn.execute("PRAGMA foreign_keys").fetchone()[0], 1)
+        
+        # The migrated schema accepts new candidates without reusing deleted ids
+        candidate_id = db.add_candidate("Katherine Johnson", "katherine@example.com", "555-0103", "Hampton",
+                                        9, "Katherine's resume", [], [])
+        self.assertEqual(candidate_id, 4)
+        with self.assertRaises(database.DuplicateEmailError):
+            db.add_candidate("Ada L.", "ADA@example.com", "555-0104", "", 1, "", [], [])
+        
+        # Deleting a candidate still cascades to its related rows
+        db.delete_candidate(1)
+        self.assertEqual(conn.execute("SELECT COUNT(*) FROM education").fetchone()[0], 0)
+        self.assertEqual(conn.execute("SELECT COUNT(*) FROM candidate_texts WHERE candidate_id = 1").fetchone()[0], 0)
+    
+    def test_drop_column_migration(self):
+        if not database._HAS_DROP_COLUMN:
+            self.skipTest("SQLite is older than 3.35")
+        self._check_migrated(self._open())
+    
+    def test_table_rebuild_migration(self):
+        with mock.patch.object(database, '_HAS_DROP_COLUMN', False):
+            db = self._open()
+        self._check_migrated(db)
+    
+    def test_migrated_database_reopens(self):
+        self._open()
+        self._check_migrated(self._open())
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,95 @@
+import atexit
+import os
+import tempfile
+import unittest
+import importlib.util
+import sys
+from pathlib import Path
+from unittest import mock
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+# The pipeline runs the real parser, NLP and matching components
+HAS_DEPS = all(importlib.util.find_spec(name) is not None
+               for name in ("fitz", "docx", "spacy", "numpy", "sklearn", "groq", "httpx"))
+
+if HAS_DEPS:
+    from database import DatabaseManager
+    from document_parser import DocumentParser
+    from file_storage import FileStorageManager
+    from ingest_pipeline import IngestPipeline
+    from matching_engine import MatchingEngine
+    from nlp_processor import NLPProcessor
+
+RESUME = """Jane Doe
+Summary
+Backend engineer building data pipelines.
+Experience
+Software Engineer at Acme, 2018 - 2023. Built services in Python and SQL on AWS.
+Education
+Bachelor of Science in Computer Science, State University, 2018, GPA 3.7
+Skills
+Python, SQL, Docker, AWS
+"""
+
+def _application(name: str, email: str, filename: str, content: bytes) -> dict:
+    return {'full_name': name, 'email': email, 'phone': '+1-234-567-8900', 'location': 'Remote',
+            'experience_years': 5, 'filename': filename, 'file_content': content}
+
+@unittest.skipUnless(HAS_DEPS, "PyMuPDF, python-docx, spaCy, scikit-learn or the Groq client is not installed")
+class IngestBatchTest(unittest.TestCase):
+    def setUp(self):
+        tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp_dir.cleanup)
+        
+        # Without an API key every component falls back to local processing
+        env = mock.patch.dict(os.environ)
+        env.start()
+        self.addCleanup(env.stop)
+        os.environ.pop('GROQ_API_KEY', None)
+        
+        self.db = DatabaseManager(str(Path(tmp_dir.name) / "ingest.db"))
+        atexit.unregister(self.db._close_all)
+        self.addCleanup(self.db._close_all)
+        self.storage = FileStorageManager(str(Path(tmp_dir.name) / "storage"))
+        self.matching_engine = MatchingEngine()
+        self.pipeline = IngestPipeline(self.db, DocumentParser(), self.storage, NLPProcessor(),
+                                       self.matching_engine, max_workers=2)
+    
+    def test_parses_processes_and_writes_each_application(self):
+        results = self.pipeline.ingest_batch([
+            _application("Jane Doe", "jane@example.com", "jane.txt", RESUME.encode()),
+            _application("John Roe", "john@example.com", "john.txt", RESUME.replace("Jane", "John").encode()),
+            _application("Jane Again", "JANE@example.com", "jane2.txt", RESUME.encode()),
+            _application("Empty", "empty@example.com", "empty.txt", b""),
+        ])
+        
+        # Results keep input order and report each stage's failure
+        self.assertEqual([r['filename'] for r in results], ["jane.txt", "john.txt", "jane2.txt", "empty.txt"])
+        john, empty = results[1], results[3]
+        self.assertIsNotNone(john['candidate_id'])
+        self.assertIsNone(john['error'])
+        self.assertIsNone(empty['candidate_id'])
+        self.assertTrue(empty['error'])
+        
+        # Applications are written as they finish, so either copy of the email may win
+        jane, duplicate = sorted(results[::2][:2], key=lambda r: r['candidate_id'] is None)
+        self.assertIsNotNone(jane['candidate_id'])
+        self.assertEqual(duplicate['candidate_id'], None)
+        self.assertEqual(duplicate['error'], "An application with this email already exists")
+        
+        # The write stage stored the candidate, its text, entities, file and vector
+        details = self.db.get_candidate_details(jane['candidate_id'])
+        self.assertEqual(details['email'].lower(), "jane@example.com")
+        self.assertIn("Backend engineer", details['resume_text'])
+        self.assertTrue(details['skills'])
+        self.assertEqual(len(self.db.get_candidate_files(jane['candidate_id'])), 1)
+        vectors = self.db.get_candidate_vectors(self.matching_engine.VECTOR_VERSION)
+        self.assertEqual(set(vectors), {jane['candidate_id'], john['candidate_id']})
+        
+        # The rejected duplicate left no stored file behind
+        stored = [path for path in Path(self.storage.storage_path).rglob('*') if path.is_file()]
+        self.assertEqual(len(stored), 2)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,80 @@
+import random
+import re
+import string
+import unittest
+import importlib.util
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+# matching_engine builds on scikit-learn and SciPy at module load
+HAS_SKLEARN = importlib.util.find_spec("sklearn") is not None
+
+if HAS_SKLEARN:
+    import matching_engine
+    from sklearn.feature_extraction.text import TfidfVectorizer
+
+WORDS = [
+    'python', 'java', 'sql', 'docker', 'react', 'engineer', 'developer', 'data',
+    'cloud', 'team', 'lead', 'api', 'design', 'testing', 'node.js', 'c++', 'c#'
+]
+
+def _reference_preprocess(text: str) -> str:
+    """_preprocess_text as it was with the whitespace-collapsing pass"""
+    if not text:
+        return ""
+    text = re.sub(r'\s+', ' ', text.lower())
+    text = re.sub(r'[^\w\s\.\-\+\#]', ' ', text)
+    text = re.sub(
+        r'\b(c\+\+|c\#|\.net|node\.js|react\.js|vue\.js)\b',
+        lambda m: m.group().replace('.', '').replace('+', 'plus').replace('#', 'sharp'), text
+    )
+    return ' '.join(word for word in text.split() if len(word) > 1 and not word.isdigit())
+
+@unittest.skipUnless(HAS_SKLEARN, "scikit-learn is not installed")
+class PreprocessTextTest(unittest.TestCase):
+    # Language tokens and punctuation next to every kind of whitespace run
+    ALPHABET = string.ascii_letters + string.digits + string.punctuation + ' \t\n\r\x0b\x0c\x1c\xa0\u2028' + 'é'
+    
+    def setUp(self):
+        self.rng = random.Random(0)
+        self.engine = matching_engine.MatchingEngine()
+    
+    def test_matches_whitespace_collapsing_version(self):
+        pieces = list(self.ALPHABET) + [' c++ ', 'C#', '.NET', 'node.js', 'React.js\t', '\n\nvue.js', '42', 'a']
+        for _ in range(3000):
+            text = ''.join(self.rng.choice(pieces) for _ in range(self.rng.randint(0, 40)))
+            self.assertEqual(self.engine._preprocess_text(text), _reference_preprocess(text), repr(text))
+
+@unittest.skipUnless(HAS_SKLEARN, "scikit-learn is not installed")
+class ExtractKeyTermsTest(unittest.TestCase):
+    def setUp(self):
+        self.rng = random.Random(0)
+        self.engine = matching_engine.MatchingEngine()
+    
+    def _reference_key_terms(self, text: str, top_n: int):
+        """TF-IDF fitted on the text alone, ranked by weight with ties in feature order"""
+        cleaned_text = self.engine._preprocess_text(text)
+        vectorizer = TfidfVectorizer(**self.engine.vectorizer.get_params())
+        row = vectorizer.fit_transform([cleaned_text]).toarray()[0]
+        feature_names = vectorizer.get_feature_names_out()
+        order = sorted(range(len(row)), key=lambda i: (-row[i], feature_names[i]))
+        return [(feature_names[i], float(row[i])) for i in order[:top_n]]
+    
+    def test_matches_single_document_tfidf(self):
+        for _ in range(200):
+            text = ' '.join(self.rng.choice(WORDS) for _ in range(self.rng.randint(1, 40)))
+            top_n = self.rng.randint(1, 25)
+            expected = self._reference_key_terms(text, top_n)
+            actual = self.engine.extract_key_terms(text, top_n)
+            self.assertEqual([term for term, _ in actual], [term for term, _ in expected], text)
+            for (_, weight), (_, expected_weight) in zip(actual, expected):
+                self.assertAlmostEqual(weight, expected_weight, places=5)
+    
+    def test_empty_text_has_no_key_terms(self):
+        self.assertEqual(self.engine.extract_key_terms(''), [])
+        self.assertEqual(self.engine.extract_key_terms('the and of'), [])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,93 @@
+import random
+import re
+import unittest
+import importlib.util
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+# nlp_processor imports spaCy, NumPy and the Groq client at module load
+HAS_DEPS = all(importlib.util.find_spec(name) is not None for name in ("spacy", "numpy", "groq", "httpx"))
+
+if HAS_DEPS:
+    import nlp_processor
+
+DEGREE_WORDS = [
+    'bachelor', 'bachelors', 'ba', 'bs', 'bsc', 'be', 'btech', 'beng', 'master', 'masters',
+    'ma', 'ms', 'msc', 'mba', 'mtech', 'meng', 'phd', 'ph.d', 'doctorate', 'doctoral',
+    'associate', 'diploma', 'certificate', 'basic', 'mast', 'phds', 'Bachelor', 'MBA'
+]
+FILLER = ['of', 'science', 'in', 'computer', 'university', '2019', ',', '.', '-', '\n', '  ']
+
+def _random_text(rng: random.Random) -> str:
+    words = DEGREE_WORDS + FILLER
+    return ' '.join(rng.choice(words) for _ in range(rng.randint(0, 40)))
+
+@unittest.skipUnless(HAS_DEPS, "spaCy, NumPy or the Groq client is not installed")
+class ExtractDegreesTest(unittest.TestCase):
+    def setUp(self):
+        self.rng = random.Random(0)
+        self.processor = nlp_processor.NLPProcessor()
+    
+    def _reference_degrees(self, text: str, text_lower: str):
+        """_extract_degrees as it was, scanning once per degree pattern"""
+        degrees = []
+        for pattern in self.processor.degree_patterns:
+            for match in re.finditer(pattern, text_lower, re.IGNORECASE):
+                start = max(0, match.start() - 20)
+                end = min(len(text), match.end() + 50)
+                degree = re.sub(r'\s+', ' ', text[start:end].strip())
+                if degree not in degrees:
+                    degrees.append(degree)
+        return degrees
+    
+    def test_matches_per_pattern_scan(self):
+        for _ in range(2000):
+            text = _random_text(self.rng)
+            text_lower = text.lower()
+            self.assertEqual(self.processor._extract_degrees(text, text_lower),
+                             self._reference_degrees(text, text_lower), repr(text))
+
+@unittest.skipUnless(HAS_DEPS, "spaCy, NumPy or the Groq client is not installed")
+class ExtractYearsAndGpaTest(unittest.TestCase):
+    PIECES = ['gpa', 'cgpa', 'gpa:', 'grade point average', ' ', ':', '.', '3', '4', '0', '9', '19', '20',
+              '1979', '1980', '2030', '2031', '٣', 'x', '\n']
+    
+    def setUp(self):
+        self.rng = random.Random(0)
+        self.processor = nlp_processor.NLPProcessor()
+    
+    def _random_text(self) -> str:
+        return ''.join(self.rng.choice(self.PIECES) for _ in range(self.rng.randint(0, 30)))
+    
+    def _reference_years(self, text: str):
+        """_extract_graduation_years as it was, parsing each match in a loop"""
+        years = [int(match.group()) for match in nlp_processor._YEAR_RE.finditer(text)]
+        return sorted({year for year in years if 1980 <= year <= 2030})
+    
+    def _reference_gpa(self, text_lower: str):
+        """_extract_gpa as it was, parsing each match in a loop"""
+        gpas = []
+        for gpa_re in nlp_processor._GPA_RES:
+            for match in gpa_re.finditer(text_lower):
+                try:
+                    gpa = float(match.group(1))
+                except ValueError:
+                    continue
+                if 0.0 <= gpa <= 4.0:
+                    gpas.append(gpa)
+        return gpas
+    
+    def test_years_match_loop_version(self):
+        for _ in range(3000):
+            text = self._random_text()
+            self.assertEqual(self.processor._extract_graduation_years(text), self._reference_years(text), repr(text))
+    
+    def test_gpa_matches_loop_version(self):
+        for _ in range(3000):
+            text = self._random_text()
+            self.assertEqual(self.processor._extract_gpa(text), self._reference_gpa(text), repr(text))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,96 @@
+import random
+import re
+import string
+import types
+import unittest
+import importlib.util
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+# pdf_parser imports PyMuPDF at module load but only opens documents through it;
+# the cleanup code under test never does, so a placeholder module is enough
+if importlib.util.find_spec("fitz") is None:
+    sys.modules.setdefault("fitz", types.ModuleType("fitz"))
+
+HAS_NUMPY = importlib.util.find_spec("numpy") is not None
+
+if HAS_NUMPY:
+    import pdf_parser
+
+def _regex_clean(text: str) -> str:
+    """Reference cleanup: the whitespace and special-character regexes, then strip"""
+    text = pdf_parser._WHITESPACE_RE.sub(' ', text)
+    return pdf_parser._SPECIAL_CHARS_RE.sub('', text).strip()
+
+_REFERENCE_SECTION_RES = {
+    'experience': re.compile(r'(experience|work history|employment|professional experience)'),
+    'education': re.compile(r'(education|academic|qualifications|degrees)'),
+    'skills': re.compile(r'(skills|technical skills|competencies|expertise)'),
+    'summary': re.compile(r'(summary|objective|profile|about)')
+}
+
+def _reference_sections(text: str) -> dict:
+    """extract_sections as it was, searching the lowercased text once per section"""
+    sections = pdf_parser._EMPTY_SECTIONS.copy()
+    if not text:
+        return sections
+    text_lower = text.lower()
+    positions = {}
+    for name, section_re in _REFERENCE_SECTION_RES.items():
+        match = section_re.search(text_lower)
+        if match:
+            positions[name] = match.start()
+    ordered = sorted(positions.items(), key=lambda x: x[1])
+    for i, (name, start) in enumerate(ordered):
+        end = ordered[i + 1][1] if i < len(ordered) - 1 else len(text)
+        sections[name] = text[start:end].strip()
+    return sections
+
+@unittest.skipUnless(HAS_NUMPY, "NumPy is not installed")
+class CleanTextEquivalenceTest(unittest.TestCase):
+    # Printable ASCII plus control bytes, extra whitespace and dropped characters
+    ASCII_ALPHABET = string.printable + '\x00\x1c\x1f\x7f' + '~~^^' + '  \t\n'
+    
+    def setUp(self):
+        self.rng = random.Random(0)
+        self.parser = pdf_parser.PDFParser.__new__(pdf_parser.PDFParser)
+    
+    def _random_texts(self, alphabet: str, count: int = 2000):
+        for _ in range(count):
+            yield ''.join(self.rng.choice(alphabet) for _ in range(self.rng.randint(0, 60)))
+    
+    def test_kernel_matches_regex_cleanup(self):
+        # Runs the compiled kernel when Numba is installed and its Python body otherwise
+        for text in self._random_texts(self.ASCII_ALPHABET):
+            self.assertEqual(pdf_parser._clean_ascii(text), _regex_clean(text), repr(text))
+    
+    def test_translate_path_matches_regex_cleanup(self):
+        for text in self._random_texts(self.ASCII_ALPHABET):
+            self.assertEqual(self.parser._clean_text(text), _regex_clean(text), repr(text))
+    
+    def test_non_ascii_text_keeps_unicode_word_characters(self):
+        for text in self._random_texts(self.ASCII_ALPHABET + 'éü€–'):
+            self.assertEqual(self.parser._clean_text(text), _regex_clean(text), repr(text))
+
+@unittest.skipUnless(HAS_NUMPY, "NumPy is not installed")
+class ExtractSectionsTest(unittest.TestCase):
+    # Keywords in mixed case, including ones that overlap ('professional experience',
+    # 'technical skills') and prefixes that must not match on their own
+    PIECES = ['Experience', 'work history', 'EMPLOYMENT', 'professional experience', 'Education',
+              'academic', 'Qualifications', 'degrees', 'SKILLS', 'technical skills', 'competencies',
+              'expertise', 'Summary', 'objective', 'Profile', 'about', 'educat', 'skil', 'prof',
+              'python', '2019', ':', '\n', ' ', '  ']
+    
+    def setUp(self):
+        self.rng = random.Random(0)
+        self.parser = pdf_parser.PDFParser.__new__(pdf_parser.PDFParser)
+    
+    def test_matches_per_section_search(self):
+        for _ in range(2000):
+            text = ''.join(self.rng.choice(self.PIECES) for _ in range(self.rng.randint(0, 30)))
+            self.assertEqual(self.parser.extract_sections(text), _reference_sections(text), repr(text))
+
+if __name__ == '__main__':
+    unittest.main()
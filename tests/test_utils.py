@@ -0,0 +1,62 @@
+import random
+import unittest
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import utils
+
+class CalculateExperienceLevelTest(unittest.TestCase):
+    def _reference_level(self, years) -> str:
+        """calculate_experience_level as it was, as an elif ladder"""
+        if years < 0:
+            return "Unknown"
+        elif years == 0:
+            return "Entry Level"
+        elif years <= 2:
+            return "Junior"
+        elif years <= 5:
+            return "Mid Level"
+        elif years <= 10:
+            return "Senior"
+        else:
+            return "Expert"
+    
+    def test_matches_elif_ladder(self):
+        # Integers and half years around every threshold
+        for half_years in range(-4, 41):
+            years = half_years / 2
+            for value in (years, int(years)):
+                self.assertEqual(utils.calculate_experience_level(value),
+                                 self._reference_level(value), repr(value))
+
+class ExtractNumbersTest(unittest.TestCase):
+    PIECES = ['0', '7', '42', '3.14', '10.', '.5', '1.2.3', 'v2', 'x', ' ', ',', '-', '٣', '٤٥', '\n']
+    
+    def _reference_numbers(self, text: str) -> list:
+        """extract_numbers as it was, converting each match inside try/except"""
+        if not text:
+            return []
+        result = []
+        for num in utils._NUMBER_RE.findall(text):
+            try:
+                if '.' in num:
+                    result.append(float(num))
+                else:
+                    result.append(int(num))
+            except ValueError:
+                continue
+        return result
+    
+    def test_matches_try_except_loop(self):
+        rng = random.Random(0)
+        for _ in range(2000):
+            text = ''.join(rng.choice(self.PIECES) for _ in range(rng.randint(0, 20)))
+            numbers = utils.extract_numbers(text)
+            expected = self._reference_numbers(text)
+            self.assertEqual(numbers, expected, repr(text))
+            self.assertEqual([type(n) for n in numbers], [type(n) for n in expected], repr(text))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,9 +1,36 @@
 import re
 import os
+import atexit
+import logging
+import logging.handlers
+import queue
+from bisect import bisect_left
 from typing import Optional, Dict, Any
 import tempfile
+import hashlib
 from datetime import datetime
 
+# xxh3 is used for content hashes when installed; BLAKE2b otherwise
+try:
+    import xxhash
+except ImportError:
+    xxhash = None
+
+# Loggers of this project's modules that setup_logging enables
+_PROJECT_LOGGERS = ('file_storage', 'groq_processor', 'pdf_parser')
+
+# Patterns compiled once at import time
+_EMAIL_RE = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+_NON_DIGIT_RE = re.compile(r'\D')
+_UNSAFE_FILENAME_CHARS_RE = re.compile(r'[^\w\s\-_\.]')
+_FILENAME_SEPARATORS_RE = re.compile(r'[\s_]+')
+_NUMBER_RE = re.compile(r'\b\d+\.?\d*\b')
+_HTML_TAG_RE = re.compile(r'<[^>]*>')
+_WHITESPACE_RE = re.compile(r'\s+')
+
+# Translation table deleting every ASCII non-digit, for the common all-ASCII phone number
+_ASCII_NON_DIGITS_TABLE = str.maketrans('', '', ''.join(chr(c) for c in range(128) if not chr(c).isdigit()))
+
 def validate_email(email: str) -> bool:
     """
     Validate email address format
@@ -17,9 +44,14 @@ def validate_email(email: str) -> bool:
     if not email:
         return False
     
-    # Basic email regex pattern
-    email_pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-    return re.match(email_pattern, email.strip()) is not None
+    return _EMAIL_RE.match(email.strip()) is not None
+
+def _phone_digits(phone: str) -> str:
+    """Return only the digits of a phone number"""
+    if phone.isascii():
+        return phone.translate(_ASCII_NON_DIGITS_TABLE)
+    # Non-ASCII input may hold other Unicode digits, which \D handles
+    return _NON_DIGIT_RE.sub('', phone)
 
 def validate_phone(phone: str) -> bool:
     """
@@ -35,7 +67,7 @@ def validate_phone(phone: str) -> bool:
         return False
     
     # Remove all non-digit characters
-    digits_only = re.sub(r'\D', '', phone)
+    digits_only = _phone_digits(phone)
     
     # Check if it has reasonable length (10-15 digits)
     return 10 <= len(digits_only) <= 15
@@ -54,7 +86,7 @@ def format_phone(phone: str) -> str:
         return ""
     
     # Extract digits only
-    digits = re.sub(r'\D', '', phone)
+    digits = _phone_digits(phone)
     
     # Format based on length
     if len(digits) == 10:
@@ -81,10 +113,10 @@ def clean_filename(filename: str) -> str:
     filename = os.path.basename(filename)
     
     # Replace unsafe characters
-    safe_chars = re.sub(r'[^\w\s\-_\.]', '_', filename)
+    safe_chars = _UNSAFE_FILENAME_CHARS_RE.sub('_', filename)
     
     # Remove multiple spaces/underscores
-    cleaned = re.sub(r'[\s_]+', '_', safe_chars)
+    cleaned = _FILENAME_SEPARATORS_RE.sub('_', safe_chars)
     
     return cleaned.strip('_')
 
@@ -99,9 +131,20 @@ def save_temp_file(content: bytes, suffix: str = ".pdf") -> str:
     Returns:
         Path to temporary file
     """
-    with tempfile.NamedTemporaryFile(delete=False, suffix=suffix) as temp_file:
-        temp_file.write(content)
-        return temp_file.name
+    # Write straight to the descriptor from a memoryview, skipping the buffered file wrapper
+    fd, temp_path = tempfile.mkstemp(suffix=suffix)
+    try:
+        try:
+            view = memoryview(content)
+            while view:
+                view = view[os.write(fd, view):]
+        finally:
+            os.close(fd)
+    except BaseException:
+        os.unlink(temp_path)
+        raise
+    
+    return temp_path
 
 def delete_file_safely(file_path: str) -> bool:
     """
@@ -113,10 +156,11 @@ def delete_file_safely(file_path: str) -> bool:
     Returns:
         True if deleted successfully, False otherwise
     """
+    # Unlink directly rather than checking existence first: one syscall and no race
     try:
-        if os.path.exists(file_path):
-            os.remove(file_path)
-            return True
+        os.remove(file_path)
+        return True
+    except FileNotFoundError:
         return False
     except Exception:
         return False
@@ -177,21 +221,27 @@ def extract_numbers(text: str) -> list:
     if not text:
         return []
     
-    # Find all number patterns (integers and floats)
-    numbers = re.findall(r'\b\d+\.?\d*\b', text)
-    
-    # Convert to appropriate numeric types
-    result = []
-    for num in numbers:
-        try:
-            if '.' in num:
-                result.append(float(num))
-            else:
-                result.append(int(num))
-        except ValueError:
-            continue
-    
-    return result
+    # Find all number patterns (integers and floats) and convert each to its type;
+    # every match is digits with an optional decimal point, so conversion cannot fail
+    return [float(num) if '.' in num else int(num) for num in _NUMBER_RE.findall(text)]
+
+# Canonical spellings of skills that title case gets wrong, keyed by lowercase name
+_SKILL_NAME_CASES = {
+    'javascript': 'JavaScript',
+    'nodejs': 'Node.js',
+    'reactjs': 'React.js',
+    'vuejs': 'Vue.js',
+    'angularjs': 'Angular.js',
+    'css': 'CSS',
+    'html': 'HTML',
+    'sql': 'SQL',
+    'api': 'API',
+    'rest': 'REST',
+    'json': 'JSON',
+    'xml': 'XML',
+    'aws': 'AWS',
+    'gcp': 'GCP'
+}
 
 def normalize_skill_name(skill: str) -> str:
     """
@@ -206,28 +256,15 @@ def normalize_skill_name(skill: str) -> str:
     if not skill:
         return ""
     
-    # Convert to title case
-    normalized = skill.strip().title()
-    
-    # Handle special cases
-    special_cases = {
-        'Javascript': 'JavaScript',
-        'Nodejs': 'Node.js',
-        'Reactjs': 'React.js',
-        'Vuejs': 'Vue.js',
-        'Angularjs': 'Angular.js',
-        'Css': 'CSS',
-        'Html': 'HTML',
-        'Sql': 'SQL',
-        'Api': 'API',
-        'Rest': 'REST',
-        'Json': 'JSON',
-        'Xml': 'XML',
-        'Aws': 'AWS',
-        'Gcp': 'GCP'
-    }
-    
-    return special_cases.get(normalized, normalized)
+    skill = skill.strip()
+    
+    # Handle special cases, then fall back to title case
+    canonical = _SKILL_NAME_CASES.get(skill.lower())
+    return canonical if canonical else skill.title()
+
+# Upper bounds (inclusive) in years of each experience level but the last
+_EXPERIENCE_THRESHOLDS = (0, 2, 5, 10)
+_EXPERIENCE_LEVELS = ("Entry Level", "Junior", "Mid Level", "Senior", "Expert")
 
 def calculate_experience_level(years: int) -> str:
     """
@@ -241,16 +278,35 @@ def calculate_experience_level(years: int) -> str:
     """
     if years < 0:
         return "Unknown"
-    elif years == 0:
-        return "Entry Level"
-    elif years <= 2:
-        return "Junior"
-    elif years <= 5:
-        return "Mid Level"
-    elif years <= 10:
-        return "Senior"
-    else:
-        return "Expert"
+    
+    # Each level covers years up to and including its threshold
+    return _EXPERIENCE_LEVELS[bisect_left(_EXPERIENCE_THRESHOLDS, years)]
+
+def compute_content_hash(content: bytes) -> str:
+    """
+    Compute a short content hash used to cache and deduplicate uploads
+    
+    Args:
+        content: File content as bytes
+        
+    Returns:
+        Hex digest of the content
+    """
+    hasher = new_content_hasher()
+    hasher.update(content)
+    return hasher.hexdigest()
+
+def new_content_hasher():
+    """
+    Create an incremental hasher matching compute_content_hash
+    
+    Returns:
+        Hash object with update() and hexdigest(); xxh3-128 when xxhash is
+        installed, BLAKE2b-128 otherwise
+    """
+    if xxhash is not None:
+        return xxhash.xxh3_128()
+    return hashlib.blake2b(digest_size=16)
 
 def get_file_size_mb(content: bytes) -> float:
     """
@@ -310,9 +366,34 @@ def sanitize_input(text: str) -> str:
         return ""
     
     # Remove potential script tags and other dangerous content
-    sanitized = re.sub(r'<[^>]*>', '', text)
+    sanitized = _HTML_TAG_RE.sub('', text)
     
     # Remove excessive whitespace
-    sanitized = re.sub(r'\s+', ' ', sanitized)
+    sanitized = _WHITESPACE_RE.sub(' ', sanitized)
     
     return sanitized.strip()
+
+def setup_logging(level: int = logging.INFO) -> None:
+    """
+    Route log records through a queue so handler I/O runs on a background thread
+    
+    Safe to call on every script rerun; only the first call installs handlers.
+    The root level is left alone so third-party libraries stay quiet.
+    
+    Args:
+        level: Minimum level for this project's loggers
+    """
+    root = logging.getLogger()
+    if any(isinstance(handler, logging.handlers.QueueHandler) for handler in root.handlers):
+        return
+    
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    stream_handler = logging.StreamHandler()
+    stream_handler.setFormatter(logging.Formatter('%(asctime)s %(levelname)s %(name)s: %(message)s'))
+    listener = logging.handlers.QueueListener(log_queue, stream_handler)
+    listener.start()
+    atexit.register(listener.stop)
+    
+    root.addHandler(logging.handlers.QueueHandler(log_queue))
+    for name in _PROJECT_LOGGERS:
+        logging.getLogger(name).setLevel(level)